@@ -3,17 +3,21 @@ AI service for resume enhancement and cover letter generation.
 Centralizes all LLM interactions.
 """
 
+import asyncio
 import json
 import re
-from typing import List, Dict, Tuple, Optional
+from typing import AsyncIterator, Callable, Iterator, List, Dict, Tuple, Optional, Union
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.messages import HumanMessage
-from models import ResumeData, CoverLetter, CoverLetterTone, CompanyResearch, SemanticAnalysisResult
+from models import ResumeData, CoverLetter, CoverLetterTone, CompanyResearch, SemanticAnalysisResult, BulletRewrite
+from structured_output import StructuredLLM, ArrayItemStream, LLM_SLOTS
+from keywords import extract_priority_keywords
 from config import (
     GEMINI_API_KEY, GEMINI_MODEL, GEMINI_TEMPERATURE, GEMINI_TIMEOUT, GEMINI_MAX_RETRIES,
     CONTEXT_JOB_DESCRIPTION, CONTEXT_RESUME_TEXT, CONTEXT_RESUME_JSON,
     CONTEXT_COVER_LETTER_JD, CONTEXT_COVER_LETTER_RESUME,
-    MAX_REFINEMENT_ITERATIONS, REFINEMENT_TEMPERATURE
+    MAX_REFINEMENT_ITERATIONS, REFINEMENT_TEMPERATURE, RETAILOR_MIN_KEYWORD_OVERLAP,
+    QUALITY_SCORE_THRESHOLD
 )
 
 
@@ -83,6 +87,7 @@ class AIService:
             request_timeout=GEMINI_TIMEOUT,
             max_retries=GEMINI_MAX_RETRIES
         )
+        self.structured = StructuredLLM(self.llm)
 
     # ============================================================
     # COMPANY RESEARCH & PERSONALIZATION
@@ -138,11 +143,7 @@ Return ONLY valid JSON:
 JSON:"""
 
         try:
-            response = self.llm.invoke([HumanMessage(content=prompt)])
-            json_text = self._extract_json(response.content)
-            data = json.loads(json_text)
-
-            research = CompanyResearch(**data)
+            research = self.structured.invoke_model(prompt, CompanyResearch)
             print(f"  ✓ Found: {research.industry or 'unknown industry'}, {len(research.values)} values, {len(research.culture_keywords)} culture keywords")
             return research
 
@@ -202,9 +203,7 @@ Return ONLY a JSON object:
 JSON:"""
 
         try:
-            response = self.llm.invoke([HumanMessage(content=prompt)])
-            json_text = self._extract_json(response.content)
-            data = json.loads(json_text)
+            data = self.structured.invoke_json(prompt)
 
             if data.get('found') and data.get('name') and data.get('confidence') in ['high', 'medium']:
                 print(f"    ✓ Found: {data['name']} (confidence: {data['confidence']})")
@@ -388,9 +387,7 @@ Return ONLY valid JSON (no markdown, no explanation outside JSON):
 Generate 5-8 targeted questions. JSON:"""
 
         try:
-            response = self.llm.invoke([HumanMessage(content=prompt)])
-            json_text = self._extract_json(response.content)
-            data = json.loads(json_text)
+            data = self.structured.invoke_json(prompt)
 
             print(f"  ✓ Generated {len(data['questions'])} clarifying questions")
             return data['questions'], data['analysis']
@@ -436,8 +433,6 @@ Generate 5-8 targeted questions. JSON:"""
         else:
             qa_context = "No additional information provided"
 
-        original_data = json.loads(resume.json())
-
         # Extract keywords explicitly for targeted optimization
         extracted_keywords = self._extract_priority_keywords(job_description)
         keywords_str = ", ".join(extracted_keywords[:15])
@@ -486,7 +481,7 @@ TASK: Enhance resume bullet points using chain-of-thought reasoning, semantic an
 {job_description[:CONTEXT_JOB_DESCRIPTION]}
 
 === CURRENT RESUME (JSON) ===
-{json.dumps(original_data, indent=2)[:CONTEXT_RESUME_JSON]}
+{resume.to_json(indent=2)[:CONTEXT_RESUME_JSON]}
 
 === CANDIDATE'S ADDITIONAL INFO ===
 {qa_context}
@@ -539,7 +534,7 @@ TechCorp bullet: ADD leadership info
 Other roles: DO NOT add this info
 
 === CRITICAL CONSTRAINTS ===
-1. PRESERVE STRUCTURE: Exactly {len(original_data['experience'])} experiences, {len(original_data['projects'])} projects
+1. PRESERVE STRUCTURE: Exactly {len(resume.experience)} experiences, {len(resume.projects)} projects
 2. PRESERVE IDENTITY: Never change titles, companies, names, dates, schools, degrees, locations
 3. ONLY MODIFY: Bullet point text within each entry
 4. NEVER FABRICATE: Only use info from original resume or user answers
@@ -552,41 +547,41 @@ Start with {{"header":
 JSON:"""
 
         try:
-            response = self.llm.invoke([HumanMessage(content=prompt)])
-            json_text = self._extract_json(response.content)
-            data = json.loads(json_text)
-
-            # Ensure all sections exist (fallback to original if missing)
-            for key in ['header', 'education', 'experience', 'projects', 'skills']:
-                if key not in data:
-                    print(f"  ⚠ Missing {key}, using original")
-                    data[key] = original_data[key]
-
-            # CRITICAL VALIDATION: Ensure count preservation
-            if len(data['experience']) != len(original_data['experience']):
-                print(
-                    f"  ❌ ERROR: LLM changed experience count from {len(original_data['experience'])} to {len(data['experience'])}")
-                print(f"  ⚠ Reverting to original experiences")
-                data['experience'] = original_data['experience']
-
-            if len(data['projects']) != len(original_data['projects']):
-                print(
-                    f"  ❌ ERROR: LLM changed project count from {len(original_data['projects'])} to {len(data['projects'])}")
-                print(f"  ⚠ Reverting to original projects")
-                data['projects'] = original_data['projects']
-
-            # Validate that titles/companies haven't changed
-            for i, (orig, new) in enumerate(zip(original_data['experience'], data['experience'])):
-                if orig['title'] != new['title'] or orig['company'] != new['company']:
-                    print(f"  ⚠ Warning: Experience {i + 1} title/company changed, reverting")
-                    data['experience'][i] = orig
-
-            for i, (orig, new) in enumerate(zip(original_data['projects'], data['projects'])):
-                if orig['name'] != new['name']:
-                    print(f"  ⚠ Warning: Project {i + 1} name changed, reverting")
-                    data['projects'][i] = orig
-
-            tailored = ResumeData(**data)
+            def keep_structure(data: Dict) -> Dict:
+                # Ensure all sections exist (missing ones keep the original models)
+                for key in ['header', 'education', 'experience', 'projects', 'skills']:
+                    if key not in data:
+                        print(f"  ⚠ Missing {key}, using original")
+                        data[key] = getattr(resume, key)
+
+                # CRITICAL VALIDATION: Ensure count preservation
+                if len(data['experience']) != len(resume.experience):
+                    print(
+                        f"  ❌ ERROR: LLM changed experience count from {len(resume.experience)} to {len(data['experience'])}")
+                    print(f"  ⚠ Reverting to original experiences")
+                    data['experience'] = resume.experience
+
+                if len(data['projects']) != len(resume.projects):
+                    print(
+                        f"  ❌ ERROR: LLM changed project count from {len(resume.projects)} to {len(data['projects'])}")
+                    print(f"  ⚠ Reverting to original projects")
+                    data['projects'] = resume.projects
+
+                # Validate that titles/companies haven't changed
+                data['experience'] = list(data['experience'])
+                for i, (orig, new) in enumerate(zip(resume.experience, data['experience'])):
+                    if isinstance(new, dict) and (new.get('title') != orig.title or new.get('company') != orig.company):
+                        print(f"  ⚠ Warning: Experience {i + 1} title/company changed, reverting")
+                        data['experience'][i] = orig
+
+                data['projects'] = list(data['projects'])
+                for i, (orig, new) in enumerate(zip(resume.projects, data['projects'])):
+                    if isinstance(new, dict) and new.get('name') != orig.name:
+                        print(f"  ⚠ Warning: Project {i + 1} name changed, reverting")
+                        data['projects'][i] = orig
+                return data
+
+            tailored = self.structured.invoke_model(prompt, ResumeData, prepare=keep_structure)
             print("  ✓ Resume tailored successfully")
             return tailored
 
@@ -594,6 +589,171 @@ JSON:"""
             print(f"  ⚠ Tailoring failed: {e}, using original")
             return resume
 
+    # ============================================================
+    # INCREMENTAL RE-TAILORING
+    # ============================================================
+
+    def find_affected_sections(
+            self,
+            resume: ResumeData,
+            questions: List[Dict],
+            user_answers: Dict[int, str],
+            previous_answers: Dict[int, str],
+            job_description: str,
+            previous_job_description: str
+    ) -> Optional[List[Tuple[str, int]]]:
+        """
+        Work out which experience/project entries a change touches.
+
+        An entry is affected if a new or changed answer applies to it, or if
+        it mentions a priority keyword that the edited job description added.
+
+        Args:
+            resume: Original (untailored) resume
+            questions: Questions that were asked
+            user_answers: Current answers
+            previous_answers: Answers used for the previous tailoring
+            job_description: Current job description
+            previous_job_description: Job description used for the previous tailoring
+
+        Returns:
+            Sorted list of (section, index) pairs with section 'experience' or
+            'projects', or None if the change can't be localized (a 'general'
+            or unmatched answer, or a substantially different job)
+        """
+        affected = set()
+
+        for q in questions:
+            q_id = q.get('id')
+            if q_id not in user_answers or user_answers[q_id] == previous_answers.get(q_id):
+                continue
+            entries = self._match_entries(resume, q.get('applies_to', 'general'))
+            if not entries:
+                return None
+            affected.update(entries)
+
+        if job_description != previous_job_description:
+            new_keywords = self._extract_priority_keywords(job_description)[:15]
+            old_keywords = self._extract_priority_keywords(previous_job_description)[:15]
+            overlap = len(set(new_keywords) & set(old_keywords)) / max(len(new_keywords), 1)
+            if overlap < RETAILOR_MIN_KEYWORD_OVERLAP:
+                return None
+
+            added = [kw.lower() for kw in new_keywords if kw not in old_keywords]
+            for section, entries in (('experience', resume.experience), ('projects', resume.projects)):
+                for index, entry in enumerate(entries):
+                    text = " ".join([*entry.bullets, *getattr(entry, 'technologies', [])]).lower()
+                    if any(kw in text for kw in added):
+                        affected.add((section, index))
+
+        return sorted(affected)
+
+    def retailor_sections(
+            self,
+            resume: ResumeData,
+            tailored: ResumeData,
+            job_description: str,
+            user_answers: Dict[int, str],
+            questions: List[Dict],
+            targets: List[Tuple[str, int]]
+    ) -> ResumeData:
+        """
+        Re-tailor only the given entries and merge them into a previous tailoring.
+
+        Each target gets a small prompt containing just that entry, so output
+        tokens scale with the number of affected entries, not the resume.
+
+        Args:
+            resume: Original (untailored) resume
+            tailored: Previously tailored version of resume
+            job_description: Target job
+            user_answers: Dict mapping question IDs to answers
+            questions: List of questions asked
+            targets: (section, index) pairs from find_affected_sections()
+
+        Returns:
+            Tailored ResumeData with only the target entries replaced
+        """
+        print(f"\n✨ Re-tailoring {len(targets)} affected section(s)...")
+
+        keywords_str = ", ".join(self._extract_priority_keywords(job_description)[:15])
+        answers_by_entry: Dict[Tuple[str, int], List[str]] = {}
+        for q in questions:
+            if q.get('id') in user_answers:
+                for entry in self._match_entries(resume, q.get('applies_to', 'general')):
+                    answers_by_entry.setdefault(entry, []).append(
+                        f"Q: {q['question']}\nA: {user_answers[q['id']]}"
+                    )
+
+        sections = {'experience': list(tailored.experience), 'projects': list(tailored.projects)}
+
+        for section, index in targets:
+            original = getattr(resume, section)[index]
+            current = sections[section][index]
+            label = f"{original.title} at {original.company}" if section == 'experience' else original.name
+            qa_context = "\n\n".join(answers_by_entry.get((section, index), [])) or "No additional information provided"
+
+            prompt = f"""You are an expert resume writer updating ONE entry of an already-tailored resume.
+
+=== PRIORITY KEYWORDS TO INCORPORATE ===
+{keywords_str}
+
+=== JOB DESCRIPTION ===
+{job_description[:CONTEXT_JOB_DESCRIPTION]}
+
+=== ORIGINAL ENTRY: {label} ===
+{original.model_dump_json(indent=2)}
+
+=== CURRENT TAILORED BULLETS ===
+{json.dumps(current.bullets, indent=2)}
+
+=== CANDIDATE'S INFO FOR THIS ENTRY ===
+{qa_context}
+
+=== CONSTRAINTS ===
+1. Rewrite the bullets for this entry only, starting from the current tailored bullets
+2. Keep bullets that need no change exactly as they are
+3. Add metrics/keywords only where supported by the original entry or the candidate's info
+4. NEVER FABRICATE
+5. Keep roughly the same number of bullets ({len(current.bullets)})
+
+=== OUTPUT FORMAT ===
+Return ONLY valid JSON: {{"bullets": ["...", "..."]}}
+
+JSON:"""
+
+            try:
+                rewrite = self.structured.invoke_model(prompt, BulletRewrite)
+                sections[section][index] = current.model_copy(update={'bullets': rewrite.bullets})
+                print(f"  ✓ Updated {label}")
+            except Exception as e:
+                print(f"  ⚠ Re-tailoring {label} failed: {e}, keeping previous version")
+
+        return tailored.with_sections(**sections)
+
+    def _match_entries(self, resume: ResumeData, applies_to: str) -> List[Tuple[str, int]]:
+        """
+        Resolve a question's 'applies_to' text to resume entries.
+
+        Company and project names are the strongest signal; a bare job title
+        only counts when no company matched. Returns [] for 'general' or
+        unmatched targets.
+        """
+        target = (applies_to or '').lower().strip()
+        if not target or target == 'general':
+            return []
+
+        scored = []
+        for index, exp in enumerate(resume.experience):
+            score = 2 * (exp.company.lower() in target) + (exp.title.lower() in target)
+            scored.append((score, ('experience', index)))
+        for index, proj in enumerate(resume.projects):
+            score = 3 * (proj.name.lower() in target or target in proj.name.lower())
+            scored.append((score, ('projects', index)))
+
+        best = max((score for score, _ in scored), default=0)
+        return [entry for score, entry in scored if best and score == best]
+
     def generate_cover_letter(
             self,
             resume: ResumeData,
@@ -622,7 +782,114 @@ JSON:"""
             CoverLetter object
         """
         print(f"\n📝 Generating cover letter (Version {version})...")
+        prompt, tone = self._cover_letter_prompt(
+            resume, job_description, company_name, position, tone, company_research, hiring_manager
+        )
+
+        try:
+            cover_letter = self.structured.invoke_model(
+                prompt, CoverLetter, prepare=self._cover_letter_fields(tone, version)
+            )
+            word_count = len(' '.join(cover_letter.paragraphs).split())
+            print(f"  ✓ Cover letter generated ({word_count} words, {tone.style} tone)")
+            return cover_letter
 
+        except Exception as e:
+            raise ValueError(f"Cover letter generation failed: {str(e)}")
+
+    def stream_cover_letter(
+            self,
+            resume: ResumeData,
+            job_description: str,
+            company_name: str,
+            position: str,
+            tone: Optional[CoverLetterTone] = None,
+            company_research: Optional[CompanyResearch] = None,
+            hiring_manager: Optional[str] = None,
+            version: str = "A"
+    ) -> Iterator[Union[str, CoverLetter]]:
+        """
+        Generate a cover letter, yielding each paragraph as soon as it is
+        complete in the token stream.
+
+        Research, tone and hiring manager lookup happen first as in
+        generate_cover_letter(); the letter itself is streamed.
+
+        Args:
+            resume: Candidate's resume
+            job_description: Job posting
+            company_name: Target company
+            position: Job title
+            tone: Optional tone settings (auto-detected if not provided)
+            company_research: Optional pre-fetched company research
+            hiring_manager: Optional hiring manager name
+            version: Version identifier for A/B testing
+
+        Yields:
+            Each paragraph (str) in order, then the validated CoverLetter.
+            The CoverLetter is authoritative: if part of the response had to
+            be re-requested, its paragraphs may differ from those streamed.
+        """
+        print(f"\n📝 Streaming cover letter (Version {version})...")
+        prompt, tone = self._cover_letter_prompt(
+            resume, job_description, company_name, position, tone, company_research, hiring_manager
+        )
+        paragraphs = ArrayItemStream("paragraphs")
+
+        try:
+            for chunk in self.structured.stream_text(prompt, CoverLetter):
+                yield from paragraphs.feed(chunk)
+            cover_letter = self._finish_streamed_cover_letter(prompt, paragraphs, tone, version)
+        except Exception as e:
+            raise ValueError(f"Cover letter generation failed: {str(e)}")
+        yield cover_letter
+
+    async def astream_cover_letter(
+            self,
+            resume: ResumeData,
+            job_description: str,
+            company_name: str,
+            position: str,
+            tone: Optional[CoverLetterTone] = None,
+            company_research: Optional[CompanyResearch] = None,
+            hiring_manager: Optional[str] = None,
+            version: str = "A"
+    ) -> AsyncIterator[Union[str, CoverLetter]]:
+        """
+        Async version of stream_cover_letter() using LangChain astream().
+
+        The blocking research/tone calls and any section retries run in a
+        worker thread so the event loop stays free.
+        """
+        print(f"\n📝 Streaming cover letter (Version {version})...")
+        prompt, tone = await asyncio.to_thread(
+            self._cover_letter_prompt,
+            resume, job_description, company_name, position, tone, company_research, hiring_manager
+        )
+        paragraphs = ArrayItemStream("paragraphs")
+
+        try:
+            async for chunk in self.structured.astream_text(prompt, CoverLetter):
+                for paragraph in paragraphs.feed(chunk):
+                    yield paragraph
+            cover_letter = await asyncio.to_thread(
+                self._finish_streamed_cover_letter, prompt, paragraphs, tone, version
+            )
+        except Exception as e:
+            raise ValueError(f"Cover letter generation failed: {str(e)}")
+        yield cover_letter
+
+    def _cover_letter_prompt(
+            self,
+            resume: ResumeData,
+            job_description: str,
+            company_name: str,
+            position: str,
+            tone: Optional[CoverLetterTone],
+            company_research: Optional[CompanyResearch],
+            hiring_manager: Optional[str]
+    ) -> Tuple[str, CoverLetterTone]:
+        """Fill in missing research/tone/hiring manager and build the cover letter prompt."""
         # Gather company research if not provided
         if company_research is None:
             company_research = self.research_company(company_name, job_description)
@@ -723,22 +990,29 @@ Return ONLY valid JSON:
 
 JSON:"""
 
-        try:
-            response = self.llm.invoke([HumanMessage(content=prompt)])
-            json_text = self._extract_json(response.content)
-            data = json.loads(json_text)
+        return prompt, tone
 
-            # Add tone and version to the cover letter
+    def _cover_letter_fields(self, tone: CoverLetterTone, version: str) -> Callable[[Dict], Dict]:
+        """prepare hook that sets the fields the model isn't asked for."""
+        def add_tone_and_version(data: Dict) -> Dict:
             data['tone'] = tone.model_dump() if tone else None
             data['version'] = version
+            return data
+        return add_tone_and_version
 
-            cover_letter = CoverLetter(**data)
-            word_count = len(' '.join(cover_letter.paragraphs).split())
-            print(f"  ✓ Cover letter generated ({word_count} words, {tone.style} tone)")
-            return cover_letter
-
-        except Exception as e:
-            raise ValueError(f"Cover letter generation failed: {str(e)}")
+    def _finish_streamed_cover_letter(
+            self,
+            prompt: str,
+            paragraphs: ArrayItemStream,
+            tone: CoverLetterTone,
+            version: str
+    ) -> CoverLetter:
+        """Parse and validate the full streamed response."""
+        data = self.structured.parse(paragraphs.text)
+        cover_letter = self.structured.validate(prompt, CoverLetter, data, self._cover_letter_fields(tone, version))
+        word_count = len(' '.join(cover_letter.paragraphs).split())
+        print(f"  ✓ Cover letter streamed ({word_count} words, {tone.style} tone)")
+        return cover_letter
 
     def _build_tone_instructions(self, tone: CoverLetterTone) -> str:
         """Build detailed tone instructions for the prompt."""
@@ -938,15 +1212,13 @@ Return ONLY valid JSON:
 JSON:"""
 
         try:
-            response = self.llm.invoke([HumanMessage(content=prompt)])
-            json_text = self._extract_json(response.content)
-            data = json.loads(json_text)
+            def preserve_tone(data: Dict) -> Dict:
+                # Preserve tone and mark as refined
+                data['tone'] = cover_letter.tone.model_dump() if cover_letter.tone else None
+                data['version'] = cover_letter.version + "-refined"
+                return data
 
-            # Preserve tone and mark as refined
-            data['tone'] = cover_letter.tone.model_dump() if cover_letter.tone else None
-            data['version'] = cover_letter.version + "-refined"
-
-            refined = CoverLetter(**data)
+            refined = self.structured.invoke_model(prompt, CoverLetter, prepare=preserve_tone)
             word_count = len(' '.join(refined.paragraphs).split())
             print(f"  ✓ Cover letter refined ({word_count} words)")
             return refined
@@ -982,7 +1254,8 @@ Format: "- [Issue]: [Specific suggestion]"
 """
 
         try:
-            response = self.llm.invoke([HumanMessage(content=prompt)])
+            with LLM_SLOTS.slot():
+                response = self.llm.invoke([HumanMessage(content=prompt)])
             return response.content
         except Exception:
             return "- Strengthen the opening hook with a more specific achievement\n- Add more quantified results\n- Make the closing more specific to the role"
@@ -991,64 +1264,18 @@ Format: "- [Issue]: [Specific suggestion]"
         """
         Explicitly extract high-impact keywords from job description.
 
-        Uses pattern matching + LLM for comprehensive extraction.
+        Pattern-based extraction (see keywords.py), memoized per description
+        since tailoring, review and cover letters all scan the same posting.
         Returns prioritized list of keywords to emphasize in resume.
         """
-        # Quick pattern-based extraction for common high-value terms
-        import re
-
-        # Technical skills patterns
-        tech_patterns = [
-            r'\b(Python|Java|JavaScript|TypeScript|Go|Rust|C\+\+|Ruby|Scala|Kotlin)\b',
-            r'\b(React|Angular|Vue|Node\.js|Django|Flask|Spring|Rails)\b',
-            r'\b(AWS|Azure|GCP|Kubernetes|Docker|Terraform|Jenkins|CI/CD)\b',
-            r'\b(SQL|PostgreSQL|MySQL|MongoDB|Redis|Elasticsearch|Kafka)\b',
-            r'\b(Machine Learning|ML|AI|Deep Learning|NLP|Computer Vision)\b',
-            r'\b(REST|GraphQL|microservices|APIs?|distributed systems?)\b',
-            r'\b(Agile|Scrum|DevOps|SRE|TDD|BDD)\b',
-        ]
-
-        # Experience/soft skill patterns
-        soft_patterns = [
-            r'\b(lead(?:ing|ership)?|mentor(?:ing)?|manage(?:ment)?)\b',
-            r'\b(cross-functional|collaborate|stakeholder)\b',
-            r'\b(scale|scaling|performance|optimization)\b',
-            r'\b(architect(?:ure)?|design(?:ing)?|system design)\b',
-        ]
-
-        extracted = set()
-        text_lower = job_description.lower()
-
-        for pattern in tech_patterns + soft_patterns:
-            matches = re.findall(pattern, job_description, re.IGNORECASE)
-            extracted.update(m if isinstance(m, str) else m[0] for m in matches)
-
-        # Also extract explicit requirements (lines starting with - or •)
-        requirement_lines = re.findall(r'[-•]\s*(.+?)(?:\n|$)', job_description)
-        for line in requirement_lines[:10]:
-            # Extract key noun phrases
-            words = line.split()
-            if len(words) <= 5:
-                extracted.add(line.strip())
-
-        # Prioritize: more frequent = higher priority
-        keyword_freq = {}
-        for kw in extracted:
-            keyword_freq[kw] = text_lower.count(kw.lower())
-
-        # Sort by frequency, then alphabetically
-        sorted_keywords = sorted(
-            extracted,
-            key=lambda x: (-keyword_freq.get(x, 0), x.lower())
-        )
-
-        return sorted_keywords[:20]
+        return extract_priority_keywords(job_description)
 
     def review_and_refine(
         self,
         tailored_resume: ResumeData,
         job_description: str,
-        iteration: int = 1
+        iteration: int = 1,
+        review: Optional[Dict] = None
     ) -> Tuple[ResumeData, Dict]:
         """
         Review tailored resume and refine if needed (iterative improvement).
@@ -1057,6 +1284,8 @@ Format: "- [Issue]: [Specific suggestion]"
             tailored_resume: Previously tailored resume
             job_description: Target job
             iteration: Current iteration number (1-based)
+            review: Optional precomputed review (e.g. from ResumeQualityScorer);
+                    skips the LLM review call
 
         Returns:
             Tuple of (refined_resume, review_feedback)
@@ -1067,7 +1296,6 @@ Format: "- [Issue]: [Specific suggestion]"
         print(f"\n🔄 Refinement iteration {iteration}/{MAX_REFINEMENT_ITERATIONS}...")
 
         resume_text = tailored_resume.to_text()
-        original_data = json.loads(tailored_resume.json())
         extracted_keywords = self._extract_priority_keywords(job_description)
 
         prompt = f"""You are a resume quality reviewer. Analyze this tailored resume and suggest refinements.
@@ -1105,15 +1333,14 @@ Return JSON:
 JSON:"""
 
         try:
-            response = self.llm.invoke([HumanMessage(content=prompt)])
-            json_text = self._extract_json(response.content)
-            review = json.loads(json_text)
+            if review is None:
+                review = self.structured.invoke_json(prompt)
 
             print(f"  📊 Quality score: {review.get('score', 'N/A')}/100")
             print(f"  📊 Keyword coverage: {review.get('keyword_coverage', 0):.0%}")
 
             # If score is good enough, no refinement needed
-            if review.get('score', 0) >= 90 or not review.get('needs_refinement', False):
+            if review.get('score', 0) >= QUALITY_SCORE_THRESHOLD or not review.get('needs_refinement', False):
                 print("  ✓ Resume quality is good, no refinement needed")
                 return tailored_resume, review
 
@@ -1143,7 +1370,6 @@ JSON:"""
     ) -> ResumeData:
         """Apply specific refinements based on review feedback."""
 
-        original_data = json.loads(resume.json())
         missing_keywords = review_feedback.get('missing_keywords', [])[:5]
         weak_bullets = review_feedback.get('weak_bullets', [])[:5]
 
@@ -1158,7 +1384,7 @@ Weak Bullets to Fix:
 {json.dumps(weak_bullets, indent=2)}
 
 === CURRENT RESUME (JSON) ===
-{json.dumps(original_data, indent=2)[:CONTEXT_RESUME_JSON]}
+{resume.to_json(indent=2)[:CONTEXT_RESUME_JSON]}
 
 === CONSTRAINTS ===
 - ONLY modify the specific weak bullets identified
@@ -1171,43 +1397,25 @@ Return the complete refined JSON. Start with {{"header":
 JSON:"""
 
         try:
-            # Use slightly higher temperature for creative refinements
-            response = self.llm.invoke([HumanMessage(content=prompt)])
-            json_text = self._extract_json(response.content)
-            data = json.loads(json_text)
+            def keep_structure(data: Dict) -> Dict:
+                # Validation (same as tailor_resume); missing sections keep the original models
+                for key in ['header', 'education', 'experience', 'projects', 'skills']:
+                    if key not in data:
+                        data[key] = getattr(resume, key)
 
-            # Validation (same as tailor_resume)
-            for key in ['header', 'education', 'experience', 'projects', 'skills']:
-                if key not in data:
-                    data[key] = original_data[key]
+                if len(data['experience']) != len(resume.experience):
+                    data['experience'] = resume.experience
 
-            if len(data['experience']) != len(original_data['experience']):
-                data['experience'] = original_data['experience']
+                if len(data['projects']) != len(resume.projects):
+                    data['projects'] = resume.projects
+                return data
 
-            if len(data['projects']) != len(original_data['projects']):
-                data['projects'] = original_data['projects']
-
-            return ResumeData(**data)
+            return self.structured.invoke_model(prompt, ResumeData, prepare=keep_structure)
 
         except Exception as e:
             print(f"  ⚠ Refinement application failed: {e}")
             return resume
 
-    def _extract_json(self, text: str) -> str:
-        """Extract JSON from potentially markdown-wrapped response"""
-        text = text.strip()
-
-        if "```json" in text:
-            start = text.find("```json") + 7
-            end = text.find("```", start)
-            return text[start:end].strip()
-        elif "```" in text:
-            start = text.find("```") + 3
-            end = text.find("```", start)
-            return text[start:end].strip()
-
-        return text
-
     # ============================================================
     # RICH SEMANTIC ANALYSIS USAGE
     # ============================================================
@@ -1367,9 +1575,7 @@ Return JSON:
 JSON:"""
 
         try:
-            response = self.llm.invoke([HumanMessage(content=prompt)])
-            json_text = self._extract_json(response.content)
-            suggestions = json.loads(json_text)
+            suggestions = self.structured.invoke_json(prompt)
 
             print(f"  ✓ Generated {len(suggestions.get('skills_to_add', []))} skill additions")
             print(f"  ✓ Generated {len(suggestions.get('bullet_rewrites', []))} bullet rewrites")
@@ -1421,18 +1627,18 @@ JSON:"""
             print("  ✓ Current order is already optimal")
             return resume
 
-        # Create reordered resume
-        reordered_data = json.loads(resume.model_dump_json())
+        # Create reordered resume (entries are already validated, so just re-point the lists)
+        updates = {}
 
         if exp_needs_reorder:
-            reordered_data['experience'] = [exp.model_dump() for _, _, exp in experience_scores]
+            updates['experience'] = [exp for _, _, exp in experience_scores]
             print(f"  ✓ Reordered experiences (most relevant: {experience_scores[0][2].title})")
 
         if proj_needs_reorder:
-            reordered_data['projects'] = [proj.model_dump() for _, _, proj in project_scores]
+            updates['projects'] = [proj for _, _, proj in project_scores]
             print(f"  ✓ Reordered projects (most relevant: {project_scores[0][2].name})")
 
-        return ResumeData(**reordered_data)
+        return resume.model_copy(update=updates)
 
     def _calculate_relevance_score(self, text: str, semantic_analysis: SemanticAnalysisResult) -> float:
         """Calculate relevance score for a text block based on semantic matches."""
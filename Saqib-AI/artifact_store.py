@@ -0,0 +1,144 @@
+"""
+On-disk store of rendered PDFs.
+
+Rendering is deterministic: the same resume content with the same template
+(and page target) gives the same PDF. Rendered files are kept under a key
+made from the resume's content hash and the render settings, so a repeat
+render (the same tailored resume downloaded again, or regenerated by a
+later job) is a file copy instead of a ReportLab build, and for fitted
+resumes no fit-engine passes either.
+
+Safe to share between threads and processes: files are written to a temp
+name and renamed into place.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+from typing import Any, Dict, Optional
+
+from config import ARTIFACT_STORE_MAX_MB
+
+
+class ArtifactStore:
+    """
+    Rendered files keyed by what was rendered.
+
+    Example usage:
+        store = ArtifactStore("/var/cache/career-ai")
+        key = store.key("resume", resume.content_hash(), "jake")
+        if store.fetch(key, "out.pdf") is None:
+            PDFGenerator.generate_resume_pdf(resume, "out.pdf", template="jake")
+            store.put(key, "out.pdf")
+    """
+
+    def __init__(self, directory: str, max_mb: float = ARTIFACT_STORE_MAX_MB):
+        """
+        Args:
+            directory: Where artifacts are kept (created if missing)
+            max_mb: Size budget; the least recently used artifacts are deleted past it
+        """
+        self.directory = directory
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        os.makedirs(directory, exist_ok=True)
+        self._lock = threading.Lock()
+        self.stats = {'hits': 0, 'misses': 0, 'stored': 0, 'evicted': 0}
+
+    @staticmethod
+    def key(kind: str, *parts: Any) -> str:
+        """
+        Key for an artifact: its kind plus everything that determines the output.
+
+        Args:
+            kind: Artifact kind, e.g. 'resume' or 'cover_letter'
+            parts: Content hash and render settings (template, page target, ...)
+
+        Returns:
+            Hex digest
+        """
+        return hashlib.sha256(json.dumps([kind, *parts], default=str).encode('utf-8')).hexdigest()
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.pdf")
+
+    def fetch(self, key: str, output_path) -> Optional[Dict[str, Any]]:
+        """
+        Copy a stored artifact to output_path.
+
+        Args:
+            key: Artifact key
+            output_path: Destination path or writable file object
+
+        Returns:
+            The metadata stored with it ({} if none), or None if not stored
+        """
+        path = self.path(key)
+        try:
+            if hasattr(output_path, 'write'):
+                with open(path, 'rb') as f:
+                    shutil.copyfileobj(f, output_path)
+            else:
+                shutil.copyfile(path, output_path)
+            os.utime(path)  # mark as recently used
+        except FileNotFoundError:
+            with self._lock:
+                self.stats['misses'] += 1
+            return None
+
+        with self._lock:
+            self.stats['hits'] += 1
+        try:
+            with open(path + '.json', encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def put(self, key: str, source_path: str, metadata: Optional[Dict[str, Any]] = None):
+        """
+        Store a rendered file (and optional JSON metadata) under key.
+
+        Args:
+            key: Artifact key
+            source_path: Rendered file to copy in
+            metadata: JSON-serializable details to return from fetch()
+        """
+        if metadata is not None:
+            self._write(self.path(key) + '.json', json.dumps(metadata).encode('utf-8'))
+        with open(source_path, 'rb') as f:
+            self._write(self.path(key), f.read())
+        with self._lock:
+            self.stats['stored'] += 1
+        self._evict()
+
+    def _write(self, path: str, data: bytes):
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+    def _evict(self):
+        """Delete least recently used artifacts until the store fits its budget."""
+        entries = []
+        total = 0
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith('.pdf'):
+                stat = entry.stat()
+                entries.append((stat.st_mtime, entry.path, stat.st_size))
+                total += stat.st_size
+        if total <= self.max_bytes:
+            return
+
+        for _, path, size in sorted(entries):
+            for stale in (path, path + '.json'):
+                try:
+                    os.remove(stale)
+                except FileNotFoundError:
+                    pass
+            total -= size
+            with self._lock:
+                self.stats['evicted'] += 1
+            if total <= self.max_bytes:
+                break
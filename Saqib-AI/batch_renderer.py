@@ -0,0 +1,173 @@
+"""
+Parallel PDF rendering.
+
+ReportLab builds are CPU-bound and single-threaded, so large batches
+(one resume and cover letter per job) are sharded across a process pool.
+Only compact model JSON crosses the process boundary; each worker compiles
+the template render contexts once and keeps them for the lifetime of the pool.
+"""
+
+import io
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence, Tuple, Union
+
+from models import ResumeData, CoverLetter, Header
+from pdf_generators import PDFGenerator, RenderContext, compile_templates, get_template
+from config import DEFAULT_RESUME_TEMPLATE, PDF_RENDER_WORKERS
+
+
+def _init_worker():
+    """Compile every template's render context once when a worker process starts."""
+    compile_templates()
+
+
+def _render(task: Tuple) -> Optional[Union[bytes, str]]:
+    """
+    Render one document inside a worker.
+
+    Returns the PDF bytes (or output path if one was given), or None on failure.
+    """
+    kind, template, payload, header_json, output_path = task
+    context = RenderContext.get(template)
+    target = output_path or io.BytesIO()
+
+    try:
+        if kind == "resume":
+            resume = ResumeData.model_validate_json(payload)
+            PDFGenerator._render_resume(resume, target, context)
+        else:
+            cover_letter = CoverLetter.model_validate_json(payload)
+            header = Header.model_validate_json(header_json)
+            PDFGenerator._render_cover_letter(cover_letter, header, target, context)
+    except Exception as e:
+        print(f"  ✗ {kind.replace('_', ' ').capitalize()} PDF generation failed: {e}")
+        return None
+
+    return output_path if output_path else target.getvalue()
+
+
+class BatchPDFRenderer:
+    """
+    Renders batches of resumes and cover letters across worker processes.
+
+    The pool is started on first use and reused across batches until
+    close() is called (or the renderer is used as a context manager).
+
+    Example usage:
+        with BatchPDFRenderer(workers=4) as renderer:
+            pdfs = renderer.render_resumes(tailored_resumes)
+            paths = renderer.render_cover_letters(letters, headers, output_paths)
+    """
+
+    def __init__(self, workers: Optional[int] = PDF_RENDER_WORKERS, template: str = DEFAULT_RESUME_TEMPLATE):
+        """
+        Args:
+            workers: Number of worker processes (default: one per CPU)
+            template: Default resume template for batches that don't name one
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.template = template
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        """Shut down the worker pool."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def render_resumes(
+        self,
+        resumes: Sequence[ResumeData],
+        output_paths: Optional[Sequence[str]] = None,
+        template: Optional[str] = None
+    ) -> List[Optional[Union[bytes, str]]]:
+        """
+        Render resumes in parallel.
+
+        Args:
+            resumes: Resumes to render
+            output_paths: Optional output path per resume; if omitted the
+                          PDF bytes are returned instead
+            template: Resume template name (default: the renderer's template)
+
+        Returns:
+            PDF bytes or output path per resume (None if it failed), in input order
+        """
+        template = get_template(template or self.template).name
+        paths = self._paths(output_paths, len(resumes))
+        tasks = [
+            ("resume", template, resume.to_json(), None, path)
+            for resume, path in zip(resumes, paths)
+        ]
+        return self._run(tasks)
+
+    def render_cover_letters(
+        self,
+        cover_letters: Sequence[CoverLetter],
+        headers: Sequence[Header],
+        output_paths: Optional[Sequence[str]] = None
+    ) -> List[Optional[Union[bytes, str]]]:
+        """
+        Render cover letters in parallel.
+
+        Args:
+            cover_letters: Cover letters to render
+            headers: Contact information per cover letter
+            output_paths: Optional output path per cover letter; if omitted
+                          the PDF bytes are returned instead
+
+        Returns:
+            PDF bytes or output path per cover letter (None if it failed), in input order
+        """
+        if len(headers) != len(cover_letters):
+            raise ValueError("Need one header per cover letter")
+
+        paths = self._paths(output_paths, len(cover_letters))
+        tasks = [
+            ("cover_letter", self.template, cover_letter.model_dump_json(), header.model_dump_json(), path)
+            for cover_letter, header, path in zip(cover_letters, headers, paths)
+        ]
+        return self._run(tasks)
+
+    # ============================================================
+    # PRIVATE HELPER METHODS
+    # ============================================================
+
+    @staticmethod
+    def _paths(output_paths: Optional[Sequence[str]], count: int) -> List[Optional[str]]:
+        """Normalize optional output paths to one entry per document."""
+        if output_paths is None:
+            return [None] * count
+        if len(output_paths) != count:
+            raise ValueError("Need one output path per document")
+        return [str(p) for p in output_paths]
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Start the worker pool on first use."""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker
+            )
+        return self._pool
+
+    def _run(self, tasks: List[Tuple]) -> List[Optional[Union[bytes, str]]]:
+        """Shard tasks across workers, preserving input order."""
+        if not tasks:
+            return []
+
+        # Not worth the IPC round-trip for a single document or worker
+        if self.workers == 1 or len(tasks) == 1:
+            return [_render(task) for task in tasks]
+
+        # A few chunks per worker balances load without per-document IPC
+        chunksize = max(1, math.ceil(len(tasks) / (self.workers * 4)))
+        return list(self._get_pool().map(_render, tasks, chunksize=chunksize))
@@ -0,0 +1,378 @@
+"""
+Performance benchmarks for the resume tailoring system.
+
+Run from this directory, e.g.:
+  python benchmarks.py pdf --renders 200
+  python benchmarks.py parallel --documents 30
+  python benchmarks.py fit
+  python benchmarks.py templates
+  python benchmarks.py serialize --calls 2000
+  python benchmarks.py models --iterations 2000
+  python benchmarks.py keywords --calls 2000
+
+Each benchmark uses synthetic data and needs no API key.
+"""
+
+import argparse
+import io
+import time
+from typing import Callable
+
+from models import ResumeData, CoverLetter, Header, Education, Experience, Project, Skills
+
+
+def sample_resume() -> ResumeData:
+    """Build a typical one-page resume used by all benchmarks."""
+    return ResumeData(
+        header=Header(
+            name="Jordan Lee",
+            email="jordan.lee@example.com",
+            phone="+1-555-123-4567",
+            linkedin="https://linkedin.com/in/jordanlee",
+            github="https://github.com/jordanlee",
+            location="Calgary, AB"
+        ),
+        education=[
+            Education(
+                degree="B.Sc. Software Engineering",
+                school="University of Calgary",
+                graduation_date="May 2025",
+                location="Calgary, AB",
+                gpa=3.7
+            )
+        ],
+        experience=[
+            Experience(
+                title=f"Software Engineer Intern {i}",
+                company=f"Company {i}",
+                start_date="May 2023",
+                end_date="Aug 2023",
+                location="Calgary, AB",
+                bullets=[
+                    "Built REST APIs in Python and Flask serving 10k daily requests",
+                    "Reduced CI pipeline time by 40% by parallelizing Docker builds",
+                    "Collaborated with 4 engineers to ship a React dashboard for ops teams",
+                ]
+            )
+            for i in range(3)
+        ],
+        projects=[
+            Project(
+                name=f"Project {i}",
+                technologies=["Python", "PostgreSQL", "AWS"],
+                bullets=[
+                    "Designed a data pipeline ingesting 1M rows per day",
+                    "Deployed on AWS Lambda with Terraform-managed infrastructure",
+                ],
+                dates="2024"
+            )
+            for i in range(2)
+        ],
+        skills=Skills(
+            languages=["Python", "Java", "TypeScript", "SQL"],
+            frameworks=["React", "Flask", "Django"],
+            tools=["Git", "Docker", "AWS", "Kubernetes"],
+            other=["NumPy", "Pandas"]
+        )
+    )
+
+
+def sample_cover_letter() -> CoverLetter:
+    """Build a typical four-paragraph cover letter."""
+    return CoverLetter(
+        paragraphs=[
+            "When I saw the Software Engineer opening at Acme, I knew it matched my work on data tooling. " * 2,
+            "At Company 0 I built REST APIs in Python serving 10k daily requests and cut CI time by 40%. " * 2,
+            "My projects include a data pipeline ingesting 1M rows per day deployed on AWS Lambda. " * 2,
+            "I'd love to discuss how I can help Acme's platform team ship faster. Thank you for your time.",
+        ],
+        company_name="Acme",
+        position="Software Engineer"
+    )
+
+
+def _rate(label: str, count: int, fn: Callable[[], None]) -> float:
+    """Run fn, print and return throughput in operations per second."""
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    rate = count / elapsed if elapsed > 0 else float("inf")
+    print(f"  {label:<40} {rate:>10.1f} /s  ({elapsed:.3f}s for {count})")
+    return rate
+
+
+# ============================================================
+# PDF RENDERING
+# ============================================================
+
+def bench_pdf(args):
+    """Resume + cover letter renders/second with fresh vs shared render context."""
+    from pdf_generators import PDFGenerator, RenderContext
+
+    resume = sample_resume()
+    cover_letter = sample_cover_letter()
+    n = args.renders
+
+    print(f"\nPDF rendering ({n} resumes + {n} cover letters, in memory)")
+
+    def fresh_context():
+        # Previous behaviour: styles and table style rebuilt for every document
+        for _ in range(n):
+            PDFGenerator._render_resume(resume, io.BytesIO(), RenderContext())
+            PDFGenerator._render_cover_letter(cover_letter, resume.header, io.BytesIO(), RenderContext())
+
+    def shared_context():
+        context = RenderContext.get()
+        for _ in range(n):
+            PDFGenerator._render_resume(resume, io.BytesIO(), context)
+            PDFGenerator._render_cover_letter(cover_letter, resume.header, io.BytesIO(), context)
+
+    # Warm up ReportLab's module-level caches so neither run pays first-use cost
+    PDFGenerator._render_resume(resume, io.BytesIO(), RenderContext.get())
+
+    before = _rate("before: context per render", 2 * n, fresh_context)
+    after = _rate("after: shared render context", 2 * n, shared_context)
+    print(f"  speedup: {after / before:.2f}x")
+
+
+def bench_parallel(args):
+    """Batch throughput: sequential PDFGenerator vs BatchPDFRenderer process pool."""
+    from pdf_generators import PDFGenerator, RenderContext
+    from batch_renderer import BatchPDFRenderer
+
+    n = args.documents
+    resumes = [sample_resume() for _ in range(n)]
+    letters = [sample_cover_letter() for _ in range(n)]
+    headers = [r.header for r in resumes]
+
+    print(f"\nBatch rendering ({n} resumes + {n} cover letters, {args.workers or 'auto'} workers)")
+
+    def sequential():
+        context = RenderContext.get()
+        for resume, letter in zip(resumes, letters):
+            PDFGenerator._render_resume(resume, io.BytesIO(), context)
+            PDFGenerator._render_cover_letter(letter, resume.header, io.BytesIO(), context)
+
+    with BatchPDFRenderer(workers=args.workers) as renderer:
+        def parallel():
+            renderer.render_resumes(resumes)
+            renderer.render_cover_letters(letters, headers)
+
+        # First batch pays process start-up; later batches reuse warm workers
+        sequential_rate = _rate("sequential", 2 * n, sequential)
+        _rate("process pool (cold start)", 2 * n, parallel)
+        parallel_rate = _rate("process pool (warm workers)", 2 * n, parallel)
+
+    print(f"  speedup (warm): {parallel_rate / sequential_rate:.2f}x")
+
+
+def bench_fit(args):
+    """Cost of a fit-engine measure pass vs a full render, and a full fit."""
+    from pdf_generators import PDFGenerator, RenderContext
+    from fit_engine import ResumeFitEngine
+
+    resume = sample_resume()
+    for exp in resume.experience:
+        exp.bullets += [
+            f"Led migration {k} of legacy services to Kubernetes on AWS, cutting p95 latency by 35% "
+            "and infrastructure cost by $40k per year across three product teams"
+            for k in range(args.extra_bullets)
+        ]
+    context = RenderContext.get()
+    n = args.iterations
+
+    print(f"\nFit engine ({args.extra_bullets} extra bullets per job, {n} iterations)")
+    full = _rate("full render", n, lambda: [
+        PDFGenerator._render_resume(resume, io.BytesIO(), context) for _ in range(n)
+    ])
+    measure = _rate("measure pass (wrap only)", n, lambda: [
+        ResumeFitEngine.measure(resume, context) for _ in range(n)
+    ])
+    print(f"  measure pass is {measure / full:.1f}x cheaper than a render")
+
+    _, _, report = ResumeFitEngine(target_pages=1).fit(resume)
+    print(f"  fit: {report['pages']} page(s) after {report['measure_passes']} measure passes")
+    for adjustment in report['adjustments'][:5]:
+        print(f"    - {adjustment}")
+
+
+def bench_templates(args):
+    """Startup compile cost and renders/second for every registered template."""
+    from pdf_generators import PDFGenerator, RenderContext, TEMPLATES, compile_templates
+
+    resume = sample_resume()
+    n = args.renders
+
+    print(f"\nTemplates ({len(TEMPLATES)} registered, {n} renders each)")
+    start = time.perf_counter()
+    compile_templates()
+    print(f"  compile all templates: {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    for name in TEMPLATES:
+        context = RenderContext.get(name)
+        PDFGenerator._render_resume(resume, io.BytesIO(), context)  # warm up
+        _rate(f"{name}: {TEMPLATES[name].description[:28]}", n, lambda: [
+            PDFGenerator._render_resume(resume, io.BytesIO(), context) for _ in range(n)
+        ])
+
+
+# ============================================================
+# MODEL SERIALIZATION
+# ============================================================
+
+def bench_serialize(args):
+    """to_text / JSON / content hash calls per second on mutable vs frozen resumes."""
+    mutable = sample_resume()
+    frozen = sample_resume().freeze()
+    n = args.calls
+
+    print(f"\nResume serialization ({n} calls each)")
+    for label, fn in [
+        ("to_text", lambda r: r.to_text()),
+        ("to_json", lambda r: r.to_json()),
+        ("content_hash", lambda r: r.content_hash()),
+    ]:
+        before = _rate(f"{label}: mutable (rebuilt)", n, lambda: [fn(mutable) for _ in range(n)])
+        after = _rate(f"{label}: frozen (memoized)", n, lambda: [fn(frozen) for _ in range(n)])
+        print(f"  speedup: {after / before:.1f}x")
+
+
+def bench_models(args):
+    """Pydantic v2 serialization/validation throughput and edit paths for a typical resume."""
+    import json
+    from models import parse_llm_json
+
+    resume = sample_resume()
+    payload = resume.model_dump_json()
+    payload_bytes = payload.encode("utf-8")
+    new_bullets = ["Rewrote the billing service in Go, cutting p99 latency by 60%"]
+    n = args.iterations
+
+    print(f"\nResume models ({n} iterations, {len(payload_bytes)} byte JSON)")
+    ResumeData(**json.loads(payload))  # warm up validator and serializer
+    _rate("model_dump_json", n, lambda: [resume.model_dump_json() for _ in range(n)])
+
+    before = _rate("parse: json.loads + ResumeData(**data)", n, lambda: [
+        ResumeData(**json.loads(payload)) for _ in range(n)
+    ])
+    after = _rate("parse: model_validate_json(bytes)", n, lambda: [
+        ResumeData.model_validate_json(payload_bytes) for _ in range(n)
+    ])
+    print(f"  speedup: {after / before:.1f}x")
+
+    _rate("LLM dict: json.loads", n, lambda: [json.loads(payload) for _ in range(n)])
+    _rate("LLM dict: parse_llm_json (TypeAdapter)", n, lambda: [parse_llm_json(payload_bytes) for _ in range(n)])
+
+    def edit_round_trip():
+        # Previous edit path: dump to JSON, load, patch, re-validate everything
+        for _ in range(n):
+            data = json.loads(resume.model_dump_json())
+            data['experience'][0]['bullets'] = new_bullets
+            ResumeData(**data)
+
+    def edit_with_sections():
+        for _ in range(n):
+            resume.with_sections(experience=[
+                resume.experience[0].model_copy(update={'bullets': new_bullets}),
+                *resume.experience[1:]
+            ])
+
+    before = _rate("edit: dump + loads + ResumeData(**)", n, edit_round_trip)
+    after = _rate("edit: with_sections / model_copy", n, edit_with_sections)
+    print(f"  speedup: {after / before:.1f}x")
+
+
+# ============================================================
+# KEYWORD EXTRACTION
+# ============================================================
+
+SAMPLE_JOB = """Senior Software Engineer - Platform
+We are looking for an engineer with strong Python and Go experience to lead the design of distributed systems.
+Requirements:
+- 5+ years Python
+- Kubernetes and Docker
+- AWS or GCP
+- Experience with REST APIs and GraphQL
+- Strong communication
+You will collaborate with cross-functional stakeholders, mentor junior engineers, and drive performance
+optimization and scaling of our microservices architecture. Experience with Kafka, PostgreSQL, Redis and
+CI/CD (Jenkins, Terraform) is a plus. Machine Learning or NLP exposure helpful. Agile/Scrum team.
+"""
+
+
+def bench_keywords(args):
+    """Priority keyword extraction: per-pattern findall vs single scan vs memoized."""
+    import re
+    from keywords import TECH_PATTERNS, SOFT_PATTERNS, extract_priority_keywords, _cached_keywords
+
+    def findall_per_pattern(text):
+        # Previous implementation: every pattern re-scans the whole description
+        extracted = set()
+        for pattern in TECH_PATTERNS + SOFT_PATTERNS:
+            extracted.update(re.findall(pattern, text, re.IGNORECASE))
+        for line in re.findall(r'[-•]\s*(.+?)(?:\n|$)', text)[:10]:
+            if len(line.split()) <= 5:
+                extracted.add(line.strip())
+        text_lower = text.lower()
+        freq = {kw: text_lower.count(kw.lower()) for kw in extracted}
+        return sorted(extracted, key=lambda x: (-freq[x], x.lower()))[:20]
+
+    def uncached():
+        for _ in range(n):
+            _cached_keywords.cache_clear()
+            extract_priority_keywords(job)
+
+    job = SAMPLE_JOB * args.repeat
+    n = args.calls
+
+    print(f"\nKeyword extraction ({n} calls, {len(job)} character job description)")
+    before = _rate("findall per pattern", n, lambda: [findall_per_pattern(job) for _ in range(n)])
+    after = _rate("single scan (cache cleared)", n, uncached)
+    print(f"  speedup: {after / before:.1f}x")
+    cached = _rate("single scan (memoized)", n, lambda: [extract_priority_keywords(job) for _ in range(n)])
+    print(f"  speedup: {cached / before:.1f}x")
+
+
+def main():
+    """Benchmark entry point"""
+    parser = argparse.ArgumentParser(description="Resume tailoring performance benchmarks")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    pdf = subparsers.add_parser("pdf", help="PDF renders/second before and after context reuse")
+    pdf.add_argument("--renders", type=int, default=100, help="Documents of each kind to render")
+    pdf.set_defaults(func=bench_pdf)
+
+    parallel = subparsers.add_parser("parallel", help="Batch renders/second across a process pool")
+    parallel.add_argument("--documents", type=int, default=30, help="Resumes and cover letters per batch")
+    parallel.add_argument("--workers", type=int, default=None, help="Worker processes (default: one per CPU)")
+    parallel.set_defaults(func=bench_parallel)
+
+    fit = subparsers.add_parser("fit", help="Fit-engine measure pass vs full render")
+    fit.add_argument("--iterations", type=int, default=50, help="Passes of each kind to time")
+    fit.add_argument("--extra-bullets", type=int, default=4, help="Bullets added per job to force overflow")
+    fit.set_defaults(func=bench_fit)
+
+    templates = subparsers.add_parser("templates", help="Compile cost and renders/second per template")
+    templates.add_argument("--renders", type=int, default=50, help="Resumes to render per template")
+    templates.set_defaults(func=bench_templates)
+
+    serialize = subparsers.add_parser("serialize", help="Memoized vs rebuilt resume serialization")
+    serialize.add_argument("--calls", type=int, default=2000, help="Calls of each kind to time")
+    serialize.set_defaults(func=bench_serialize)
+
+    models = subparsers.add_parser("models", help="Resume JSON validation/serialization and edit paths")
+    models.add_argument("--iterations", type=int, default=2000, help="Operations of each kind to time")
+    models.set_defaults(func=bench_models)
+
+    keywords = subparsers.add_parser("keywords", help="Priority keyword extraction per job description")
+    keywords.add_argument("--calls", type=int, default=2000, help="Extractions of each kind to time")
+    keywords.add_argument("--repeat", type=int, default=3, help="Copies of the sample posting per description")
+    keywords.set_defaults(func=bench_keywords)
+
+    args = parser.parse_args()
+    args.func(args)
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -8,6 +8,8 @@ Backend developers should use service.py directly.
 import argparse
 from typing import Dict
 from service import ResumeTailoringService
+from pdf_generators import TEMPLATES
+from config import DEFAULT_RESUME_TEMPLATE
 
 
 def ask_questions_cli(questions: list) -> Dict[int, str]:
@@ -45,17 +47,20 @@ def ask_questions_cli(questions: list) -> Dict[int, str]:
     return answers
 
 
-def prompt_for_missing_contact_info(resume) -> None:
+def prompt_for_missing_contact_info(resume):
     """
     Check for missing contact info and prompt user to provide it.
 
     Args:
-        resume: ResumeData object to update in-place
+        resume: ResumeData object (frozen after parsing, so never edited in place)
+
+    Returns:
+        ResumeData with the provided contact details filled in
     """
     missing = resume.header.get_missing_contact_info()
 
     if not missing:
-        return
+        return resume
 
     print("\n" + "=" * 70)
     print("MISSING CONTACT INFORMATION")
@@ -69,12 +74,13 @@ def prompt_for_missing_contact_info(resume) -> None:
         "linkedin": "LinkedIn profile URL (e.g., linkedin.com/in/yourname)"
     }
 
+    updates = {}
     for field in missing:
         prompt = field_prompts.get(field, field.capitalize())
         while True:
             value = input(f"  {prompt}: ").strip()
             if value:
-                setattr(resume.header, field, value)
+                updates[field] = value
                 print(f"    ✓ {field.capitalize()} added\n")
                 break
             else:
@@ -85,6 +91,10 @@ def prompt_for_missing_contact_info(resume) -> None:
 
     print("=" * 70 + "\n")
 
+    if not updates:
+        return resume
+    return resume.model_copy(update={'header': resume.header.model_copy(update=updates)}).freeze()
+
 
 def main():
     """CLI entry point"""
@@ -123,6 +133,12 @@ Examples:
         default="tailored_resume.pdf",
         help="Output resume PDF path (default: tailored_resume.pdf)"
     )
+    parser.add_argument(
+        "--template",
+        choices=sorted(TEMPLATES),
+        default=DEFAULT_RESUME_TEMPLATE,
+        help=f"Resume PDF template (default: {DEFAULT_RESUME_TEMPLATE})"
+    )
 
     # Cover letter options
     parser.add_argument(
@@ -177,7 +193,7 @@ Examples:
         resume = service.parse_resume(args.resume)
 
         # Check for missing contact info and prompt user
-        prompt_for_missing_contact_info(resume)
+        resume = prompt_for_missing_contact_info(resume)
 
         # Semantic analysis
         semantic_analysis = None
@@ -222,7 +238,7 @@ Examples:
         )
 
         # Generate resume PDF
-        success = service.generate_resume_pdf(tailored_resume, args.output)
+        success = service.generate_resume_pdf(tailored_resume, args.output, args.template)
 
         if not success:
             print("❌ Failed to generate resume PDF")
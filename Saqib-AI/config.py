@@ -19,6 +19,8 @@ GEMINI_MAX_RETRIES = 3
 SEMANTIC_MODEL = "all-MiniLM-L6-v2"
 SEMANTIC_SIMILARITY_THRESHOLD = 0.5
 SEMANTIC_WEAK_MATCH_THRESHOLD = 0.75
+ANALYSIS_CACHE_SIZE = 64  # Semantic analyses kept per (resume hash, job description)
+PARSE_CACHE_SIZE = 32  # Parsed resumes kept per extracted PDF text hash
 
 # Context Window Limits (increased for better analysis)
 # Gemini 2.5 Flash supports 1M tokens - we can be generous
@@ -28,14 +30,31 @@ CONTEXT_RESUME_JSON = 15000  # Full structured data
 CONTEXT_COVER_LETTER_JD = 4000  # Cover letter job context
 CONTEXT_COVER_LETTER_RESUME = 6000  # Cover letter resume context
 
+# Structured LLM Output
+LLM_STRUCTURED_OUTPUT = True  # Constrain JSON responses to the Pydantic schema
+LLM_SECTION_RETRIES = 1  # Re-asks per invalid response section before giving up
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "4"))  # Model requests in flight per process (all services share it)
+
+# Keyword Extraction
+KEYWORD_CACHE_SIZE = 128  # Job descriptions whose priority keywords are memoized
+
+# Incremental Re-tailoring
+TAILORING_CACHE_SIZE = 16  # Previous tailorings kept per original resume hash
+RETAILOR_MIN_KEYWORD_OVERLAP = 0.5  # Below this the job changed too much; re-tailor everything
+
 # Iterative Refinement
 MAX_REFINEMENT_ITERATIONS = 3
 REFINEMENT_TEMPERATURE = 0.4  # Slightly higher for creativity in refinements
+QUALITY_SCORE_THRESHOLD = 90  # Scores at or above this skip refinement
+LOCAL_QUALITY_SCORING = True  # Score locally instead of an LLM review call
+MIN_REFINEMENT_GAIN = 2.0  # Stop refining when an iteration gains fewer points
 
 # PDF Generation Configuration
-DEFAULT_RESUME_TEMPLATE = "jake"  # Future: support multiple templates
+DEFAULT_RESUME_TEMPLATE = "jake"  # See pdf_generators.TEMPLATES for options
 MIN_GPA_DISPLAY = 2.8
 PAGE_SIZE = "letter"
+PDF_RENDER_WORKERS = None  # Batch render processes (None = one per CPU)
+ARTIFACT_STORE_MAX_MB = 512  # Disk budget for stored renders (see artifact_store.py)
 
 # File paths
 BASE_DIR = Path(__file__).parent
@@ -0,0 +1,249 @@
+"""
+Page-fit engine for resume PDFs.
+
+Tailoring tends to lengthen bullets, pushing resumes onto a second page.
+This module measures the resume story with each flowable's wrap() (no PDF
+is built) and searches over font size, spacing and bullet trimming for
+the least aggressive layout that hits a target page count.
+"""
+
+import math
+from typing import Dict, List, Optional, Tuple
+
+from reportlab.platypus import Paragraph
+
+from models import ResumeData
+from pdf_generators import PDFGenerator, RenderContext, BASE_FONT_SIZE
+from config import DEFAULT_RESUME_TEMPLATE
+
+# Layouts ordered from least to most aggressive: (font_size, spacing).
+# Each step is never taller than the one before, so the search can bisect.
+LAYOUT_LADDER = [
+    (BASE_FONT_SIZE, 1.0),
+    (BASE_FONT_SIZE, 0.8),
+    (BASE_FONT_SIZE, 0.6),
+    (9.5, 0.6),
+    (9.0, 0.6),
+]
+
+# Default layout + bisecting the other rungs + measuring the fallback rung
+MIN_PASSES = math.ceil(math.log2(len(LAYOUT_LADDER))) + 2
+
+
+class ResumeFitEngine:
+    """
+    Fits a resume onto a target number of pages.
+
+    Search order:
+    1. Bisect the layout ladder for the largest font / spacing that fits
+    2. If even the tightest layout overflows, trim trailing bullets
+       (projects before experience, longest entries first) until it fits
+
+    Every step is a measure pass over wrap() heights; the number of passes
+    is bounded by max_passes regardless of resume length.
+
+    Example usage:
+        engine = ResumeFitEngine(target_pages=1)
+        fitted, context, report = engine.fit(tailored_resume)
+        PDFGenerator.generate_resume_pdf(fitted, "resume.pdf", context)
+        print(report['adjustments'])
+    """
+
+    def __init__(
+        self,
+        target_pages: int = 1,
+        max_passes: int = 8,
+        min_bullets: int = 2,
+        template: str = DEFAULT_RESUME_TEMPLATE
+    ):
+        """
+        Args:
+            target_pages: Page count to fit within
+            max_passes: Upper bound on measure passes (at least MIN_PASSES,
+                so the layout search always measures the step it picks)
+            min_bullets: Never trim an entry below this many bullets
+            template: Template whose styles are measured
+
+        Raises:
+            ValueError: If max_passes is below MIN_PASSES
+        """
+        if max_passes < MIN_PASSES:
+            raise ValueError(f"max_passes must be at least {MIN_PASSES}")
+        self.target_pages = target_pages
+        self.max_passes = max_passes
+        self.min_bullets = min_bullets
+        self.template = template
+
+    def fit(self, resume: ResumeData) -> Tuple[ResumeData, RenderContext, Dict]:
+        """
+        Find the least aggressive layout that fits the target page count.
+
+        Args:
+            resume: Resume to fit
+
+        Returns:
+            Tuple of (fitted_resume, render_context, report) where report has
+            target_pages, pages, fits, font_size, spacing, trimmed_bullets,
+            adjustments (human-readable list) and measure_passes
+        """
+        passes = 0
+
+        def measure(candidate: ResumeData, step: int) -> Tuple[int, float]:
+            nonlocal passes
+            passes += 1
+            return self.measure(candidate, self._context(step))
+
+        # 1. Already fits with the default layout?
+        pages, height = measure(resume, 0)
+        best_step = 0
+
+        if pages > self.target_pages:
+            # 2. Bisect for the first layout that fits
+            lo, hi = 1, len(LAYOUT_LADDER) - 1
+            best_step = None
+            measured = {}
+            while lo <= hi and passes < self.max_passes:
+                mid = (lo + hi) // 2
+                mid_pages, mid_height = measured[mid] = measure(resume, mid)
+                if mid_pages <= self.target_pages:
+                    best_step, pages, height = mid, mid_pages, mid_height
+                    hi = mid - 1
+                else:
+                    lo = mid + 1
+
+            # Nothing fit: report the tightest rung as measured, not step 0
+            if best_step is None:
+                best_step = len(LAYOUT_LADDER) - 1
+                pages, height = measured.get(best_step) or measure(resume, best_step)
+
+        # 3. Trim bullets at the tightest layout if it still overflows
+        fitted = resume
+        trimmed: List[Dict] = []
+        context = self._context(best_step)
+
+        while pages > self.target_pages and passes < self.max_passes:
+            overflow = max(height - self.target_pages * context.frame_size()[1], 1.0)
+            fitted, removed = self._trim_bullets(fitted, context, overflow)
+            if not removed:
+                break
+            trimmed.extend(removed)
+            pages, height = measure(fitted, best_step)
+
+        font_size, spacing = LAYOUT_LADDER[best_step]
+        report = {
+            'target_pages': self.target_pages,
+            'pages': pages,
+            'fits': pages <= self.target_pages,
+            'font_size': font_size,
+            'spacing': spacing,
+            'trimmed_bullets': trimmed,
+            'adjustments': self._describe(font_size, spacing, trimmed),
+            'measure_passes': passes,
+        }
+        return fitted, context, report
+
+    @staticmethod
+    def measure(resume: ResumeData, context: RenderContext) -> Tuple[int, float]:
+        """
+        Estimate page count and total height of a resume without building a PDF.
+
+        Flowables are packed into frames the way platypus does, except that
+        paragraphs are never split, so the estimate errs on the long side.
+
+        Returns:
+            Tuple of (pages, total_height_in_points)
+        """
+        story = PDFGenerator._build_resume_story(resume, context)
+        frame_width, frame_height = context.frame_size()
+        pages = 1
+        y = 0.0
+        total = 0.0
+
+        for flowable in story:
+            _, h = flowable.wrap(frame_width, frame_height)
+            before = flowable.getSpaceBefore() if y > 0 else 0.0
+            after = flowable.getSpaceAfter()
+
+            if y > 0 and y + before + h > frame_height:
+                pages += 1
+                y = 0.0
+                before = 0.0
+
+            y += before + h + after
+            total += before + h + after
+
+        return pages, total
+
+    # ============================================================
+    # PRIVATE HELPER METHODS
+    # ============================================================
+
+    def _context(self, step: int) -> RenderContext:
+        """Shared render context for a ladder step."""
+        font_size, spacing = LAYOUT_LADDER[step]
+        return RenderContext.get(self.template, font_size, spacing)
+
+    def _trim_bullets(
+        self,
+        resume: ResumeData,
+        context: RenderContext,
+        overflow: float
+    ) -> Tuple[ResumeData, List[Dict]]:
+        """
+        Drop trailing bullets until their measured height covers the overflow.
+
+        Takes from the entry with the most bullets first; ties go to
+        projects before experience and later entries before earlier ones.
+        """
+        bullets = {
+            'projects': [list(p.bullets) for p in resume.projects],
+            'experience': [list(e.bullets) for e in resume.experience],
+        }
+        style = context.resume_styles['bullet']
+        frame_width, frame_height = context.frame_size()
+        removed: List[Dict] = []
+        freed = 0.0
+
+        while freed < overflow:
+            candidates = [
+                (len(entry_bullets), section == 'projects', index, section)
+                for section, entries in bullets.items()
+                for index, entry_bullets in enumerate(entries)
+                if len(entry_bullets) > self.min_bullets
+            ]
+            if not candidates:
+                break
+
+            _, _, index, section = max(candidates)
+            bullet = bullets[section][index].pop()
+            _, h = Paragraph(f"• {bullet}", style).wrap(frame_width, frame_height)
+            freed += h + style.spaceAfter
+            removed.append({'section': section, 'entry': index, 'bullet': bullet})
+
+        if not removed:
+            return resume, removed
+
+        fitted = resume.model_copy(update={
+            'experience': [
+                e.model_copy(update={'bullets': b})
+                for e, b in zip(resume.experience, bullets['experience'])
+            ],
+            'projects': [
+                p.model_copy(update={'bullets': b})
+                for p, b in zip(resume.projects, bullets['projects'])
+            ],
+        })
+        return fitted, removed
+
+    @staticmethod
+    def _describe(font_size: float, spacing: float, trimmed: List[Dict]) -> List[str]:
+        """Human-readable list of the adjustments applied."""
+        adjustments = []
+        if font_size != BASE_FONT_SIZE:
+            adjustments.append(f"Font size reduced from {BASE_FONT_SIZE:g}pt to {font_size:g}pt")
+        if spacing != 1.0:
+            adjustments.append(f"Vertical spacing reduced to {spacing:.0%}")
+        for item in trimmed:
+            section = "Project" if item['section'] == 'projects' else "Experience"
+            adjustments.append(f"Removed bullet from {section} {item['entry'] + 1}: \"{item['bullet'][:60]}\"")
+        return adjustments
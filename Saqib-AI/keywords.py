@@ -0,0 +1,126 @@
+"""
+Priority keyword extraction from job descriptions.
+
+The same job description is scanned by tailoring, cover letters, review
+and keyword extraction, so patterns are compiled once at import, each
+description is scanned in a single pass, and results are memoized.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, List, Tuple
+
+from config import KEYWORD_CACHE_SIZE
+
+# Technical skills patterns
+TECH_PATTERNS = [
+    r'\b(Python|Java|JavaScript|TypeScript|Go|Rust|C\+\+|Ruby|Scala|Kotlin)\b',
+    r'\b(React|Angular|Vue|Node\.js|Django|Flask|Spring|Rails)\b',
+    r'\b(AWS|Azure|GCP|Kubernetes|Docker|Terraform|Jenkins|CI/CD)\b',
+    r'\b(SQL|PostgreSQL|MySQL|MongoDB|Redis|Elasticsearch|Kafka)\b',
+    r'\b(Machine Learning|ML|AI|Deep Learning|NLP|Computer Vision)\b',
+    r'\b(REST|GraphQL|microservices|APIs?|distributed systems?)\b',
+    r'\b(Agile|Scrum|DevOps|SRE|TDD|BDD)\b',
+]
+
+# Experience/soft skill patterns
+SOFT_PATTERNS = [
+    r'\b(lead(?:ing|ership)?|mentor(?:ing)?|manage(?:ment)?)\b',
+    r'\b(cross-functional|collaborate|stakeholder)\b',
+    r'\b(scale|scaling|performance|optimization)\b',
+    r'\b(architect(?:ure)?|design(?:ing)?|system design)\b',
+]
+
+_PATTERNS = [re.compile(p, re.IGNORECASE) for p in TECH_PATTERNS + SOFT_PATTERNS]
+
+# Word runs in the text; every pattern can only match where one starts
+_WORD = re.compile(r'\w+')
+
+
+def _build_dispatch() -> Dict[str, Tuple[int, ...]]:
+    """
+    Map the first 1-3 letters of every alternative to the patterns that use it.
+
+    A pattern can only match where a word run starts with one of its keys,
+    so each word costs a dict lookup instead of eleven regex attempts.
+    """
+    dispatch: Dict[str, List[int]] = {}
+    for index, pattern in enumerate(TECH_PATTERNS + SOFT_PATTERNS):
+        group = pattern[len(r'\b('):-len(r')\b')]
+        for alternative in re.split(r'\|(?![^(]*\))', group):
+            lead = re.match(r'\w*', alternative).group()[:3].casefold()
+            if not lead or '?' in alternative[:len(lead) + 1]:
+                raise ValueError(f"Keyword alternative '{alternative}' can't be dispatched")
+            dispatch.setdefault(lead, [])
+            if index not in dispatch[lead]:
+                dispatch[lead].append(index)
+    return {lead: tuple(indexes) for lead, indexes in dispatch.items()}
+
+
+_DISPATCH = _build_dispatch()
+
+# Explicit requirements (lines starting with - or •)
+_REQUIREMENT_LINE = re.compile(r'[-•]\s*(.+?)(?:\n|$)')
+
+
+def extract_priority_keywords(job_description: str, limit: int = 20) -> List[str]:
+    """
+    Extract high-impact keywords from a job description.
+
+    Keywords come from the skill patterns above plus short requirement
+    bullets, ordered by frequency in the description, then alphabetically.
+
+    Args:
+        job_description: Job posting text
+        limit: Maximum keywords returned
+
+    Returns:
+        Prioritized list of keywords (a new list; safe to modify)
+    """
+    return list(_cached_keywords(job_description)[:limit])
+
+
+@lru_cache(maxsize=KEYWORD_CACHE_SIZE)
+def _cached_keywords(job_description: str) -> Tuple[str, ...]:
+    """Sorted keywords for a job description, memoized by its hash."""
+    extracted = dict.fromkeys(_match_patterns(job_description))
+
+    requirement_lines = _REQUIREMENT_LINE.findall(job_description)
+    for line in requirement_lines[:10]:
+        # Keep short lines (key noun phrases)
+        if len(line.split()) <= 5:
+            extracted[line.strip()] = None
+
+    # Prioritize: more frequent = higher priority, then alphabetically.
+    # str.count is a C-level scan; a Python-level single pass is far slower.
+    text_lower = job_description.lower()
+    keyword_freq = {kw: text_lower.count(kw.lower()) for kw in extracted}
+    return tuple(sorted(extracted, key=lambda x: (-keyword_freq[x], x.lower())))
+
+
+def _match_patterns(text: str) -> List[str]:
+    """
+    All matches of every pattern, from one scan over the words of the text.
+
+    Equivalent to running findall() for each pattern separately: a pattern
+    is only tried where a word starts with one of its keys, and never
+    inside its own previous match (matches of different patterns may overlap).
+    """
+    matches = []
+    resume_at = [0] * len(_PATTERNS)
+
+    for word in _WORD.finditer(text):
+        token = word.group().casefold()
+        indexes = _DISPATCH.get(token[:1], ()) + _DISPATCH.get(token[:2], ()) + _DISPATCH.get(token[:3], ())
+        if not indexes:
+            continue
+        pos = word.start()
+        for i in indexes:
+            if pos < resume_at[i]:
+                continue
+            m = _PATTERNS[i].match(text, pos)
+            if m:
+                matches.append(m.group(1))
+                resume_at[i] = m.end()
+
+    return matches
@@ -3,11 +3,84 @@ Data models for resume components.
 All Pydantic models for type safety and validation.
 """
 
-from pydantic import BaseModel, Field, validator
-from typing import List, Optional
-
-
-class Header(BaseModel):
+import hashlib
+from pydantic import BaseModel, Field, PrivateAttr, TypeAdapter, field_validator
+from typing import Any, Callable, Dict, List, Literal, Optional, Union
+
+
+class FrozenList(list):
+    """
+    List that rejects in-place changes; freeze() puts these in list fields.
+    Still a list, so validation, serialization and comparisons are unchanged.
+    """
+
+    def _frozen(self, *args, **kwargs):
+        raise TypeError("list is frozen; use model_copy(update=...) instead")
+
+    append = extend = insert = remove = pop = clear = sort = reverse = _frozen
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _frozen
+
+    def __reduce_ex__(self, protocol):
+        # copy/deepcopy/pickle rebuild from the items instead of appending to a frozen list
+        return (type(self), (list(self),))
+
+
+class ResumeModel(BaseModel):
+    """
+    Base for resume components that can be frozen.
+
+    Frozen instances reject attribute assignment and changes to their list
+    fields, which lets ResumeData cache its serialized forms and content
+    hash. model_copy() always returns a mutable copy with empty caches;
+    nested models shared with a frozen original stay frozen unless deep=True.
+
+    Equality compares field values only (not freeze state or caches).
+    """
+    _frozen: bool = PrivateAttr(default=False)
+
+    def __setattr__(self, name, value):
+        if self._frozen and not name.startswith('_'):
+            raise TypeError(f"{type(self).__name__} is frozen; use model_copy(update=...) instead")
+        super().__setattr__(name, value)
+
+    def __eq__(self, other):
+        if not isinstance(other, BaseModel):
+            return NotImplemented
+        return type(self) is type(other) and self.__dict__ == other.__dict__
+
+    @property
+    def is_frozen(self) -> bool:
+        return self._frozen
+
+    def freeze(self):
+        """Make this model, its lists and every nested resume model immutable. Returns self."""
+        for name, value in self.__dict__.items():
+            for item in (value if isinstance(value, list) else [value]):
+                if isinstance(item, ResumeModel):
+                    item.freeze()
+            if isinstance(value, list) and not isinstance(value, FrozenList):
+                self.__dict__[name] = FrozenList(value)
+        self._frozen = True
+        return self
+
+    def model_copy(self, *, update=None, deep: bool = False):
+        copy = super().model_copy(update=update, deep=deep)
+        copy._thaw(recursive=deep)
+        return copy
+
+    def _thaw(self, recursive: bool):
+        """Reset freeze state and caches on a fresh copy."""
+        self._frozen = False
+        for name, value in self.__dict__.items():
+            if isinstance(value, FrozenList):
+                value = self.__dict__[name] = list(value)
+            if recursive:
+                for item in (value if isinstance(value, list) else [value]):
+                    if isinstance(item, ResumeModel):
+                        item._thaw(recursive=True)
+
+
+class Header(ResumeModel):
     """Contact information for resume header"""
     name: str
     email: str
@@ -16,7 +89,8 @@ class Header(BaseModel):
     github: Optional[str] = None
     location: Optional[str] = None
 
-    @validator('email')
+    @field_validator('email')
+    @classmethod
     def validate_email(cls, v):
         if '@' not in v:
             raise ValueError('Invalid email address')
@@ -43,7 +117,7 @@ class Header(BaseModel):
         return len(self.get_missing_contact_info()) == 0
 
 
-class Education(BaseModel):
+class Education(ResumeModel):
     """Education entry"""
     degree: str
     school: str
@@ -51,14 +125,15 @@ class Education(BaseModel):
     location: Optional[str] = ""
     gpa: Optional[float] = None
 
-    @validator('gpa')
+    @field_validator('gpa')
+    @classmethod
     def validate_gpa(cls, v):
         if v is not None and (v < 0 or v > 4.0):
             raise ValueError('GPA must be between 0 and 4.0')
         return v
 
 
-class Experience(BaseModel):
+class Experience(ResumeModel):
     """Work experience entry"""
     title: str
     company: str
@@ -67,14 +142,15 @@ class Experience(BaseModel):
     location: Optional[str] = ""
     bullets: List[str]
 
-    @validator('bullets')
+    @field_validator('bullets')
+    @classmethod
     def validate_bullets(cls, v):
         if not v:
             raise ValueError('Experience must have at least one bullet point')
         return v
 
 
-class Project(BaseModel):
+class Project(ResumeModel):
     """Project entry"""
     name: str
     technologies: List[str]
@@ -83,7 +159,12 @@ class Project(BaseModel):
     link: Optional[str] = None
 
 
-class Skills(BaseModel):
+class BulletRewrite(BaseModel):
+    """Rewritten bullets for a single experience or project entry"""
+    bullets: List[str] = Field(min_length=1)
+
+
+class Skills(ResumeModel):
     """Technical skills categorized"""
     languages: List[str] = []
     frameworks: List[str] = []
@@ -126,16 +207,75 @@ class CompanyResearch(BaseModel):
     founded: Optional[str] = None
 
 
-class ResumeData(BaseModel):
-    """Complete resume structure"""
+class ResumeData(ResumeModel):
+    """
+    Complete resume structure.
+
+    Once frozen (see freeze()), to_text(), to_json() and content_hash() are
+    computed once and cached. The content hash is stable across processes
+    and is the cache key for anything derived from a resume.
+    """
     header: Header
     education: List[Education]
     experience: List[Experience]
     projects: List[Project]
     skills: Skills
 
+    _cache: Dict[str, str] = PrivateAttr(default_factory=dict)
+
+    def __hash__(self):
+        if not self._frozen:
+            raise TypeError("unhashable type: mutable ResumeData (call freeze() first)")
+        return hash(self.content_hash())
+
+    def __eq__(self, other):
+        # same content, whether frozen or not (consistent with __hash__)
+        if not isinstance(other, ResumeData):
+            return NotImplemented
+        return self.content_hash() == other.content_hash()
+
+    def with_sections(self, **sections) -> "ResumeData":
+        """
+        Copy with some top-level sections replaced and validated.
+
+        Values may be models or raw dicts/lists (e.g. from LLM JSON).
+        Sections left unchanged are shared with this resume rather than
+        dumped and re-validated.
+
+        Example:
+            tailored = resume.with_sections(experience=data['experience'])
+        """
+        unknown = set(sections) - set(type(self).model_fields)
+        if unknown:
+            raise ValueError(f"Unknown resume sections: {', '.join(sorted(unknown))}")
+        return type(self).model_validate({**self.__dict__, **sections})
+
     def to_text(self) -> str:
         """Convert to plain text for LLM processing"""
+        return self._cached('text', self._build_text)
+
+    def to_json(self, indent: Optional[int] = None) -> str:
+        """Serialize to JSON (cached per indent when frozen)"""
+        return self._cached(f'json:{indent}', lambda: self.model_dump_json(indent=indent))
+
+    def content_hash(self) -> str:
+        """SHA-256 of the canonical JSON; equal content gives an equal hash"""
+        return self._cached('hash', lambda: hashlib.sha256(self.to_json().encode('utf-8')).hexdigest())
+
+    def _cached(self, key: str, build: Callable[[], str]) -> str:
+        """Return a cached value on frozen instances; always rebuild on mutable ones."""
+        if not self._frozen:
+            return build()
+        value = self._cache.get(key)
+        if value is None:
+            value = self._cache[key] = build()
+        return value
+
+    def _thaw(self, recursive: bool):
+        super()._thaw(recursive)
+        self._cache = {}
+
+    def _build_text(self) -> str:
         sections = []
 
         # Header
@@ -192,3 +332,32 @@ class SemanticAnalysisResult(BaseModel):
     matches: List[dict]
     top_missing_skills: List[str] = []
     top_matching_skills: List[str] = []
+
+
+class WorkflowEvent(BaseModel):
+    """Progress event emitted while the tailoring workflow runs"""
+    type: Literal["stage_started", "stage_finished", "complete", "error"]
+    stage: Optional[str] = None  # One of service.WORKFLOW_STAGES
+    data: Dict[str, Any] = {}  # Partial results (JSON-safe), e.g. semantic score or questions
+    elapsed: float = 0.0  # Seconds since the workflow started
+
+
+# Compiled once at import. validate_json() parses str or bytes with
+# pydantic-core's JSON parser, skipping the json.loads() intermediate step.
+LLM_JSON_ADAPTER = TypeAdapter(Dict[str, Any])
+
+
+def parse_llm_json(data: Union[str, bytes]) -> Dict[str, Any]:
+    """
+    Parse a JSON object returned by the LLM.
+
+    Args:
+        data: JSON text (markdown fences already stripped)
+
+    Returns:
+        Parsed dict
+
+    Raises:
+        ValueError: If the text is not a JSON object (pydantic ValidationError)
+    """
+    return LLM_JSON_ADAPTER.validate_json(data)
@@ -3,12 +3,11 @@ Resume parsing module.
 Handles PDF extraction and LLM-based structure parsing.
 """
 
-import json
 from typing import Optional
 from langchain_community.document_loaders import PyPDFLoader
 from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_core.messages import HumanMessage
 from models import ResumeData
+from structured_output import StructuredLLM
 from config import GEMINI_API_KEY, GEMINI_MODEL, GEMINI_TEMPERATURE, GEMINI_TIMEOUT, GEMINI_MAX_RETRIES
 
 
@@ -31,6 +30,7 @@ class ResumeParser:
             request_timeout=GEMINI_TIMEOUT,
             max_retries=GEMINI_MAX_RETRIES
         )
+        self.structured = StructuredLLM(self.llm)
     
     def extract_text_from_pdf(self, pdf_path: str) -> str:
         """
@@ -111,12 +111,8 @@ Resume:
 JSON:"""
 
         try:
-            response = self.llm.invoke([HumanMessage(content=prompt)])
-            json_text = self._extract_json(response.content)
-            data = json.loads(json_text)
-            
-            # Validate and create ResumeData
-            resume = ResumeData(**data)
+            # Schema-constrained; invalid sections are re-requested individually
+            resume = self.structured.invoke_model(prompt, ResumeData)
             
             print(f"  ✓ Parsed: {len(resume.experience)} jobs, "
                   f"{len(resume.projects)} projects, "
@@ -124,8 +120,6 @@ JSON:"""
             
             return resume
             
-        except json.JSONDecodeError as e:
-            raise ValueError(f"Failed to parse JSON from LLM response: {str(e)}")
         except Exception as e:
             raise ValueError(f"Resume parsing failed: {str(e)}")
     
@@ -141,24 +135,3 @@ JSON:"""
         """
         text = self.extract_text_from_pdf(pdf_path)
         return self.parse_resume_text(text)
-    
-    def _extract_json(self, text: str) -> str:
-        """
-        Extract JSON from LLM response that may contain markdown.
-        
-        LLMs often wrap JSON in ```json ... ``` blocks.
-        This strips that formatting.
-        """
-        text = text.strip()
-        
-        # Remove markdown code blocks
-        if "```json" in text:
-            start = text.find("```json") + 7
-            end = text.find("```", start)
-            return text[start:end].strip()
-        elif "```" in text:
-            start = text.find("```") + 3
-            end = text.find("```", start)
-            return text[start:end].strip()
-        
-        return text
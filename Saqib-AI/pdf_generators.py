@@ -6,12 +6,118 @@ Handles resume and cover letter PDF creation.
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+from reportlab.pdfbase import pdfmetrics
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, HRFlowable
 from reportlab.lib import colors
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 from datetime import datetime
+from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple
 from models import ResumeData, CoverLetter, Header
-from config import MIN_GPA_DISPLAY
+from config import MIN_GPA_DISPLAY, DEFAULT_RESUME_TEMPLATE
+
+# Resume body font size the styles are designed around
+BASE_FONT_SIZE = 10.0
+
+# Page geometry shared by rendering and the fit engine
+RESUME_MARGIN = 0.5 * inch
+COVER_LETTER_MARGIN = 0.75 * inch
+
+# SimpleDocTemplate's frame pads each side by 6pt
+FRAME_PADDING = 6
+
+
+class RenderContext:
+    """
+    Pre-built rendering resources for one template.
+
+    Paragraph styles, the two-column table style and font metrics are
+    created once and shared by every render that uses this context, so
+    bulk rendering (one resume per job) doesn't rebuild them per document.
+    Contexts are read-only during a build and safe to reuse indefinitely.
+
+    Resources that don't vary by template (table style, cover letter
+    styles, loaded fonts) are built once and shared by all contexts.
+
+    font_size and spacing scale the resume body text and vertical gaps;
+    the fit engine uses them to compress a resume onto fewer pages.
+    """
+
+    _cache: Dict[Tuple[str, float, float], "RenderContext"] = {}
+    _shared: Dict[str, object] = {}
+    _loaded_fonts: Set[str] = set()
+
+    def __init__(
+            self,
+            template: str = DEFAULT_RESUME_TEMPLATE,
+            font_size: float = BASE_FONT_SIZE,
+            spacing: float = 1.0
+    ):
+        self.template = template
+        self.layout = get_template(template)
+        self.font_size = font_size
+        self.spacing = spacing
+        self.margin = self.layout.margin
+        self.resume_styles = self.layout.build_styles()
+        self.cover_letter_styles = self._get_shared('cover_letter_styles', PDFGenerator._create_cover_letter_styles)
+        self.table_style = self._get_shared('table_style', PDFGenerator._table_style)
+        self._scale_resume_styles()
+        self._load_fonts()
+
+    @classmethod
+    def get(
+            cls,
+            template: str = DEFAULT_RESUME_TEMPLATE,
+            font_size: float = BASE_FONT_SIZE,
+            spacing: float = 1.0
+    ) -> "RenderContext":
+        """Return the shared context for a template and scale, building it on first use."""
+        key = (template, font_size, spacing)
+        context = cls._cache.get(key)
+        if context is None:
+            context = cls(template, font_size, spacing)
+            cls._cache[key] = context
+        return context
+
+    def space(self, height: float) -> float:
+        """Scale a fixed vertical gap by this context's spacing."""
+        return height * self.spacing
+
+    def frame_size(self) -> Tuple[float, float]:
+        """Usable (width, height) of a resume page frame, inside margins and padding."""
+        return (
+            letter[0] - 2 * self.margin - 2 * FRAME_PADDING,
+            letter[1] - 2 * self.margin - 2 * FRAME_PADDING
+        )
+
+    @classmethod
+    def _get_shared(cls, name: str, factory):
+        """Build a template-independent resource once and share it."""
+        if name not in cls._shared:
+            cls._shared[name] = factory()
+        return cls._shared[name]
+
+    def _scale_resume_styles(self):
+        """Apply font size and spacing scale to the resume styles."""
+        font_scale = self.font_size / BASE_FONT_SIZE
+        if font_scale == 1.0 and self.spacing == 1.0:
+            return
+
+        for style in self.resume_styles.values():
+            style.fontSize *= font_scale
+            style.leading *= font_scale
+            style.spaceBefore *= self.spacing
+            style.spaceAfter *= self.spacing
+
+    def _load_fonts(self):
+        """Resolve fonts not yet loaded by any context so metrics are ready up front."""
+        font_names = {
+            style.fontName
+            for styles in (self.resume_styles, self.cover_letter_styles)
+            for style in styles.values()
+        }
+        for font_name in font_names - self._loaded_fonts:
+            pdfmetrics.getFont(font_name)
+            self._loaded_fonts.add(font_name)
 
 
 class PDFGenerator:
@@ -19,56 +125,31 @@ class PDFGenerator:
     Handles all PDF generation.
 
     Supports:
-    - Resume PDFs (Jake's template style)
+    - Resume PDFs (Jake's template style by default, see TEMPLATES)
     - Cover letter PDFs
-    - Future: Multiple template styles
     """
 
     @staticmethod
-    def generate_resume_pdf(resume: ResumeData, output_path: str) -> bool:
+    def generate_resume_pdf(
+            resume: ResumeData,
+            output_path: str,
+            context: Optional[RenderContext] = None,
+            template: str = DEFAULT_RESUME_TEMPLATE
+    ) -> bool:
         """
-        Generate ATS-friendly resume PDF matching Jake's Resume Template.
+        Generate ATS-friendly resume PDF (Jake's Resume Template by default).
 
         Args:
             resume: Resume data to render
-            output_path: Where to save PDF
+            output_path: Where to save PDF (a path or writable file object)
+            context: Optional pre-built render context (overrides template)
+            template: Registered template name (default: config.DEFAULT_RESUME_TEMPLATE)
 
         Returns:
             True if successful, False otherwise
         """
         try:
-            doc = SimpleDocTemplate(
-                output_path,
-                pagesize=letter,
-                topMargin=0.5 * inch,
-                bottomMargin=0.5 * inch,
-                leftMargin=0.5 * inch,
-                rightMargin=0.5 * inch
-            )
-
-            story = []
-            styles = PDFGenerator._create_resume_styles()
-
-            # Header
-            PDFGenerator._add_header(story, resume.header, styles)
-
-            # Education
-            if resume.education:
-                PDFGenerator._add_education(story, resume.education, styles)
-
-            # Experience
-            if resume.experience:
-                PDFGenerator._add_experience(story, resume.experience, styles)
-
-            # Projects
-            if resume.projects:
-                PDFGenerator._add_projects(story, resume.projects, styles)
-
-            # Skills
-            if resume.skills:
-                PDFGenerator._add_skills(story, resume.skills, styles)
-
-            doc.build(story)
+            PDFGenerator._render_resume(resume, output_path, context or RenderContext.get(template))
             print(f"  ✓ Resume PDF generated: {output_path}")
             return True
 
@@ -80,7 +161,8 @@ class PDFGenerator:
     def generate_cover_letter_pdf(
             cover_letter: CoverLetter,
             header: Header,
-            output_path: str
+            output_path: str,
+            context: Optional[RenderContext] = None
     ) -> bool:
         """
         Generate professional cover letter PDF.
@@ -88,63 +170,172 @@ class PDFGenerator:
         Args:
             cover_letter: Cover letter data
             header: Contact information
-            output_path: Where to save PDF
+            output_path: Where to save PDF (a path or writable file object)
+            context: Optional pre-built render context (default: shared context)
 
         Returns:
             True if successful, False otherwise
         """
         try:
-            doc = SimpleDocTemplate(
-                output_path,
-                pagesize=letter,
-                topMargin=0.75 * inch,
-                bottomMargin=0.75 * inch,
-                leftMargin=0.75 * inch,
-                rightMargin=0.75 * inch
+            PDFGenerator._render_cover_letter(
+                cover_letter, header, output_path, context or RenderContext.get()
             )
+            print(f"  ✓ Cover letter PDF generated: {output_path}")
+            return True
 
-            story = []
-            styles = PDFGenerator._create_cover_letter_styles()
+        except Exception as e:
+            print(f"  ✗ Cover letter PDF generation failed: {e}")
+            return False
 
-            # Contact info
-            story.append(Paragraph(header.name, styles['contact']))
-            if header.email:
-                story.append(Paragraph(header.email, styles['contact']))
-            if header.phone:
-                story.append(Paragraph(header.phone, styles['contact']))
-            if header.location:
-                story.append(Paragraph(header.location, styles['contact']))
+    # ============================================================
+    # BATCH RENDERING
+    # ============================================================
 
-            # Date
-            today = datetime.now().strftime("%B %d, %Y")
-            story.append(Paragraph(today, styles['date']))
+    @staticmethod
+    def generate_resume_pdfs(
+            items: Sequence[Tuple[ResumeData, str]],
+            context: Optional[RenderContext] = None,
+            template: str = DEFAULT_RESUME_TEMPLATE
+    ) -> List[bool]:
+        """
+        Render many resumes in one call, sharing a single render context.
 
-            # Company info
-            story.append(Paragraph("Hiring Manager", styles['company']))
-            story.append(Paragraph(cover_letter.company_name, styles['company']))
-            story.append(Paragraph(cover_letter.position, styles['company']))
+        Args:
+            items: (resume, output_path) pairs
+            context: Optional pre-built render context (overrides template)
+            template: Registered template name (default: config.DEFAULT_RESUME_TEMPLATE)
 
-            # Salutation
-            story.append(Paragraph(
-                f"Dear {cover_letter.hiring_manager},",
-                styles['salutation']
-            ))
+        Returns:
+            Success flag per item, in input order
+        """
+        context = context or RenderContext.get(template)
+        results = []
 
-            # Body
-            for paragraph in cover_letter.paragraphs:
-                story.append(Paragraph(paragraph, styles['body']))
+        for resume, output_path in items:
+            try:
+                PDFGenerator._render_resume(resume, output_path, context)
+                results.append(True)
+            except Exception as e:
+                print(f"  ✗ Resume PDF generation failed for {output_path}: {e}")
+                results.append(False)
 
-            # Closing
-            story.append(Paragraph("Sincerely,", styles['closing']))
-            story.append(Paragraph(header.name, styles['signature']))
+        print(f"  ✓ Rendered {sum(results)}/{len(results)} resume PDFs")
+        return results
 
-            doc.build(story)
-            print(f"  ✓ Cover letter PDF generated: {output_path}")
-            return True
+    @staticmethod
+    def generate_cover_letter_pdfs(
+            items: Sequence[Tuple[CoverLetter, Header, str]],
+            context: Optional[RenderContext] = None
+    ) -> List[bool]:
+        """
+        Render many cover letters in one call, sharing a single render context.
 
-        except Exception as e:
-            print(f"  ✗ Cover letter PDF generation failed: {e}")
-            return False
+        Args:
+            items: (cover_letter, header, output_path) triples
+            context: Optional pre-built render context (default: shared context)
+
+        Returns:
+            Success flag per item, in input order
+        """
+        context = context or RenderContext.get()
+        results = []
+
+        for cover_letter, header, output_path in items:
+            try:
+                PDFGenerator._render_cover_letter(cover_letter, header, output_path, context)
+                results.append(True)
+            except Exception as e:
+                print(f"  ✗ Cover letter PDF generation failed for {output_path}: {e}")
+                results.append(False)
+
+        print(f"  ✓ Rendered {sum(results)}/{len(results)} cover letter PDFs")
+        return results
+
+    # ============================================================
+    # RENDERING
+    # ============================================================
+
+    @staticmethod
+    def _render_resume(resume: ResumeData, output_path, context: RenderContext):
+        """Build a resume PDF, raising on failure."""
+        doc = SimpleDocTemplate(
+            output_path,
+            pagesize=letter,
+            topMargin=context.margin,
+            bottomMargin=context.margin,
+            leftMargin=context.margin,
+            rightMargin=context.margin
+        )
+        doc.build(PDFGenerator._build_resume_story(resume, context))
+
+    @staticmethod
+    def _build_resume_story(resume: ResumeData, context: RenderContext) -> list:
+        """Build the list of flowables for a resume, in the template's section order."""
+        story = []
+        layout = context.layout
+
+        for section in layout.section_order:
+            data = getattr(resume, section)
+            # Header always renders; other sections only when they have content
+            if section != 'header' and not data:
+                continue
+            layout.section_renderers[section](story, data, context)
+
+        return story
+
+    @staticmethod
+    def _render_cover_letter(
+            cover_letter: CoverLetter,
+            header: Header,
+            output_path,
+            context: RenderContext
+    ):
+        """Build a cover letter PDF, raising on failure."""
+        doc = SimpleDocTemplate(
+            output_path,
+            pagesize=letter,
+            topMargin=COVER_LETTER_MARGIN,
+            bottomMargin=COVER_LETTER_MARGIN,
+            leftMargin=COVER_LETTER_MARGIN,
+            rightMargin=COVER_LETTER_MARGIN
+        )
+
+        story = []
+        styles = context.cover_letter_styles
+
+        # Contact info
+        story.append(Paragraph(header.name, styles['contact']))
+        if header.email:
+            story.append(Paragraph(header.email, styles['contact']))
+        if header.phone:
+            story.append(Paragraph(header.phone, styles['contact']))
+        if header.location:
+            story.append(Paragraph(header.location, styles['contact']))
+
+        # Date
+        today = datetime.now().strftime("%B %d, %Y")
+        story.append(Paragraph(today, styles['date']))
+
+        # Company info
+        story.append(Paragraph("Hiring Manager", styles['company']))
+        story.append(Paragraph(cover_letter.company_name, styles['company']))
+        story.append(Paragraph(cover_letter.position, styles['company']))
+
+        # Salutation
+        story.append(Paragraph(
+            f"Dear {cover_letter.hiring_manager},",
+            styles['salutation']
+        ))
+
+        # Body
+        for paragraph in cover_letter.paragraphs:
+            story.append(Paragraph(paragraph, styles['body']))
+
+        # Closing
+        story.append(Paragraph("Sincerely,", styles['closing']))
+        story.append(Paragraph(header.name, styles['signature']))
+
+        doc.build(story)
 
     # ============================================================
     # PRIVATE HELPER METHODS
@@ -261,8 +452,9 @@ class PDFGenerator:
         }
 
     @staticmethod
-    def _add_header(story, header, styles):
+    def _add_header(story, header, context):
         """Add header section to resume"""
+        styles = context.resume_styles
         story.append(Paragraph(header.name, styles['name']))
 
         contact_parts = []
@@ -276,13 +468,14 @@ class PDFGenerator:
         if contact_parts:
             story.append(Paragraph(" | ".join(contact_parts), styles['contact']))
 
-        story.append(Spacer(1, 0.05 * inch))
+        story.append(Spacer(1, context.space(0.05 * inch)))
 
     @staticmethod
-    def _add_education(story, education, styles):
+    def _add_education(story, education, context):
         """Add education section - Jake's Resume style"""
-        story.append(Paragraph("EDUCATION", styles['section']))
-        PDFGenerator._add_section_line(story)
+        styles = context.resume_styles
+        story.append(Paragraph(context.layout.section_titles['education'], styles['section']))
+        PDFGenerator._add_section_line(story, context)
 
         for edu in education:
             # School (bold) | Location (italic) - first row
@@ -291,7 +484,7 @@ class PDFGenerator:
                 Paragraph(edu.location or '', styles['body_italic_right'])
             ]]
             table = Table(row, colWidths=[5 * inch, 2 * inch])
-            table.setStyle(PDFGenerator._table_style())
+            table.setStyle(context.table_style)
             story.append(table)
 
             # Degree (italic) | Grad Date - second row
@@ -300,20 +493,21 @@ class PDFGenerator:
                 Paragraph(edu.graduation_date, styles['body_right'])
             ]]
             table = Table(row, colWidths=[5 * inch, 2 * inch])
-            table.setStyle(PDFGenerator._table_style())
+            table.setStyle(context.table_style)
             story.append(table)
 
             # GPA if present and above threshold
             if edu.gpa and edu.gpa >= MIN_GPA_DISPLAY:
                 story.append(Paragraph(f"GPA: {edu.gpa:.2f}/4.0", styles['body']))
 
-            story.append(Spacer(1, 0.06 * inch))
+            story.append(Spacer(1, context.space(0.06 * inch)))
 
     @staticmethod
-    def _add_experience(story, experience, styles):
+    def _add_experience(story, experience, context):
         """Add experience section - Jake's Resume style"""
-        story.append(Paragraph("EXPERIENCE", styles['section']))
-        PDFGenerator._add_section_line(story)
+        styles = context.resume_styles
+        story.append(Paragraph(context.layout.section_titles['experience'], styles['section']))
+        PDFGenerator._add_section_line(story, context)
 
         for exp in experience:
             # Title (bold) | Dates - first row
@@ -322,7 +516,7 @@ class PDFGenerator:
                 Paragraph(f"{exp.start_date} - {exp.end_date}", styles['body_right'])
             ]]
             table = Table(row, colWidths=[5 * inch, 2 * inch])
-            table.setStyle(PDFGenerator._table_style())
+            table.setStyle(context.table_style)
             story.append(table)
 
             # Company (italic) | Location (italic) - second row
@@ -331,20 +525,21 @@ class PDFGenerator:
                 Paragraph(exp.location or '', styles['body_italic_right'])
             ]]
             table = Table(row, colWidths=[5 * inch, 2 * inch])
-            table.setStyle(PDFGenerator._table_style())
+            table.setStyle(context.table_style)
             story.append(table)
 
             # Bullets
             for bullet in exp.bullets:
                 story.append(Paragraph(f"• {bullet}", styles['bullet']))
 
-            story.append(Spacer(1, 0.06 * inch))
+            story.append(Spacer(1, context.space(0.06 * inch)))
 
     @staticmethod
-    def _add_projects(story, projects, styles):
+    def _add_projects(story, projects, context):
         """Add projects section - Jake's Resume style"""
-        story.append(Paragraph("PROJECTS", styles['section']))
-        PDFGenerator._add_section_line(story)
+        styles = context.resume_styles
+        story.append(Paragraph(context.layout.section_titles['projects'], styles['section']))
+        PDFGenerator._add_section_line(story, context)
 
         for proj in projects:
             tech_str = ", ".join(proj.technologies) if proj.technologies else ""
@@ -361,19 +556,20 @@ class PDFGenerator:
                     Paragraph(proj.dates or '', styles['body_right'])
                 ]]
             table = Table(row, colWidths=[5.5 * inch, 1.5 * inch])
-            table.setStyle(PDFGenerator._table_style())
+            table.setStyle(context.table_style)
             story.append(table)
 
             for bullet in proj.bullets:
                 story.append(Paragraph(f"• {bullet}", styles['bullet']))
 
-            story.append(Spacer(1, 0.06 * inch))
+            story.append(Spacer(1, context.space(0.06 * inch)))
 
     @staticmethod
-    def _add_skills(story, skills, styles):
+    def _add_skills(story, skills, context):
         """Add skills section - Jake's Resume style with bold labels"""
-        story.append(Paragraph("TECHNICAL SKILLS", styles['section']))
-        PDFGenerator._add_section_line(story)
+        styles = context.resume_styles
+        story.append(Paragraph(context.layout.section_titles['skills'], styles['section']))
+        PDFGenerator._add_section_line(story, context)
 
         if skills.languages:
             story.append(Paragraph(
@@ -397,10 +593,15 @@ class PDFGenerator:
             ))
 
     @staticmethod
-    def _add_section_line(story):
+    def _add_section_line(story, context):
         """Add horizontal line under section header - Jake's Resume style"""
-        from reportlab.platypus import HRFlowable
-        story.append(HRFlowable(width="100%", thickness=1, color=colors.black, spaceBefore=1, spaceAfter=3))
+        story.append(HRFlowable(
+            width="100%",
+            thickness=1,
+            color=context.layout.accent_color,
+            spaceBefore=context.space(1),
+            spaceAfter=context.space(3)
+        ))
 
     @staticmethod
     def _table_style():
@@ -411,4 +612,157 @@ class PDFGenerator:
             ('RIGHTPADDING', (0, 0), (-1, -1), 0),
             ('TOPPADDING', (0, 0), (-1, -1), 0),
             ('BOTTOMPADDING', (0, 0), (-1, -1), 0),
-        ])
\ No newline at end of file
+        ])
+
+
+# ============================================================
+# TEMPLATE REGISTRY
+# ============================================================
+
+# Font substitutions applied to the base (Helvetica) styles per family
+FONT_FAMILIES = {
+    'helvetica': {},
+    'times': {
+        'Helvetica': 'Times-Roman',
+        'Helvetica-Bold': 'Times-Bold',
+        'Helvetica-Oblique': 'Times-Italic',
+    },
+}
+
+DEFAULT_SECTION_ORDER = ['header', 'education', 'experience', 'projects', 'skills']
+
+DEFAULT_SECTION_TITLES = {
+    'education': 'EDUCATION',
+    'experience': 'EXPERIENCE',
+    'projects': 'PROJECTS',
+    'skills': 'TECHNICAL SKILLS',
+}
+
+DEFAULT_SECTION_RENDERERS = {
+    'header': PDFGenerator._add_header,
+    'education': PDFGenerator._add_education,
+    'experience': PDFGenerator._add_experience,
+    'projects': PDFGenerator._add_projects,
+    'skills': PDFGenerator._add_skills,
+}
+
+
+class ResumeTemplate:
+    """
+    Declarative resume layout.
+
+    A template is Jake's base styles plus a font family, style overrides,
+    section order/titles and optional custom section renderers
+    (callables taking story, section_data, context). Styles are compiled
+    once per template by RenderContext and cached from then on.
+    """
+
+    def __init__(
+            self,
+            name: str,
+            description: str,
+            font_family: str = 'helvetica',
+            style_overrides: Optional[Dict[str, Dict]] = None,
+            section_order: Optional[List[str]] = None,
+            section_titles: Optional[Dict[str, str]] = None,
+            section_renderers: Optional[Dict[str, Callable]] = None,
+            accent_color=colors.black,
+            margin: float = RESUME_MARGIN
+    ):
+        self.name = name
+        self.description = description
+        self.font_family = font_family
+        self.style_overrides = style_overrides or {}
+        self.section_order = section_order or list(DEFAULT_SECTION_ORDER)
+        self.section_titles = {**DEFAULT_SECTION_TITLES, **(section_titles or {})}
+        self.section_renderers = {**DEFAULT_SECTION_RENDERERS, **(section_renderers or {})}
+        self.accent_color = accent_color
+        self.margin = margin
+
+    def build_styles(self) -> Dict[str, ParagraphStyle]:
+        """Compile this template's paragraph styles from the base resume styles."""
+        fonts = FONT_FAMILIES[self.font_family]
+        styles = PDFGenerator._create_resume_styles()
+
+        for key, style in styles.items():
+            style.fontName = fonts.get(style.fontName, style.fontName)
+            for attr, value in self.style_overrides.get(key, {}).items():
+                setattr(style, attr, value)
+
+        return styles
+
+
+TEMPLATES: Dict[str, ResumeTemplate] = {}
+
+
+def register_template(template: ResumeTemplate) -> ResumeTemplate:
+    """Add a template to the registry (replacing any with the same name)."""
+    unknown = set(template.section_order) - set(template.section_renderers)
+    if unknown:
+        raise ValueError(f"Template '{template.name}' has no renderer for: {', '.join(sorted(unknown))}")
+
+    TEMPLATES[template.name] = template
+    return template
+
+
+def get_template(name: str) -> ResumeTemplate:
+    """
+    Look up a registered template.
+
+    Raises:
+        ValueError: If no template has that name
+    """
+    try:
+        return TEMPLATES[name]
+    except KeyError:
+        raise ValueError(f"Unknown resume template '{name}'. Available: {', '.join(sorted(TEMPLATES))}")
+
+
+def compile_templates() -> List[str]:
+    """
+    Build the default render context for every registered template.
+
+    Call once at startup so the first request for any template is warm.
+
+    Returns:
+        Names of the compiled templates
+    """
+    for name in TEMPLATES:
+        RenderContext.get(name)
+    return list(TEMPLATES)
+
+
+register_template(ResumeTemplate(
+    name='jake',
+    description="Jake's Resume: centered header, single column, ATS-friendly"
+))
+
+register_template(ResumeTemplate(
+    name='modern',
+    description="Left-aligned header, navy accents, skills ahead of experience",
+    style_overrides={
+        'name': {'alignment': TA_LEFT, 'textColor': colors.HexColor('#1F3A5F')},
+        'contact': {'alignment': TA_LEFT},
+        'section': {'fontSize': 11, 'leading': 13, 'textColor': colors.HexColor('#1F3A5F')},
+    },
+    section_order=['header', 'education', 'skills', 'experience', 'projects'],
+    section_titles={
+        'education': 'Education',
+        'experience': 'Experience',
+        'projects': 'Projects',
+        'skills': 'Skills',
+    },
+    accent_color=colors.HexColor('#1F3A5F')
+))
+
+register_template(ResumeTemplate(
+    name='compact',
+    description="Serif, tighter margins, experience first for experienced candidates",
+    font_family='times',
+    style_overrides={
+        'name': {'fontSize': 20, 'leading': 24},
+        'section': {'spaceBefore': 5},
+    },
+    section_order=['header', 'experience', 'projects', 'skills', 'education'],
+    margin=0.4 * inch
+))
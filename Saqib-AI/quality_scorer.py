@@ -0,0 +1,174 @@
+"""
+Local resume quality scoring.
+
+Scores a tailored resume without an LLM call so the refinement loop can
+decide whether another (expensive) refinement pass is worth running.
+The result uses the same keys as the LLM review in
+AIService.review_and_refine, so it can drive _apply_refinements directly.
+"""
+
+import re
+from typing import Dict, List, Optional
+
+from models import ResumeData, SemanticAnalysisResult
+from config import QUALITY_SCORE_THRESHOLD
+
+# Openers that signal a passive or vague bullet
+WEAK_OPENERS = (
+    "responsible for", "worked on", "helped", "assisted", "participated in",
+    "involved in", "was ", "were ", "did ", "tasked with", "duties included",
+    "in charge of", "handled", "worked with", "contributed to",
+)
+
+# Strong action verbs (past tense) common in tech resumes
+ACTION_VERBS = frozenset("""
+accelerated achieved analyzed architected automated boosted built championed
+collaborated configured consolidated coordinated created cut debugged decreased
+delivered deployed designed developed devised directed drove eliminated enabled
+engineered enhanced established evaluated expanded facilitated founded generated
+grew guided identified implemented improved increased initiated instrumented
+integrated introduced launched led maintained managed mentored migrated minimized
+modernized monitored negotiated optimized orchestrated organized overhauled
+partnered pioneered planned presented prototyped published reduced refactored
+released researched resolved restructured revamped saved scaled secured shipped
+simplified spearheaded standardized streamlined strengthened supervised tested
+trained transformed troubleshot unified upgraded wrote
+""".split())
+
+_METRIC = re.compile(r"\d|%|\$")
+
+# Component targets: reaching the target earns full marks for that component
+TARGETS = {'keywords': 0.8, 'action_verbs': 0.9, 'quantified': 0.6, 'semantic': 0.7}
+WEIGHTS = {'keywords': 0.4, 'action_verbs': 0.2, 'quantified': 0.2, 'semantic': 0.2}
+
+
+class ResumeQualityScorer:
+    """
+    Scores keyword coverage, action verbs, quantification and (optionally)
+    semantic coverage on a 0-100 scale.
+
+    Example usage:
+        scorer = ResumeQualityScorer()
+        review = scorer.score(tailored, keywords)
+        if review['needs_refinement']:
+            ...
+    """
+
+    def __init__(self, threshold: float = QUALITY_SCORE_THRESHOLD, keyword_limit: int = 15):
+        """
+        Args:
+            threshold: Score at or above which no refinement is needed
+            keyword_limit: Number of priority keywords checked
+        """
+        self.threshold = threshold
+        self.keyword_limit = keyword_limit
+
+    def score(
+        self,
+        resume: ResumeData,
+        keywords: List[str],
+        semantic_analysis: Optional[SemanticAnalysisResult] = None
+    ) -> Dict:
+        """
+        Score a resume against a job's priority keywords.
+
+        Args:
+            resume: Resume to score
+            keywords: Priority keywords, most important first
+            semantic_analysis: Optional semantic analysis of this resume;
+                               without it the semantic component is skipped
+
+        Returns:
+            Dict with score, keyword_coverage, missing_keywords, weak_bullets,
+            strengths, needs_refinement, refinement_focus, components and
+            source='local'
+        """
+        text = resume.to_text().lower()
+        keywords = keywords[:self.keyword_limit]
+        present = [kw for kw in keywords if self._contains(text, kw.lower())]
+        missing = [kw for kw in keywords if kw not in present]
+
+        weak_bullets = []
+        bullets = 0
+        strong = 0
+        quantified = 0
+        for label, entries in (("Experience", resume.experience), ("Project", resume.projects)):
+            for entry_index, entry in enumerate(entries, 1):
+                for bullet_index, bullet in enumerate(entry.bullets, 1):
+                    bullets += 1
+                    has_verb = self._starts_with_action_verb(bullet)
+                    has_metric = bool(_METRIC.search(bullet))
+                    strong += has_verb
+                    quantified += has_metric
+
+                    issues = []
+                    if not has_verb:
+                        issues.append("weak opening verb")
+                    if not has_metric:
+                        issues.append("lacks metrics")
+                    if issues:
+                        weak_bullets.append({
+                            'location': f"{label} {entry_index}, bullet {bullet_index}",
+                            'bullet': bullet,
+                            'issue': ", ".join(issues),
+                            'suggestion': "Start with a strong action verb" if not has_verb
+                                          else "Add specific numbers if the candidate has them",
+                        })
+
+        components = {
+            'keywords': len(present) / len(keywords) if keywords else 1.0,
+            'action_verbs': strong / bullets if bullets else 0.0,
+            'quantified': quantified / bullets if bullets else 0.0,
+        }
+        if semantic_analysis is not None:
+            components['semantic'] = semantic_analysis.coverage
+
+        total_weight = sum(WEIGHTS[name] for name in components)
+        score = 100 * sum(
+            WEIGHTS[name] * min(value / TARGETS[name], 1.0)
+            for name, value in components.items()
+        ) / total_weight
+        score = round(score, 1)
+
+        strengths = [
+            f"{name.replace('_', ' ').capitalize()} at {value:.0%}"
+            for name, value in components.items()
+            if value >= TARGETS[name]
+        ]
+        focus = []
+        if missing:
+            focus.append(f"Add missing keywords {', '.join(missing[:3])}")
+        if components['action_verbs'] < TARGETS['action_verbs']:
+            focus.append("strengthen opening verbs")
+        if components['quantified'] < TARGETS['quantified']:
+            focus.append("quantify more bullets")
+
+        return {
+            'score': score,
+            'keyword_coverage': components['keywords'],
+            'missing_keywords': missing,
+            'weak_bullets': weak_bullets,
+            'strengths': strengths,
+            'needs_refinement': score < self.threshold,
+            'refinement_focus': "; ".join(focus) or "general polish",
+            'components': components,
+            'source': 'local',
+        }
+
+    # ============================================================
+    # PRIVATE HELPER METHODS
+    # ============================================================
+
+    @staticmethod
+    def _contains(text: str, keyword: str) -> bool:
+        """Whole-word, case-insensitive keyword check (text already lowercased)."""
+        return re.search(rf"(?<!\w){re.escape(keyword)}(?!\w)", text) is not None
+
+    @staticmethod
+    def _starts_with_action_verb(bullet: str) -> bool:
+        """True if the bullet opens with a strong past-tense verb."""
+        opening = bullet.strip().lstrip("•-* ").lower()
+        if opening.startswith(WEAK_OPENERS):
+            return False
+        first = re.split(r"[\s,;:]", opening, maxsplit=1)[0]
+        return first in ACTION_VERBS or (first.endswith("ed") and len(first) > 4)
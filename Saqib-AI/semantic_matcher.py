@@ -14,6 +14,7 @@ import re
 import spacy
 from config import SEMANTIC_MODEL, SEMANTIC_SIMILARITY_THRESHOLD, SEMANTIC_WEAK_MATCH_THRESHOLD
 from models import SemanticAnalysisResult
+from skill_taxonomy import SKILL_TAXONOMY, SkillTaxonomyManager
 
 
 # Phrases to filter out from job descriptions - company marketing fluff, not actual requirements
@@ -82,403 +83,6 @@ BLOCKED_PATTERNS = [
 ]
 
 
-# Skill Taxonomy: Hierarchical relationships between skills
-# Each skill maps to its parent categories and related skills
-SKILL_TAXONOMY: Dict[str, Dict[str, any]] = {
-    # Frontend Technologies
-    "react": {
-        "parents": ["javascript", "frontend development", "web development"],
-        "related": ["redux", "next.js", "jsx", "react native"],
-        "category": "frontend"
-    },
-    "angular": {
-        "parents": ["typescript", "javascript", "frontend development", "web development"],
-        "related": ["rxjs", "ngrx"],
-        "category": "frontend"
-    },
-    "vue": {
-        "parents": ["javascript", "frontend development", "web development"],
-        "related": ["vuex", "nuxt.js"],
-        "category": "frontend"
-    },
-    "next.js": {
-        "parents": ["react", "javascript", "frontend development", "web development"],
-        "related": ["vercel", "ssr"],
-        "category": "frontend"
-    },
-
-    # Backend Technologies
-    "node.js": {
-        "parents": ["javascript", "backend development", "web development"],
-        "related": ["express", "nestjs", "npm"],
-        "category": "backend"
-    },
-    "django": {
-        "parents": ["python", "backend development", "web development"],
-        "related": ["django rest framework", "orm"],
-        "category": "backend"
-    },
-    "flask": {
-        "parents": ["python", "backend development", "web development"],
-        "related": ["jinja2", "werkzeug"],
-        "category": "backend"
-    },
-    "fastapi": {
-        "parents": ["python", "backend development", "web development"],
-        "related": ["pydantic", "async"],
-        "category": "backend"
-    },
-    "spring": {
-        "parents": ["java", "backend development", "web development"],
-        "related": ["spring boot", "hibernate", "maven"],
-        "category": "backend"
-    },
-
-    # Programming Languages
-    "javascript": {
-        "parents": ["programming", "web development"],
-        "related": ["typescript", "es6", "node.js"],
-        "category": "language"
-    },
-    "typescript": {
-        "parents": ["javascript", "programming", "web development"],
-        "related": ["type safety", "interfaces"],
-        "category": "language"
-    },
-    "python": {
-        "parents": ["programming"],
-        "related": ["pip", "virtualenv", "jupyter"],
-        "category": "language"
-    },
-    "java": {
-        "parents": ["programming"],
-        "related": ["jvm", "maven", "gradle"],
-        "category": "language"
-    },
-    "go": {
-        "parents": ["programming", "backend development"],
-        "related": ["goroutines", "channels"],
-        "category": "language"
-    },
-    "rust": {
-        "parents": ["programming", "systems programming"],
-        "related": ["cargo", "memory safety"],
-        "category": "language"
-    },
-
-    # Data Science & ML
-    "machine learning": {
-        "parents": ["artificial intelligence", "data science"],
-        "related": ["deep learning", "neural networks", "model training"],
-        "category": "ml"
-    },
-    "deep learning": {
-        "parents": ["machine learning", "artificial intelligence"],
-        "related": ["neural networks", "tensorflow", "pytorch"],
-        "category": "ml"
-    },
-    "tensorflow": {
-        "parents": ["deep learning", "machine learning", "python"],
-        "related": ["keras", "neural networks"],
-        "category": "ml"
-    },
-    "pytorch": {
-        "parents": ["deep learning", "machine learning", "python"],
-        "related": ["neural networks", "tensors"],
-        "category": "ml"
-    },
-    "scikit-learn": {
-        "parents": ["machine learning", "python", "data science"],
-        "related": ["numpy", "pandas"],
-        "category": "ml"
-    },
-    "pandas": {
-        "parents": ["python", "data science", "data analysis"],
-        "related": ["numpy", "dataframes"],
-        "category": "data"
-    },
-    "numpy": {
-        "parents": ["python", "data science", "scientific computing"],
-        "related": ["arrays", "linear algebra"],
-        "category": "data"
-    },
-
-    # DevOps & Cloud
-    "docker": {
-        "parents": ["containerization", "devops"],
-        "related": ["kubernetes", "containers", "docker-compose"],
-        "category": "devops"
-    },
-    "kubernetes": {
-        "parents": ["container orchestration", "devops", "cloud"],
-        "related": ["docker", "helm", "k8s"],
-        "category": "devops"
-    },
-    "aws": {
-        "parents": ["cloud computing", "devops"],
-        "related": ["ec2", "s3", "lambda", "cloudformation"],
-        "category": "cloud"
-    },
-    "azure": {
-        "parents": ["cloud computing", "devops"],
-        "related": ["azure devops", "azure functions"],
-        "category": "cloud"
-    },
-    "gcp": {
-        "parents": ["cloud computing", "devops"],
-        "related": ["google cloud", "bigquery", "cloud functions"],
-        "category": "cloud"
-    },
-    "ci/cd": {
-        "parents": ["devops", "automation"],
-        "related": ["jenkins", "github actions", "gitlab ci"],
-        "category": "devops"
-    },
-    "terraform": {
-        "parents": ["infrastructure as code", "devops", "cloud"],
-        "related": ["ansible", "cloudformation"],
-        "category": "devops"
-    },
-
-    # Databases
-    "postgresql": {
-        "parents": ["sql", "database", "relational database"],
-        "related": ["postgres", "sql queries"],
-        "category": "database"
-    },
-    "mongodb": {
-        "parents": ["nosql", "database"],
-        "related": ["mongoose", "document database"],
-        "category": "database"
-    },
-    "redis": {
-        "parents": ["database", "caching", "in-memory database"],
-        "related": ["key-value store"],
-        "category": "database"
-    },
-    "mysql": {
-        "parents": ["sql", "database", "relational database"],
-        "related": ["mariadb"],
-        "category": "database"
-    },
-    "sql": {
-        "parents": ["database", "data"],
-        "related": ["queries", "joins", "indexes"],
-        "category": "database"
-    },
-
-    # APIs & Protocols
-    "rest": {
-        "parents": ["api", "web development"],
-        "related": ["http", "json", "endpoints"],
-        "category": "api"
-    },
-    "graphql": {
-        "parents": ["api", "web development"],
-        "related": ["apollo", "queries", "mutations"],
-        "category": "api"
-    },
-    "grpc": {
-        "parents": ["api", "microservices"],
-        "related": ["protobuf", "rpc"],
-        "category": "api"
-    },
-
-    # Version Control & Collaboration
-    "git": {
-        "parents": ["version control", "collaboration"],
-        "related": ["github", "gitlab", "bitbucket"],
-        "category": "tools"
-    },
-    "github": {
-        "parents": ["git", "version control", "collaboration"],
-        "related": ["github actions", "pull requests"],
-        "category": "tools"
-    },
-
-    # Soft Skills
-    "leadership": {
-        "parents": ["soft skills", "management"],
-        "related": ["team management", "mentoring", "decision making"],
-        "category": "soft_skills"
-    },
-    "communication": {
-        "parents": ["soft skills"],
-        "related": ["presentation", "writing", "collaboration"],
-        "category": "soft_skills"
-    },
-    "problem solving": {
-        "parents": ["soft skills", "analytical skills"],
-        "related": ["critical thinking", "debugging", "troubleshooting"],
-        "category": "soft_skills"
-    },
-    "agile": {
-        "parents": ["project management", "methodology"],
-        "related": ["scrum", "kanban", "sprint"],
-        "category": "methodology"
-    },
-}
-
-
-class SkillTaxonomyManager:
-    """
-    Manages skill taxonomy for understanding skill hierarchies and relationships.
-
-    Enables matching like:
-    - Job requires "frontend development" → matches resume with "React"
-    - Job requires "cloud computing" → matches resume with "AWS"
-    """
-
-    def __init__(self, taxonomy: Dict[str, Dict] = None):
-        self.taxonomy = taxonomy or SKILL_TAXONOMY
-        self._build_reverse_index()
-
-    def _build_reverse_index(self):
-        """Build reverse index from parent/related skills to children."""
-        self.parent_to_children: Dict[str, Set[str]] = {}
-        self.related_index: Dict[str, Set[str]] = {}
-
-        for skill, data in self.taxonomy.items():
-            # Index parents
-            for parent in data.get("parents", []):
-                parent_lower = parent.lower()
-                if parent_lower not in self.parent_to_children:
-                    self.parent_to_children[parent_lower] = set()
-                self.parent_to_children[parent_lower].add(skill)
-
-            # Index related skills (bidirectional)
-            for related in data.get("related", []):
-                related_lower = related.lower()
-                if related_lower not in self.related_index:
-                    self.related_index[related_lower] = set()
-                self.related_index[related_lower].add(skill)
-
-                if skill not in self.related_index:
-                    self.related_index[skill] = set()
-                self.related_index[skill].add(related_lower)
-
-    def get_skill_hierarchy(self, skill: str) -> Set[str]:
-        """
-        Get all parent categories for a skill.
-
-        Example: "react" → {"javascript", "frontend development", "web development"}
-        """
-        skill_lower = skill.lower()
-        if skill_lower in self.taxonomy:
-            return set(self.taxonomy[skill_lower].get("parents", []))
-        return set()
-
-    def get_child_skills(self, category: str) -> Set[str]:
-        """
-        Get all skills that belong to a category.
-
-        Example: "frontend development" → {"react", "angular", "vue", ...}
-        """
-        return self.parent_to_children.get(category.lower(), set())
-
-    def get_related_skills(self, skill: str) -> Set[str]:
-        """
-        Get skills related to the given skill.
-
-        Example: "docker" → {"kubernetes", "containers", "docker-compose"}
-        """
-        skill_lower = skill.lower()
-        related = set()
-
-        if skill_lower in self.taxonomy:
-            related.update(self.taxonomy[skill_lower].get("related", []))
-
-        if skill_lower in self.related_index:
-            related.update(self.related_index[skill_lower])
-
-        return related
-
-    def expand_skill(self, skill: str) -> Set[str]:
-        """
-        Expand a skill to include itself, parents, and related skills.
-
-        This is useful for improving semantic matching by considering
-        the full context of a skill mention.
-        """
-        skill_lower = skill.lower()
-        expanded = {skill_lower}
-
-        # Add parents (e.g., React → JavaScript, Frontend Development)
-        expanded.update(self.get_skill_hierarchy(skill_lower))
-
-        # Add related skills (e.g., React → Redux, Next.js)
-        expanded.update(self.get_related_skills(skill_lower))
-
-        return expanded
-
-    def check_skill_match(self, job_skill: str, resume_skill: str) -> Tuple[bool, float]:
-        """
-        Check if a resume skill matches a job requirement using taxonomy.
-
-        Returns:
-            (is_match, confidence) where confidence is:
-            - 1.0 for exact match
-            - 0.9 for child skill matching parent category
-            - 0.8 for parent skill matching child requirement
-            - 0.7 for related skill match
-            - 0.0 for no match
-        """
-        job_lower = job_skill.lower()
-        resume_lower = resume_skill.lower()
-
-        # Exact match
-        if job_lower == resume_lower:
-            return (True, 1.0)
-
-        # Resume has child skill of job category
-        # e.g., Job wants "frontend development", resume has "React"
-        job_children = self.get_child_skills(job_lower)
-        if resume_lower in job_children:
-            return (True, 0.9)
-
-        # Resume has parent skill of job requirement
-        # e.g., Job wants "React", resume has "frontend development"
-        resume_parents = self.get_skill_hierarchy(resume_lower)
-        if job_lower in resume_parents:
-            return (True, 0.8)
-
-        # Check if job skill is a child of resume skill
-        # e.g., Resume has "JavaScript", job wants "TypeScript" (sibling through parent)
-        job_parents = self.get_skill_hierarchy(job_lower)
-        resume_parents_lower = {p.lower() for p in self.get_skill_hierarchy(resume_lower)}
-        if job_parents & resume_parents_lower:
-            return (True, 0.75)
-
-        # Related skill match
-        job_related = self.get_related_skills(job_lower)
-        if resume_lower in job_related:
-            return (True, 0.7)
-
-        resume_related = self.get_related_skills(resume_lower)
-        if job_lower in resume_related:
-            return (True, 0.7)
-
-        return (False, 0.0)
-
-    def extract_known_skills(self, text: str) -> List[str]:
-        """
-        Extract skills from text that are in our taxonomy.
-
-        Returns list of matched skill names.
-        """
-        text_lower = text.lower()
-        found_skills = []
-
-        # Check for each skill in taxonomy
-        for skill in self.taxonomy.keys():
-            # Use word boundaries to avoid partial matches
-            pattern = r'\b' + re.escape(skill) + r'\b'
-            if re.search(pattern, text_lower):
-                found_skills.append(skill)
-
-        return found_skills
-
-
 class SemanticMatcher:
     """
     Semantic matching using embeddings to find skill/experience overlap.
@@ -5,12 +5,31 @@ This is the main service class that coordinates all modules.
 Backend developers should use this as the primary interface.
 """
 
-from typing import Dict, List, Optional, Tuple
-from models import ResumeData, CoverLetter, CoverLetterTone, CompanyResearch, SemanticAnalysisResult
+import asyncio
+import functools
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+from typing import AsyncIterator, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from models import ResumeData, CoverLetter, CoverLetterTone, CompanyResearch, SemanticAnalysisResult, WorkflowEvent
 from parser import ResumeParser
 from ai_service import AIService
 from semantic_matcher import SemanticMatcher
-from pdf_generators import PDFGenerator
+from pdf_generators import PDFGenerator, compile_templates
+from batch_renderer import BatchPDFRenderer
+from fit_engine import ResumeFitEngine
+from artifact_store import ArtifactStore
+from quality_scorer import ResumeQualityScorer
+from config import (
+    DEFAULT_RESUME_TEMPLATE, ANALYSIS_CACHE_SIZE, PARSE_CACHE_SIZE, TAILORING_CACHE_SIZE,
+    LOCAL_QUALITY_SCORING, MIN_REFINEMENT_GAIN
+)
+
+# Stages reported by complete_tailoring_workflow, in order
+WORKFLOW_STAGES = ("parse", "analyze", "questions", "tailor", "refine", "render", "cover_letter")
 
 
 class ResumeTailoringService:
@@ -22,6 +41,10 @@ class ResumeTailoringService:
     - Analyze semantic fit with jobs
     - Generate tailored resumes
     - Create cover letters
+
+    Resumes returned by the service are frozen, so their text, JSON and
+    content hash are computed once; derived results such as semantic
+    analysis are cached by content hash.
     
     Example usage:
         service = ResumeTailoringService()
@@ -39,16 +62,25 @@ class ResumeTailoringService:
         service.generate_resume_pdf(tailored, "output.pdf")
     """
     
-    def __init__(self, enable_semantic_matching: bool = True):
+    def __init__(self, enable_semantic_matching: bool = True, artifact_store: Optional[ArtifactStore] = None):
         """
         Initialize the service with all required modules.
         
         Args:
             enable_semantic_matching: Whether to use semantic analysis (default: True)
+            artifact_store: Optional store of rendered PDFs; renders of the same
+                            content and template are then copied instead of rebuilt
         """
+        self.artifact_store = artifact_store
         self.parser = ResumeParser()
         self.ai_service = AIService()
         self.pdf_generator = PDFGenerator()
+        compile_templates()
+        self._batch_renderer: Optional[BatchPDFRenderer] = None
+        self._analysis_cache: "OrderedDict[Tuple[str, str], SemanticAnalysisResult]" = OrderedDict()
+        self._parse_cache: "OrderedDict[str, ResumeData]" = OrderedDict()
+        self._tailorings: "OrderedDict[str, Dict]" = OrderedDict()
+        self.quality_scorer = ResumeQualityScorer()
         
         # Semantic matching is optional (but recommended)
         self.semantic_matcher = SemanticMatcher() if enable_semantic_matching else None
@@ -61,18 +93,21 @@ class ResumeTailoringService:
     def parse_resume(self, pdf_path: str) -> ResumeData:
         """
         Parse resume PDF into structured data.
+
+        Parsing is an LLM call, so results are cached by the extracted text:
+        resubmitting the same resume skips straight to analysis.
         
         Args:
             pdf_path: Path to resume PDF file
             
         Returns:
-            ResumeData object with all resume information
+            Frozen ResumeData object with all resume information
             
         Raises:
             FileNotFoundError: If PDF doesn't exist
             ValueError: If parsing fails
         """
-        return self.parser.parse_resume_from_pdf(pdf_path)
+        return self.parse_resume_text(self.parser.extract_text_from_pdf(pdf_path))
     
     def parse_resume_text(self, text: str) -> ResumeData:
         """
@@ -82,9 +117,19 @@ class ResumeTailoringService:
             text: Resume as plain text
             
         Returns:
-            ResumeData object
+            Frozen ResumeData object (cached by text hash)
         """
-        return self.parser.parse_resume_text(text)
+        key = hashlib.sha256(text.encode('utf-8')).hexdigest()
+        if key in self._parse_cache:
+            self._parse_cache.move_to_end(key)
+            print("✓ Resume already parsed (cached)")
+            return self._parse_cache[key]
+
+        resume = self.parser.parse_resume_text(text).freeze()
+        self._parse_cache[key] = resume
+        if len(self._parse_cache) > PARSE_CACHE_SIZE:
+            self._parse_cache.popitem(last=False)
+        return resume
     
     # ============================================================
     # SEMANTIC ANALYSIS
@@ -99,6 +144,7 @@ class ResumeTailoringService:
         Perform semantic analysis of resume vs job description.
         
         This is your competitive advantage over keyword-based systems.
+        Results are cached by resume content hash and job description.
         
         Args:
             resume: Parsed resume data
@@ -110,12 +156,22 @@ class ResumeTailoringService:
         if not self.use_semantic or not self.semantic_matcher:
             print("⚠ Semantic matching disabled")
             return None
+
+        key = (resume.content_hash(), hashlib.sha256(job_description.encode('utf-8')).hexdigest())
+        if key in self._analysis_cache:
+            self._analysis_cache.move_to_end(key)
+            return self._analysis_cache[key]
         
         resume_text = resume.to_text()
-        return self.semantic_matcher.find_semantic_matches(
+        analysis = self.semantic_matcher.find_semantic_matches(
             resume_text, 
             job_description
         )
+
+        self._analysis_cache[key] = analysis
+        if len(self._analysis_cache) > ANALYSIS_CACHE_SIZE:
+            self._analysis_cache.popitem(last=False)
+        return analysis
     
     # ============================================================
     # AI-POWERED ENHANCEMENT
@@ -166,15 +222,75 @@ class ResumeTailoringService:
             semantic_analysis: Optional semantic analysis for targeted enhancement
 
         Returns:
-            Enhanced ResumeData
+            Enhanced (frozen) ResumeData
         """
-        return self.ai_service.tailor_resume(
+        tailored = self.ai_service.tailor_resume(
             resume,
             job_description,
             user_answers,
             questions,
             semantic_analysis
-        )
+        ).freeze()
+        self._remember_tailoring(resume, job_description, user_answers, tailored)
+        return tailored
+
+    def retailor_resume(
+        self,
+        resume: ResumeData,
+        job_description: str,
+        user_answers: Dict[int, str],
+        questions: list,
+        semantic_analysis: Optional[SemanticAnalysisResult] = None
+    ) -> ResumeData:
+        """
+        Update a previous tailoring after new answers or an edited job description.
+
+        Only experiences/projects affected by the change are re-prompted and
+        merged into the cached tailored resume. Falls back to a full
+        tailor_resume() when nothing is cached for this resume or the change
+        can't be localized (e.g. a 'general' answer or a different job).
+
+        Args:
+            resume: Original resume (same one passed to tailor_resume)
+            job_description: Target job description (may be edited)
+            user_answers: All answers so far, including new ones
+            questions: The questions that were asked
+            semantic_analysis: Used only if a full re-tailor is needed
+
+        Returns:
+            Enhanced (frozen) ResumeData
+        """
+        previous = self._tailorings.get(resume.content_hash())
+        targets = None
+        if previous:
+            targets = self.ai_service.find_affected_sections(
+                resume,
+                questions,
+                user_answers,
+                previous['user_answers'],
+                job_description,
+                previous['job_description']
+            )
+
+        if targets is None:
+            print("  ℹ Change can't be localized, tailoring the full resume")
+            return self.tailor_resume(resume, job_description, user_answers, questions, semantic_analysis)
+
+        if not targets:
+            print("  ✓ No sections affected, reusing previous tailoring")
+            tailored = previous['tailored']
+        else:
+            tailored = self.ai_service.retailor_sections(
+                resume,
+                previous['tailored'],
+                job_description,
+                user_answers,
+                questions,
+                targets
+            ).freeze()
+
+        self._remember_tailoring(resume, job_description, user_answers, tailored)
+        return tailored
 
     def suggest_skill_additions(
         self,
@@ -214,13 +330,13 @@ class ResumeTailoringService:
             semantic_analysis: Semantic matching results
 
         Returns:
-            Resume with reordered experiences/projects
+            Resume with reordered experiences/projects (frozen)
         """
         return self.ai_service.reorder_resume_sections(
             resume,
             job_description,
             semantic_analysis
-        )
+        ).freeze()
 
     def get_enhancement_plan(
         self,
@@ -258,6 +374,12 @@ class ResumeTailoringService:
         The system will analyze the resume, identify weaknesses, and apply
         targeted refinements until quality threshold is met or max iterations reached.
 
+        With LOCAL_QUALITY_SCORING, each pass is scored locally (keywords,
+        action verbs, quantification, semantic coverage) instead of by an
+        LLM review call. Refinement is skipped when the score already meets
+        the threshold, and the loop stops once a pass gains fewer than
+        MIN_REFINEMENT_GAIN points. A pass that lowers the score is discarded.
+
         Args:
             tailored_resume: Previously tailored resume
             job_description: Target job description
@@ -266,6 +388,9 @@ class ResumeTailoringService:
         Returns:
             Tuple of (refined_resume, final_review_feedback)
         """
+        if LOCAL_QUALITY_SCORING:
+            return self._refine_with_local_scoring(tailored_resume, job_description, max_iterations)
+
         current_resume = tailored_resume
         final_feedback = {}
 
@@ -284,7 +409,57 @@ class ResumeTailoringService:
 
             current_resume = refined
 
-        return current_resume, final_feedback
+        return current_resume.freeze(), final_feedback
+
+    def _refine_with_local_scoring(
+        self,
+        tailored_resume: ResumeData,
+        job_description: str,
+        max_iterations: int
+    ) -> Tuple[ResumeData, Dict]:
+        """Refinement loop where only the refinement itself costs an LLM call."""
+        keywords = self.ai_service._extract_priority_keywords(job_description)
+        current_resume = tailored_resume
+        review = self._local_review(current_resume, job_description, keywords)
+        review['iterations'] = 0
+
+        for iteration in range(1, max_iterations + 1):
+            if not review['needs_refinement']:
+                print(f"  ✓ Quality score {review['score']:.0f}/100 meets threshold, skipping refinement")
+                break
+
+            refined, feedback = self.ai_service.review_and_refine(
+                current_resume,
+                job_description,
+                iteration=iteration,
+                review=dict(review)
+            )
+            if not feedback.get('refined', False) or feedback.get('status') == 'error':
+                break
+
+            new_review = self._local_review(refined, job_description, keywords)
+            gain = new_review['score'] - review['score']
+            if gain <= 0:
+                print(f"  ⚠ Refinement did not improve score ({gain:+.1f}), keeping previous version")
+                break
+
+            print(f"  📈 Score {review['score']:.0f} → {new_review['score']:.0f} ({gain:+.1f})")
+            current_resume, review = refined, new_review
+            review['refined'] = True
+            review['iterations'] = iteration
+
+            if gain < MIN_REFINEMENT_GAIN:
+                print(f"  ✓ Diminishing returns (< {MIN_REFINEMENT_GAIN:g} points), stopping")
+                break
+
+        return current_resume.freeze(), review
+
+    def _local_review(self, resume: ResumeData, job_description: str, keywords: List[str]) -> Dict:
+        """Score a resume locally, including semantic coverage when enabled."""
+        semantic_analysis = None
+        if self.use_semantic and self.semantic_matcher:
+            semantic_analysis = self.analyze_job_fit(resume, job_description)
+        return self.quality_scorer.score(resume, keywords, semantic_analysis)
 
     def extract_job_keywords(self, job_description: str) -> List[str]:
         """
@@ -344,6 +519,41 @@ class ResumeTailoringService:
             hiring_manager=hiring_manager
         )
 
+    def stream_cover_letter(
+        self,
+        resume: ResumeData,
+        job_description: str,
+        company_name: str,
+        position: str,
+        tone: Optional[CoverLetterTone] = None,
+        with_research: bool = True
+    ) -> Iterator[Union[str, CoverLetter]]:
+        """
+        Generate a cover letter, yielding paragraphs as soon as they are written.
+
+        Args:
+            Same as generate_cover_letter()
+
+        Yields:
+            Each paragraph (str), then the final validated CoverLetter
+        """
+        company_research = None
+        hiring_manager = None
+
+        if with_research:
+            company_research = self.ai_service.research_company(company_name, job_description)
+            hiring_manager = self.ai_service.find_hiring_manager(job_description, company_name)
+
+        yield from self.ai_service.stream_cover_letter(
+            resume,
+            job_description,
+            company_name,
+            position,
+            tone=tone,
+            company_research=company_research,
+            hiring_manager=hiring_manager
+        )
+
     def generate_cover_letter_variants(
         self,
         resume: ResumeData,
@@ -416,18 +626,68 @@ class ResumeTailoringService:
     # PDF GENERATION
     # ============================================================
     
-    def generate_resume_pdf(self, resume: ResumeData, output_path: str) -> bool:
+    def generate_resume_pdf(
+        self,
+        resume: ResumeData,
+        output_path: str,
+        template: str = DEFAULT_RESUME_TEMPLATE
+    ) -> bool:
         """
         Generate resume PDF file.
+
+        With an artifact store, a resume already rendered with this template
+        is copied from the store instead.
         
         Args:
             resume: Resume data to render
             output_path: Where to save PDF
+            template: Resume template name (see pdf_generators.TEMPLATES)
             
         Returns:
             True if successful, False otherwise
         """
-        return self.pdf_generator.generate_resume_pdf(resume, output_path)
+        key = self._artifact_key('resume', resume.content_hash(), template)
+        if self._fetch_artifact(key, output_path) is not None:
+            return True
+        success = self.pdf_generator.generate_resume_pdf(resume, output_path, template=template)
+        if success:
+            self._store_artifact(key, output_path)
+        return success
+
+    def generate_fitted_resume_pdf(
+        self,
+        resume: ResumeData,
+        output_path: str,
+        target_pages: int = 1,
+        template: str = DEFAULT_RESUME_TEMPLATE
+    ) -> Tuple[bool, Dict]:
+        """
+        Generate resume PDF adjusted to fit a target page count.
+
+        Shrinks font size and spacing, then trims trailing bullets if needed.
+
+        Args:
+            resume: Resume data to render
+            output_path: Where to save PDF
+            target_pages: Page count to fit within (default: 1)
+            template: Resume template name (see pdf_generators.TEMPLATES)
+
+        Returns:
+            Tuple of (success, fit_report) where fit_report lists the adjustments applied
+        """
+        key = self._artifact_key('fitted_resume', resume.content_hash(), template, target_pages)
+        report = self._fetch_artifact(key, output_path)
+        if report is not None:
+            return True, report
+
+        engine = ResumeFitEngine(target_pages=target_pages, template=template)
+        fitted, context, report = engine.fit(resume)
+        for adjustment in report['adjustments']:
+            print(f"  ↳ {adjustment}")
+        success = self.pdf_generator.generate_resume_pdf(fitted, output_path, context)
+        if success:
+            self._store_artifact(key, output_path, report)
+        return success, report
     
     def generate_cover_letter_pdf(
         self, 
@@ -446,12 +706,119 @@ class ResumeTailoringService:
         Returns:
             True if successful, False otherwise
         """
-        return self.pdf_generator.generate_cover_letter_pdf(
+        # The letter is dated, so a stored render is only reused on the same day
+        key = self._artifact_key(
+            'cover_letter', cover_letter.model_dump_json(), resume.header.model_dump_json(), date.today()
+        )
+        if self._fetch_artifact(key, output_path) is not None:
+            return True
+        success = self.pdf_generator.generate_cover_letter_pdf(
             cover_letter,
             resume.header,
             output_path
         )
-    
+        if success:
+            self._store_artifact(key, output_path)
+        return success
+
+    def _artifact_key(self, kind: str, *parts) -> Optional[str]:
+        return self.artifact_store.key(kind, *parts) if self.artifact_store else None
+
+    def _fetch_artifact(self, key: Optional[str], output_path) -> Optional[Dict]:
+        """Copy a stored render to output_path; its metadata, or None if there is none."""
+        if key is None:
+            return None
+        metadata = self.artifact_store.fetch(key, output_path)
+        if metadata is not None:
+            print(f"  ✓ PDF reused from artifact store: {output_path}")
+        return metadata
+
+    def _store_artifact(self, key: Optional[str], output_path, metadata: Optional[Dict] = None):
+        if key is not None and isinstance(output_path, (str, os.PathLike)):
+            try:
+                self.artifact_store.put(key, output_path, metadata)
+            except OSError as e:
+                print(f"  ⚠ Could not store rendered PDF: {e}")
+
+    def generate_resume_pdfs(
+        self,
+        items: List[Tuple[ResumeData, str]],
+        parallel: bool = False,
+        template: str = DEFAULT_RESUME_TEMPLATE
+    ) -> List[bool]:
+        """
+        Generate many resume PDFs in one call (e.g. one per tailored job).
+
+        Args:
+            items: (resume, output_path) pairs
+            parallel: Shard rendering across worker processes
+            template: Resume template name (see pdf_generators.TEMPLATES)
+
+        Returns:
+            Success flag per item, in input order
+        """
+        if not parallel:
+            return self.pdf_generator.generate_resume_pdfs(items, template=template)
+
+        paths = self._get_batch_renderer().render_resumes(
+            [resume for resume, _ in items],
+            [path for _, path in items],
+            template=template
+        )
+        return [path is not None for path in paths]
+
+    def generate_cover_letter_pdfs(
+        self,
+        items: List[Tuple[CoverLetter, ResumeData, str]],
+        parallel: bool = False
+    ) -> List[bool]:
+        """
+        Generate many cover letter PDFs in one call.
+
+        Args:
+            items: (cover_letter, resume, output_path) triples; the resume
+                   supplies contact info
+            parallel: Shard rendering across worker processes
+
+        Returns:
+            Success flag per item, in input order
+        """
+        if not parallel:
+            return self.pdf_generator.generate_cover_letter_pdfs(
+                [(cover_letter, resume.header, path) for cover_letter, resume, path in items]
+            )
+
+        paths = self._get_batch_renderer().render_cover_letters(
+            [cover_letter for cover_letter, _, _ in items],
+            [resume.header for _, resume, _ in items],
+            [path for _, _, path in items]
+        )
+        return [path is not None for path in paths]
+
+    def _remember_tailoring(
+        self,
+        resume: ResumeData,
+        job_description: str,
+        user_answers: Dict[int, str],
+        tailored: ResumeData
+    ):
+        """Cache a tailoring by original resume hash for retailor_resume()."""
+        key = resume.content_hash()
+        self._tailorings[key] = {
+            'job_description': job_description,
+            'user_answers': dict(user_answers),
+            'tailored': tailored,
+        }
+        self._tailorings.move_to_end(key)
+        if len(self._tailorings) > TAILORING_CACHE_SIZE:
+            self._tailorings.popitem(last=False)
+
+    def _get_batch_renderer(self) -> BatchPDFRenderer:
+        """Start the shared render worker pool on first use."""
+        if self._batch_renderer is None:
+            self._batch_renderer = BatchPDFRenderer()
+        return self._batch_renderer
+
     # ============================================================
     # COMPLETE WORKFLOW
     # ============================================================
@@ -467,7 +834,10 @@ class ResumeTailoringService:
         position: Optional[str] = None,
         cover_letter_path: Optional[str] = None,
         enable_refinement: bool = True,
-        max_refinement_iterations: int = 2
+        max_refinement_iterations: int = 2,
+        fit_to_pages: Optional[int] = None,
+        template: str = DEFAULT_RESUME_TEMPLATE,
+        on_event: Optional[Callable[[WorkflowEvent], None]] = None
     ) -> Dict[str, any]:
         """
         Complete end-to-end workflow for backend integration.
@@ -491,6 +861,11 @@ class ResumeTailoringService:
             cover_letter_path: Where to save cover letter PDF
             enable_refinement: Whether to run iterative refinement (default: True)
             max_refinement_iterations: Max refinement passes (default: 2)
+            fit_to_pages: If set, shrink/trim the resume PDF to this many pages
+            template: Resume template name (see pdf_generators.TEMPLATES)
+            on_event: Optional callback receiving a WorkflowEvent as each stage
+                      starts and finishes (finished events carry partial
+                      results); an exception raised from it aborts the workflow
 
         Returns:
             Dict with results:
@@ -502,27 +877,43 @@ class ResumeTailoringService:
                 'tailored_resume': ResumeData,
                 'refinement_feedback': Dict or None,
                 'resume_pdf_generated': bool,
+                'fit_report': Dict or None,
                 'cover_letter': CoverLetter or None,
                 'cover_letter_pdf_generated': bool
             }
         """
         results = {}
-        
+        started = time.perf_counter()
+
+        def emit(event_type: str, stage: str, **data):
+            if on_event:
+                on_event(WorkflowEvent(
+                    type=event_type,
+                    stage=stage,
+                    data=data,
+                    elapsed=round(time.perf_counter() - started, 3)
+                ))
+
         # 1. Parse resume
         print("\n" + "=" * 70)
         print("RESUME TAILORING WORKFLOW")
         print("=" * 70)
         
+        emit('stage_started', 'parse')
         resume = self.parse_resume(resume_pdf_path)
         results['resume'] = resume
+        emit('stage_finished', 'parse', name=resume.header.name)
         
         # 2. Semantic analysis
         semantic_analysis = None
         if self.use_semantic:
+            emit('stage_started', 'analyze')
             semantic_analysis = self.analyze_job_fit(resume, job_description)
             results['semantic_analysis'] = semantic_analysis
+            emit('stage_finished', 'analyze', **_semantic_summary(semantic_analysis))
         
         # 3. Generate questions
+        emit('stage_started', 'questions')
         questions, analysis = self.generate_enhancement_questions(
             resume, 
             job_description, 
@@ -530,10 +921,12 @@ class ResumeTailoringService:
         )
         results['questions'] = questions
         results['analysis'] = analysis
+        emit('stage_finished', 'questions', questions=questions, analysis=analysis)
         
         print(f"\n📊 Analysis: {analysis}")
         
         # 4. Tailor resume (using semantic analysis for targeted enhancement)
+        emit('stage_started', 'tailor')
         user_answers = user_answers or {}
         tailored_resume = self.tailor_resume(
             resume,
@@ -542,22 +935,36 @@ class ResumeTailoringService:
             questions,
             semantic_analysis  # Pass semantic analysis for targeted bullet enhancement
         )
+        emit('stage_finished', 'tailor', tailored_resume=tailored_resume.model_dump(mode='json'))
 
         # 5. Iterative refinement (if enabled)
         results['refinement_feedback'] = None
         if enable_refinement:
+            emit('stage_started', 'refine')
             tailored_resume, refinement_feedback = self.refine_resume(
                 tailored_resume,
                 job_description,
                 max_iterations=max_refinement_iterations
             )
             results['refinement_feedback'] = refinement_feedback
+            emit('stage_finished', 'refine', score=(refinement_feedback or {}).get('score'))
 
         results['tailored_resume'] = tailored_resume
 
         # 6. Generate resume PDF
-        resume_success = self.generate_resume_pdf(tailored_resume, output_resume_path)
+        emit('stage_started', 'render')
+        results['fit_report'] = None
+        if fit_to_pages:
+            resume_success, results['fit_report'] = self.generate_fitted_resume_pdf(
+                tailored_resume,
+                output_resume_path,
+                target_pages=fit_to_pages,
+                template=template
+            )
+        else:
+            resume_success = self.generate_resume_pdf(tailored_resume, output_resume_path, template)
         results['resume_pdf_generated'] = resume_success
+        emit('stage_finished', 'render', resume_pdf_generated=resume_success)
         
         if resume_success:
             print(f"\n✓ Tailored resume saved: {output_resume_path}")
@@ -569,6 +976,7 @@ class ResumeTailoringService:
                 results['cover_letter'] = None
                 results['cover_letter_pdf_generated'] = False
             else:
+                emit('stage_started', 'cover_letter')
                 cover_letter = self.generate_cover_letter(
                     tailored_resume,
                     job_description,
@@ -584,6 +992,8 @@ class ResumeTailoringService:
                     cl_path
                 )
                 results['cover_letter_pdf_generated'] = cl_success
+                emit('stage_finished', 'cover_letter', paragraphs=cover_letter.paragraphs,
+                     cover_letter_pdf_generated=cl_success)
                 
                 if cl_success:
                     print(f"✓ Cover letter saved: {cl_path}")
@@ -593,3 +1003,92 @@ class ResumeTailoringService:
         print("=" * 70 + "\n")
         
         return results
+
+    async def stream_tailoring_workflow(self, **workflow_args) -> AsyncIterator[WorkflowEvent]:
+        """
+        Run complete_tailoring_workflow in a worker thread and yield its
+        progress events as they happen.
+
+        Semantic analysis and questions arrive while the LLM stages are
+        still running. The last event is 'complete' (data is
+        workflow_summary() of the results) or 'error'. If the consumer stops
+        iterating, the workflow is aborted at its next stage boundary.
+
+        Args:
+            **workflow_args: Arguments for complete_tailoring_workflow
+                             (except on_event)
+
+        Yields:
+            WorkflowEvent objects
+        """
+        loop = asyncio.get_running_loop()
+        events: asyncio.Queue = asyncio.Queue()
+        abandoned = threading.Event()
+        started = time.perf_counter()
+
+        def on_event(event: WorkflowEvent):
+            if abandoned.is_set():
+                raise WorkflowCancelled("Workflow consumer went away")
+            loop.call_soon_threadsafe(events.put_nowait, event)
+
+        run = loop.run_in_executor(
+            None,
+            functools.partial(self.complete_tailoring_workflow, on_event=on_event, **workflow_args)
+        )
+        run.add_done_callback(lambda _: events.put_nowait(None))
+
+        try:
+            while (event := await events.get()) is not None:
+                yield event
+            try:
+                data = workflow_summary(run.result())
+                event_type = 'complete'
+            except Exception as e:
+                data = {'message': str(e)}
+                event_type = 'error'
+            yield WorkflowEvent(type=event_type, data=data, elapsed=round(time.perf_counter() - started, 3))
+        finally:
+            abandoned.set()
+            # The aborted run ends with WorkflowCancelled; mark it as retrieved
+            run.add_done_callback(lambda future: future.cancelled() or future.exception())
+
+
+class WorkflowCancelled(Exception):
+    """Raised inside the workflow to abort it (e.g. the stream consumer left)"""
+
+
+def _semantic_summary(analysis: Optional[SemanticAnalysisResult]) -> Dict:
+    """Headline semantic-analysis numbers for progress events."""
+    if analysis is None:
+        return {}
+    return {
+        'overall_match': analysis.overall_match,
+        'coverage': analysis.coverage,
+        'top_matching_skills': analysis.top_matching_skills,
+        'top_missing_skills': analysis.top_missing_skills,
+    }
+
+
+def workflow_summary(results: Dict) -> Dict:
+    """
+    JSON-safe summary of complete_tailoring_workflow() results.
+
+    Args:
+        results: Dict returned by complete_tailoring_workflow
+
+    Returns:
+        Dict with questions, analysis, semantic scores, the tailored resume
+        and cover letter as plain dicts, refinement/fit reports and PDF flags
+    """
+    cover_letter = results.get('cover_letter')
+    return {
+        'questions': results['questions'],
+        'analysis': results['analysis'],
+        'semantic_analysis': _semantic_summary(results.get('semantic_analysis')) or None,
+        'tailored_resume': results['tailored_resume'].model_dump(mode='json'),
+        'refinement_feedback': results['refinement_feedback'],
+        'fit_report': results['fit_report'],
+        'cover_letter': cover_letter.model_dump(mode='json') if cover_letter else None,
+        'resume_pdf_generated': results['resume_pdf_generated'],
+        'cover_letter_pdf_generated': results.get('cover_letter_pdf_generated', False),
+    }
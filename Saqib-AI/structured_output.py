@@ -0,0 +1,525 @@
+"""
+Structured LLM output handling.
+
+LLM round-trips dominate workflow latency, so a malformed response should
+not cost a full rerun. This module:
+1. Constrains responses to JSON (and to the Pydantic schema when known)
+2. Repairs near-miss JSON locally (fences, prose, trailing commas,
+   Python literals, raw newlines in strings, truncated output)
+3. Re-asks only for the top-level sections that fail validation
+4. Streams responses, surfacing array items (e.g. paragraphs) as they complete
+5. Caps concurrent model requests process-wide (LLM_SLOTS), so a burst of
+   jobs queues here instead of tripping the provider's rate limits
+"""
+
+import asyncio
+import json
+import re
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Type
+
+from langchain_core.messages import HumanMessage
+from pydantic import BaseModel, ValidationError, create_model
+from pydantic_core import to_json
+
+from models import parse_llm_json
+from config import LLM_STRUCTURED_OUTPUT, LLM_SECTION_RETRIES, LLM_MAX_CONCURRENCY
+
+_LITERALS = {'True': 'true', 'False': 'false', 'None': 'null', 'true': 'true', 'false': 'false', 'null': 'null'}
+_DANGLING_KEY = re.compile(r'([{,])\s*"(?:[^"\\]|\\.)*"\s*:?\s*$')
+_DANGLING_VALUE = re.compile(r'[\s,:.-]+$')
+
+
+def extract_json(text: str) -> str:
+    """
+    Extract JSON from an LLM response that may contain markdown or prose.
+
+    Strips ```json ... ``` fences, then drops anything before the first
+    '{' or '['.
+    """
+    text = text.strip()
+
+    if "```json" in text:
+        start = text.find("```json") + 7
+        end = text.find("```", start)
+        text = text[start:end if end != -1 else None].strip()
+    elif "```" in text:
+        start = text.find("```") + 3
+        end = text.find("```", start)
+        text = text[start:end if end != -1 else None].strip()
+
+    starts = [i for i in (text.find('{'), text.find('[')) if i != -1]
+    return text[min(starts):] if starts else text
+
+
+def repair_json(text: str) -> str:
+    """
+    Repair common near-miss JSON in a single pass.
+
+    Handles trailing prose, trailing commas, Python literals (True/None),
+    unescaped newlines/tabs inside strings and output truncated mid-object
+    (the dangling key or value is dropped and open brackets are closed).
+
+    Args:
+        text: JSON-ish text, already passed through extract_json()
+
+    Returns:
+        Repaired JSON text (may still be invalid if badly malformed)
+    """
+    out: List[str] = []
+    stack: List[str] = []
+    in_string = False
+    i, n = 0, len(text)
+
+    while i < n:
+        ch = text[i]
+
+        if in_string:
+            if ch == '\\' and i + 1 < n:
+                out.append(text[i:i + 2])
+                i += 2
+                continue
+            if ch == '"':
+                in_string = False
+            elif ch == '\n':
+                ch = '\\n'
+            elif ch == '\t':
+                ch = '\\t'
+            elif ch == '\r':
+                ch = ''
+            out.append(ch)
+            i += 1
+            continue
+
+        if ch == '"':
+            in_string = True
+        elif ch in '{[':
+            stack.append('}' if ch == '{' else ']')
+        elif ch in '}]':
+            _strip_trailing_comma(out)
+            if not stack or stack[-1] != ch:
+                i += 1  # stray closer
+                continue
+            stack.pop()
+            out.append(ch)
+            if not stack:
+                break  # ignore anything after the top-level value
+            i += 1
+            continue
+        elif ch.isalpha():
+            j = i
+            while j < n and (text[j].isalnum() or text[j] == '_'):
+                j += 1
+            word = text[i:j]
+            if word in _LITERALS:
+                out.append(_LITERALS[word])
+            elif j < n:
+                out.append(word)  # leave unknown barewords for the parser to reject
+            # else: literal truncated at end of output, dropped below
+            i = j
+            continue
+
+        out.append(ch)
+        i += 1
+
+    if in_string:
+        out.append('"')
+
+    if stack:
+        # Truncated: drop a dangling key / separator, then close what's open
+        repaired = ''.join(out)
+        if stack[-1] == '}':
+            repaired = _DANGLING_KEY.sub(r'\1', repaired)
+        repaired = _DANGLING_VALUE.sub('', repaired)
+        return repaired + ''.join(reversed(stack))
+
+    return ''.join(out)
+
+
+def _strip_trailing_comma(out: List[str]):
+    """Remove a comma (and whitespace) emitted just before a closing bracket."""
+    while out and out[-1].isspace():
+        out.pop()
+    if out and out[-1] == ',':
+        out.pop()
+
+
+def _response_text(response) -> str:
+    """Text of a chat response whose content may be a string or content blocks."""
+    content = response.content
+    if isinstance(content, str):
+        return content
+    return "".join(
+        block.get("text", "") if isinstance(block, dict) else str(block)
+        for block in content
+    )
+
+
+class ConcurrencyLimit:
+    """
+    Caps how many model requests run at once across every thread.
+
+    Example usage:
+        with LLM_SLOTS.slot():
+            response = llm.invoke(messages)
+        print(LLM_SLOTS.snapshot())
+    """
+
+    def __init__(self, limit: int):
+        """
+        Args:
+            limit: Maximum concurrent requests
+        """
+        self.limit = limit
+        self._semaphore = threading.BoundedSemaphore(limit)
+        self._lock = threading.Lock()
+        self.stats = {'acquired': 0, 'in_flight': 0, 'waiting': 0, 'peak_in_flight': 0, 'wait_seconds': 0.0}
+
+    def _acquire(self):
+        start = time.perf_counter()
+        with self._lock:
+            self.stats['waiting'] += 1
+        self._semaphore.acquire()
+        with self._lock:
+            self.stats['waiting'] -= 1
+            self.stats['acquired'] += 1
+            self.stats['in_flight'] += 1
+            self.stats['peak_in_flight'] = max(self.stats['peak_in_flight'], self.stats['in_flight'])
+            self.stats['wait_seconds'] += time.perf_counter() - start
+
+    def _release(self):
+        with self._lock:
+            self.stats['in_flight'] -= 1
+        self._semaphore.release()
+
+    @contextmanager
+    def slot(self):
+        """Hold one request slot for the duration of the block (blocks while all are taken)."""
+        self._acquire()
+        try:
+            yield
+        finally:
+            self._release()
+
+    @asynccontextmanager
+    async def aslot(self):
+        """Async version of slot(): waits on a worker thread, not the event loop."""
+        acquire = asyncio.ensure_future(asyncio.to_thread(self._acquire))
+        try:
+            await asyncio.shield(acquire)
+        except asyncio.CancelledError:
+            # The thread still gets the slot eventually: hand it straight back
+            acquire.add_done_callback(lambda _: self._release())
+            raise
+        try:
+            yield
+        finally:
+            self._release()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current limit and counters (JSON-safe copy)."""
+        with self._lock:
+            return {'limit': self.limit, **self.stats, 'wait_seconds': round(self.stats['wait_seconds'], 3)}
+
+
+# Shared by every StructuredLLM (AIService, ResumeParser) in this process
+LLM_SLOTS = ConcurrencyLimit(LLM_MAX_CONCURRENCY)
+
+
+class StructuredLLM:
+    """
+    Wraps a chat model so JSON responses are schema-constrained, repaired
+    locally when slightly malformed, and fixed section-by-section when
+    they fail validation.
+
+    Example usage:
+        structured = StructuredLLM(llm)
+        research = structured.invoke_model(prompt, CompanyResearch)
+        review = structured.invoke_json(prompt)
+        print(structured.stats)
+    """
+
+    def __init__(
+        self,
+        llm,
+        enforce_schema: bool = LLM_STRUCTURED_OUTPUT,
+        section_retries: int = LLM_SECTION_RETRIES,
+        slots: ConcurrencyLimit = LLM_SLOTS
+    ):
+        """
+        Args:
+            llm: LangChain chat model
+            enforce_schema: Pass the JSON schema to the model as a response constraint
+            section_retries: Re-asks allowed per invalid top-level section
+            slots: Concurrency limit every request waits on (process-wide by default)
+        """
+        self.llm = llm
+        self.slots = slots
+        self.enforce_schema = enforce_schema
+        self.section_retries = section_retries
+        self._bound: Dict[Any, Any] = {}
+        self.stats = {'calls': 0, 'repaired': 0, 'section_retries': 0, 'failed': 0}
+
+    def invoke_json(self, prompt: str, schema: Optional[Type[BaseModel]] = None) -> Dict[str, Any]:
+        """
+        Invoke the model and return its JSON object response.
+
+        Args:
+            prompt: Prompt text
+            schema: Optional model whose JSON schema constrains the response
+                    (the result is not validated against it)
+
+        Returns:
+            Parsed dict
+
+        Raises:
+            ValueError: If the response is not a JSON object even after repair
+        """
+        self.stats['calls'] += 1
+        with self.slots.slot():
+            response = self._runnable(schema).invoke([HumanMessage(content=prompt)])
+        return self.parse(_response_text(response))
+
+    def invoke_model(
+        self,
+        prompt: str,
+        schema: Type[BaseModel],
+        prepare: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None
+    ) -> BaseModel:
+        """
+        Invoke the model and validate its response as a Pydantic model.
+
+        Top-level fields that fail validation are re-requested on their own
+        (with the original prompt as context) instead of rerunning the call.
+
+        Args:
+            prompt: Prompt text
+            schema: Pydantic model to validate against
+            prepare: Optional hook applied to the raw dict before each
+                     validation (e.g. fill defaults, revert forbidden edits)
+
+        Returns:
+            Validated schema instance
+
+        Raises:
+            ValueError: If validation still fails after section retries
+        """
+        return self.validate(prompt, schema, self.invoke_json(prompt, schema), prepare)
+
+    def validate(
+        self,
+        prompt: str,
+        schema: Type[BaseModel],
+        data: Dict[str, Any],
+        prepare: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None
+    ) -> BaseModel:
+        """
+        Validate an already-parsed response, re-requesting invalid sections.
+
+        Args:
+            prompt: Prompt that produced the response (context for retries)
+            schema: Pydantic model to validate against
+            data: Parsed response
+            prepare: Optional hook applied before each validation
+
+        Returns:
+            Validated schema instance
+
+        Raises:
+            ValueError: If validation still fails after section retries
+        """
+        retries: Dict[str, int] = {}
+
+        while True:
+            if prepare:
+                data = prepare(data)
+            try:
+                return schema.model_validate(data)
+            except ValidationError as e:
+                failed = self._failed_sections(e, schema, retries)
+                if not failed:
+                    self.stats['failed'] += 1
+                    raise ValueError(f"{schema.__name__} validation failed: {e}") from e
+
+            for field, problems in failed.items():
+                retries[field] = retries.get(field, 0) + 1
+                self.stats['section_retries'] += 1
+                print(f"    ↻ Re-requesting invalid '{field}' section")
+                data[field] = self._request_section(prompt, schema, field, data.get(field), problems)
+
+    def stream_text(self, prompt: str, schema: Optional[Type[BaseModel]] = None) -> Iterator[str]:
+        """
+        Stream the raw response text chunk by chunk (LangChain stream()).
+
+        Args:
+            prompt: Prompt text
+            schema: Optional model whose JSON schema constrains the response
+
+        Yields:
+            Text chunks; parse the joined text with parse()
+        """
+        self.stats['calls'] += 1
+        with self.slots.slot():
+            for chunk in self._runnable(schema).stream([HumanMessage(content=prompt)]):
+                text = _response_text(chunk)
+                if text:
+                    yield text
+
+    async def astream_text(self, prompt: str, schema: Optional[Type[BaseModel]] = None) -> AsyncIterator[str]:
+        """Async version of stream_text() (LangChain astream())."""
+        self.stats['calls'] += 1
+        async with self.slots.aslot():
+            async for chunk in self._runnable(schema).astream([HumanMessage(content=prompt)]):
+                text = _response_text(chunk)
+                if text:
+                    yield text
+
+    def parse(self, text: str) -> Dict[str, Any]:
+        """
+        Parse JSON text from a response, repairing it if needed.
+
+        Raises:
+            ValueError: If the text is not a JSON object even after repair
+        """
+        text = extract_json(text)
+        try:
+            return parse_llm_json(text)
+        except ValueError:
+            repaired = repair_json(text)
+            data = parse_llm_json(repaired)
+            self.stats['repaired'] += 1
+            return data
+
+    # ============================================================
+    # PRIVATE HELPER METHODS
+    # ============================================================
+
+    def _runnable(self, schema: Optional[Type[BaseModel]]):
+        """Chat model bound to JSON output (and the schema, if enforced); cached per schema."""
+        if not self.enforce_schema:
+            return self.llm
+        if schema not in self._bound:
+            kwargs = {'response_mime_type': 'application/json'}
+            if schema is not None:
+                kwargs['response_json_schema'] = schema.model_json_schema()
+            self._bound[schema] = self.llm.bind(**kwargs)
+        return self._bound[schema]
+
+    def _failed_sections(
+        self,
+        error: ValidationError,
+        schema: Type[BaseModel],
+        retries: Dict[str, int]
+    ) -> Dict[str, List[str]]:
+        """
+        Top-level fields named in a validation error, with their problems.
+
+        Returns an empty dict if any failing field is out of retries (or the
+        error is not attributable to a field), so the caller gives up.
+        """
+        failed: Dict[str, List[str]] = {}
+        for item in error.errors():
+            field = item['loc'][0] if item['loc'] else None
+            if field not in schema.model_fields or retries.get(field, 0) >= self.section_retries:
+                return {}
+            location = ".".join(str(part) for part in item['loc'])
+            failed.setdefault(field, []).append(f"{location}: {item['msg']}")
+        return failed
+
+    def _request_section(
+        self,
+        prompt: str,
+        schema: Type[BaseModel],
+        field: str,
+        previous: Any,
+        problems: List[str]
+    ) -> Any:
+        """Ask the model for one corrected top-level section."""
+        section = create_model(
+            f"{schema.__name__}{field.title().replace('_', '')}Section",
+            **{field: (schema.model_fields[field].annotation, ...)}
+        )
+        retry_prompt = f"""{prompt}
+
+=== CORRECTION NEEDED ===
+Your previous answer had a missing or invalid "{field}" section:
+{to_json(previous, fallback=str).decode()[:2000]}
+
+Problems:
+{chr(10).join(f"- {problem}" for problem in problems[:10])}
+
+Return ONLY a JSON object of the form {{"{field}": ...}} with a corrected "{field}" value.
+
+JSON:"""
+        data = self.invoke_json(retry_prompt, section)
+        return data.get(field, previous)
+
+
+class ArrayItemStream:
+    """
+    Picks the string items of one array field out of a JSON object as it
+    streams in, so each item can be used as soon as its closing quote
+    arrives instead of after the whole response.
+
+    Example usage:
+        paragraphs = ArrayItemStream("paragraphs")
+        for chunk in structured.stream_text(prompt, CoverLetter):
+            for paragraph in paragraphs.feed(chunk):
+                print(paragraph)
+        data = structured.parse(paragraphs.text)
+    """
+
+    _ITEM = re.compile(r'[\s,]*("(?:[^"\\]|\\.)*")', re.DOTALL)
+    _END = re.compile(r'[\s,]*\]')
+
+    def __init__(self, field: str):
+        """
+        Args:
+            field: Name of the array field whose items are streamed
+        """
+        self._start = re.compile(rf'"{re.escape(field)}"\s*:\s*\[')
+        self._chunks: List[str] = []
+        self._buffer = ""
+        self._pos: Optional[int] = None  # scan position inside the array
+        self.done = False
+        self.items: List[str] = []
+
+    @property
+    def text(self) -> str:
+        """All text fed so far"""
+        return "".join(self._chunks)
+
+    def feed(self, chunk: str) -> List[str]:
+        """
+        Add a chunk of response text.
+
+        Returns:
+            Items completed by this chunk (usually zero or one)
+        """
+        self._chunks.append(chunk)
+        if self.done:
+            return []
+        self._buffer += chunk
+
+        if self._pos is None:
+            start = self._start.search(self._buffer)
+            if not start:
+                return []
+            self._pos = start.end()
+
+        completed = []
+        while True:
+            item = self._ITEM.match(self._buffer, self._pos)
+            if not item:
+                self.done = self._END.match(self._buffer, self._pos) is not None
+                break
+            try:
+                completed.append(json.loads(item.group(1), strict=False))
+            except ValueError:
+                completed.append(item.group(1)[1:-1])
+            self._pos = item.end()
+
+        self.items.extend(completed)
+        return completed
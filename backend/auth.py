@@ -0,0 +1,101 @@
+"""
+JWT verification with a cache of verified claims and a revocation list.
+
+Decoding and checking an HS256 signature on every request is wasted work
+for a token seen a moment ago, so verified claims are cached by token
+digest (never past the token's own exp). Logged-out tokens go into a
+revocation list until they would have expired anyway.
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+import jwt
+from jwt import PyJWTError
+
+
+class TokenVerifier:
+    """
+    tokens = TokenVerifier(secret, "HS256")
+    claims = tokens.verify(token)   # ValueError if invalid, expired or revoked
+    tokens.revoke(token)            # logout
+    """
+
+    def __init__(self, secret, algorithm, cache_size=10000, cache_ttl=300):
+        """
+        secret / algorithm: JWT signing key and algorithm
+        cache_size: Verified tokens kept (least recently used are dropped)
+        cache_ttl: Seconds a verified token is trusted before being re-checked
+        """
+        self.secret = secret
+        self.algorithm = algorithm
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        self._cache = OrderedDict()  # digest -> (claims, trusted until)
+        self._revoked = {}  # digest -> exp
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "rejected": 0, "revoked": 0}
+
+    def verify(self, token):
+        """
+        Claims of a valid token; a dict lookup if it was verified recently.
+        Raises ValueError if the token is invalid, expired or revoked.
+        The returned dict is shared: don't modify it.
+        """
+        digest = _digest(token)
+        now = time.time()
+        with self._lock:
+            if digest in self._revoked:
+                self.stats["rejected"] += 1
+                raise ValueError("Token has been revoked")
+            cached = self._cache.get(digest)
+            if cached is not None and now < cached[1]:
+                self._cache.move_to_end(digest)
+                self.stats["hits"] += 1
+                return cached[0]
+
+        claims = self.decode(token)
+        with self._lock:
+            self.stats["misses"] += 1
+            self._cache[digest] = (claims, min(now + self.cache_ttl, claims["exp"]))
+            self._cache.move_to_end(digest)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return claims
+
+    def decode(self, token):
+        """
+        Decode/verify a token without the cache.
+        Raises ValueError if token is invalid/expired/missing required claims
+        """
+        try:
+            return jwt.decode(
+                token,
+                key=self.secret,
+                algorithms=[self.algorithm],
+                options={"require": ["sub", "exp", "iat"]},
+            )
+        except PyJWTError as e:
+            with self._lock:
+                self.stats["rejected"] += 1
+            raise ValueError(f"Invalid or expired token: {e}")
+
+    def revoke(self, token):
+        """
+        Revoke a token (logout) until its exp.
+        Raises ValueError if the token is not valid in the first place.
+        """
+        claims = self.verify(token)
+        digest = _digest(token)
+        now = time.time()
+        with self._lock:
+            self._cache.pop(digest, None)
+            # expired tokens fail verification anyway: stop tracking them
+            self._revoked = {d: exp for d, exp in self._revoked.items() if exp > now}
+            self._revoked[digest] = claims["exp"]
+            self.stats["revoked"] += 1
+
+
+def _digest(token):
+    return hashlib.sha256(token.encode("utf-8")).digest()
@@ -0,0 +1,552 @@
+"""
+Load tests for the backend API.
+
+Run from this directory, e.g.:
+  python benchmarks.py logins --requests 200 --latency-ms 20
+  python benchmarks.py signups --requests 8 --rounds 12
+  python benchmarks.py indexes --users 1000000
+  python benchmarks.py auth --calls 20000
+  python benchmarks.py ratelimit --users 1000 --calls 50000
+  python benchmarks.py catalog --jobs 100000
+  python benchmarks.py recommendations --users 2000 --jobs 20000
+  python benchmarks.py http_cache --requests 200
+
+Each benchmark runs the app in-process against an in-memory Mongo
+stand-in (mongomock, or IndexedCollection where index use matters) and
+needs no database server.
+"""
+import argparse
+import asyncio
+import os
+import threading
+import time
+
+os.environ.setdefault("DATABASE", "mongodb://localhost:27017")
+os.environ.setdefault("JWT_SECRET", "benchmark-secret-at-least-32-bytes-long")
+
+import bcrypt
+import httpx
+import mongomock
+from bson import ObjectId
+from cryptography.fernet import Fernet
+
+os.environ.setdefault("FIELD_ENCRYPTION_KEY", Fernet.generate_key().decode())
+
+import main as api
+import security
+from catalog import JobCatalog, location_keys
+from recommendations import Recommender
+from db import UsersRepository
+from ratelimit import RateLimiter, parse_limits
+from jobs import JobQueue
+
+
+class SlowCollection:
+    """Wraps a mongomock collection and adds a network round-trip delay to every call"""
+
+    def __init__(self, collection, latency):
+        self.collection = collection
+        self.latency = latency
+
+    def __getattr__(self, name):
+        attr = getattr(self.collection, name)
+        if not callable(attr):
+            return attr
+
+        def call(*args, **kwargs):
+            time.sleep(self.latency)  # releases the GIL like a socket wait
+            return attr(*args, **kwargs)
+        return call
+
+
+class IndexedCollection:
+    """
+    In-memory collection that honours single-field indexes the way Mongo
+    does: equality lookups on an indexed field are a hash lookup, anything
+    else scans every document. (mongomock always scans.)
+    """
+
+    def __init__(self):
+        self.docs = []
+        self.indexes = {"_id_": {"key": [("_id", 1)]}}
+        self._lookup = {}  # field -> {value: document}
+
+    def insert_many(self, documents):
+        for document in documents:
+            self.insert_one(document)
+
+    def insert_one(self, document):
+        document.setdefault("_id", ObjectId())
+        self.docs.append(document)
+        for field, lookup in self._lookup.items():
+            if field in document:
+                lookup[document[field]] = document
+        return type("InsertOneResult", (), {"inserted_id": document["_id"]})
+
+    def find_one(self, query, projection=None):
+        (field, value), = query.items()
+        if field in self._lookup:
+            document = self._lookup[field].get(value)
+        else:
+            document = next((d for d in self.docs if d.get(field) == value), None)
+        if document is None or not projection:
+            return document
+        if all(projection.values()):
+            keep = [f for f in projection if f in document] + (["_id"] if projection.get("_id", 1) else [])
+            return {f: document[f] for f in keep}
+        return {f: v for f, v in document.items() if projection.get(f, 1)}
+
+    def create_indexes(self, models):
+        for model in models:
+            spec = model.document
+            (field, _), = spec["key"].items()
+            self.indexes[spec["name"]] = {"key": list(spec["key"].items())}
+            self._lookup[field] = {d[field]: d for d in self.docs if field in d}
+        return [model.document["name"] for model in models]
+
+    def index_information(self):
+        return self.indexes
+
+
+class BlockingUsersRepository(UsersRepository):
+    """Previous behaviour: pymongo called directly on the event loop thread"""
+
+    async def _run(self, fn, *args, **kwargs):
+        return fn(*args, **kwargs)
+
+
+def _seed_users(count):
+    collection = mongomock.MongoClient().db.users
+    pwd_hash = bcrypt.hashpw(b"password", bcrypt.gensalt(rounds=4)).decode("utf-8")  # cheap: time the DB path, not bcrypt
+    collection.insert_many([
+        {"email": f"user{i}@example.com", "password": pwd_hash, "role": "free_user"}
+        for i in range(count)
+    ])
+    return collection
+
+
+async def _concurrent_logins(requests, users):
+    transport = httpx.ASGITransport(app=api.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        async def login(i):
+            form = {"email": f"user{i % users}@example.com", "password": "password"}
+            response = await client.request("GET", "/login", data=form)
+            return response.status_code
+
+        return await asyncio.gather(*(login(i) for i in range(requests)))
+
+
+async def _concurrent_signups(requests, prefix):
+    transport = httpx.ASGITransport(app=api.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        async def signup(i):
+            form = {
+                "email": f"{prefix}{i}@example.com", "password": "password", "first_name": "Jordan",
+                "last_name": "Lee", "phone": "555-123-4567", "linkedin": "linkedin.com/in/jordan",
+                "github": "github.com/jordan", "location": "Calgary", "gender": "I do not wish to answer",
+                "indigenous": "No", "disability": "No", "lgbtq": "No", "minority": "No",
+            }
+            response = await client.request("GET", "/signup", data=form)
+            return response.status_code
+
+        return await asyncio.gather(*(signup(i) for i in range(requests)))
+
+
+def _rate(label, count, fn):
+    """Run fn, print and return throughput in operations per second"""
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    rate = count / elapsed if elapsed > 0 else float("inf")
+    print(f"  {label:<40} {rate:>10.1f} /s  ({elapsed:.3f}s for {count})")
+    return rate
+
+
+# ============================================================
+# DATABASE ACCESS
+# ============================================================
+
+def bench_logins(args):
+    """Concurrent logins with DB calls on the event loop vs offloaded to the pool"""
+    collection = SlowCollection(_seed_users(args.users), args.latency_ms / 1000)
+    n = args.requests
+
+    print(f"\nConcurrent logins ({n} requests, {args.latency_ms} ms per DB round-trip)")
+    results = {}
+    for label, repository in [
+        ("blocking pymongo calls", BlockingUsersRepository(collection)),
+        ("thread pool offload", UsersRepository(collection)),
+    ]:
+        api.users = repository
+        results[label] = _rate(label, n, lambda: asyncio.run(_concurrent_logins(n, args.users)))
+        codes = set(asyncio.run(_concurrent_logins(5, args.users)))
+        repository.close()
+        if codes != {200}:
+            print(f"  ⚠ unexpected status codes: {codes}")
+    print(f"  speedup: {results['thread pool offload'] / results['blocking pymongo calls']:.1f}x")
+
+
+# ============================================================
+# PASSWORD HASHING
+# ============================================================
+
+def bench_signups(args):
+    """Signups/second: bcrypt on every field on the event loop vs one pooled hash + encryption"""
+    security.bcrypt_rounds = args.rounds
+    n = args.requests
+
+    async def inline_hash(pwd):
+        return security.hash_(pwd)
+
+    print(f"\nConcurrent signups ({n} requests, bcrypt cost {args.rounds}, {security.bcrypt_workers} hashing threads)")
+    results = {}
+    for label, hash_password, encrypt_field in [
+        ("bcrypt x12 on the event loop", inline_hash, security.hash_),
+        ("pooled bcrypt + field encryption", security.hash_password, security.encrypt_field),
+    ]:
+        api.users = UsersRepository(mongomock.MongoClient().db.users)
+        api.hash_password, api.encrypt_field = hash_password, encrypt_field
+        codes = []
+        results[label] = _rate(label, n, lambda: codes.extend(asyncio.run(_concurrent_signups(n, "user"))))
+        api.users.close()
+        if set(codes) != {201}:
+            print(f"  ⚠ unexpected status codes: {set(codes)}")
+    print(f"  speedup: {results['pooled bcrypt + field encryption'] / results['bcrypt x12 on the event loop']:.1f}x")
+
+
+# ============================================================
+# INDEXES
+# ============================================================
+
+def bench_indexes(args):
+    """Login-path lookups on a large users collection before and after ensure_indexes()"""
+    from db import LOGIN_FIELDS
+
+    print(f"\nSeeding {args.users:,} synthetic users...")
+    collection = IndexedCollection()
+    profile = security.encrypt_field("Jordan")
+    collection.insert_many(
+        {"email": f"user{i}@example.com", "password": "$2b$12$" + "x" * 53, "role": "free_user",
+         "first_name": profile, "last_name": profile, "location": profile}
+        for i in range(args.users)
+    )
+    users = UsersRepository(collection)
+    n = args.lookups
+    emails = [f"user{(i * 7919) % args.users}@example.com" for i in range(n)]
+
+    async def lookups():
+        for email in emails:
+            assert await users.find_by_email(email, LOGIN_FIELDS) is not None
+        await users.email_exists("nobody@example.com")
+
+    print(f"\nUser lookups ({n} logins, {args.users:,} users)")
+    print(f"  missing indexes: {asyncio.run(users.missing_indexes())}")
+    before = _rate("no indexes (collection scan)", n, lambda: asyncio.run(lookups()))
+    asyncio.run(users.ensure_indexes())
+    print(f"  missing indexes: {asyncio.run(users.missing_indexes())}")
+    after = _rate("after ensure_indexes()", n, lambda: asyncio.run(lookups()))
+    print(f"  speedup: {after / before:.0f}x")
+    users.close()
+
+
+# ============================================================
+# AUTHENTICATION
+# ============================================================
+
+def bench_auth(args):
+    """Token verification: full HS256 decode vs cached claims"""
+    token = api.create_access_token("6650a1f2c3d4e5f6a7b8c9d0", "free_user")
+    n = args.calls
+
+    print(f"\nJWT verification ({n} calls)")
+    before = _rate("jwt.decode every request", n, lambda: [api.tokens.decode(token) for _ in range(n)])
+    after = _rate("TokenVerifier.verify (cached)", n, lambda: [api.tokens.verify(token) for _ in range(n)])
+    print(f"  speedup: {after / before:.1f}x")
+
+
+# ============================================================
+# RATE LIMITING
+# ============================================================
+
+def bench_ratelimit(args):
+    """Limiter checks/second, and a burst of submissions from one user through the API"""
+    limiter = RateLimiter(parse_limits("free_user=10/3600,admin=unlimited"))
+    n = args.calls
+    users = [str(i) for i in range(args.users)]
+
+    print(f"\nToken bucket checks ({n} calls, {args.users} users)")
+    _rate("RateLimiter.check", n, lambda: [limiter.check(users[i % args.users], "free_user") for i in range(n)])
+    print(f"  {limiter.snapshot()['store']}")
+
+    #only accepted jobs take a token: invalid submissions (400) and a full queue (503) do not
+    api.limiter = RateLimiter(parse_limits("free_user=3/3600"))
+    token = api.create_access_token("6650a1f2c3d4e5f6a7b8c9d0", "free_user")
+    headers = {"Authorization": f"Bearer {token}"}
+    valid = {"job_description": "Python developer", "company_name": "Acme", "position": "Developer"}
+
+    async def submit(count, data, files=None):
+        transport = httpx.ASGITransport(app=api.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            responses = [await client.post("/cl_builder", data=data, files=files, headers=headers) for _ in range(count)]
+        return [(r.status_code, r.headers.get("Retry-After")) for r in responses]
+
+    #no workers: queued jobs stay queued, so the queue fills up
+    queue_kwargs = {"workers": 0, "on_evict": lambda job: api.remove_upload(job.params["resume_path"])}
+    api.job_queue = JobQueue(api.job_queue.handlers, api.job_queue.service_factory, max_queued=2, **queue_kwargs)
+    results = asyncio.run(submit(3, {}))
+    results += asyncio.run(submit(4, valid, {"resume": ("resume.pdf", b"%PDF-1.4", "application/pdf")}))
+    api.job_queue = JobQueue(api.job_queue.handlers, api.job_queue.service_factory, max_queued=20, **queue_kwargs)
+    results += asyncio.run(submit(3, valid, {"resume": ("resume.pdf", b"%PDF-1.4", "application/pdf")}))
+    print("\nSubmissions, limit 3/hour: 3 invalid, 4 with room for 2 jobs, 3 more with room")
+    print(f"  status codes: {[code for code, _ in results]}")
+    print(f"  Retry-After: {max(int(after) for code, after in results if code == 429)}s")
+    print(f"  stats: {api.limiter.snapshot()['stats']}")
+
+
+# ============================================================
+# JOB CATALOG
+# ============================================================
+
+def _synthetic_postings(count, taxonomy):
+    """Postings mentioning 3-6 taxonomy skills each, in a handful of locations"""
+    import random
+    rng = random.Random(0)
+    skills = sorted(taxonomy.taxonomy)
+    locations = ["Calgary, AB", "Edmonton, AB", "Toronto, ON", "Vancouver, BC", "Montreal, QC", "Remote"]
+    for i in range(count):
+        mentioned = rng.sample(skills, rng.randint(3, 6))
+        yield {
+            "id": f"{i:024x}",
+            "title": f"Software Developer {i}",
+            "company": f"Company {i % 500}",
+            "location": rng.choice(locations),
+            "description": "We are hiring. Experience with " + ", ".join(mentioned) + " is required.",
+        }
+
+
+def bench_catalog(args):
+    """Filtered job searches: scanning every posting vs intersecting posting lists"""
+    catalog = JobCatalog(api.create_taxonomy())
+    postings = list(_synthetic_postings(args.jobs, catalog.taxonomy))
+
+    print(f"\nIndexing {args.jobs:,} postings (skills extracted once per posting)")
+    _rate("prepare + add", args.jobs, lambda: catalog.load(postings))
+    print(f"  {catalog.stats()}")
+
+    queries = [
+        (["python"], None),
+        (["python", "aws"], None),
+        (["react", "typescript"], "calgary"),
+        (["docker", "kubernetes", "python"], "remote"),
+        ([], "toronto"),
+    ]
+    n = args.queries
+
+    def scan(skills, location):
+        """Previous approach: test every posting, then sort the matches"""
+        matches = [
+            p for p in postings
+            if all(skill in p["skills"] for skill in skills)
+            and (not location or location in location_keys(p["location"]))
+        ]
+        matches.sort(key=lambda p: p["id"], reverse=True)
+        return [p["id"] for p in matches[:20]]
+
+    print(f"\nFiltered searches ({n} of each query, first page of 20)")
+    for skills, location in queries:
+        label = ",".join(skills or ["*"]) + (f" @{location}" if location else "")
+        indexed = [job["id"] for job in catalog.search(skills, location, limit=20)[0]]
+        if indexed != scan(skills, location):
+            print(f"  ⚠ results differ for {label}")
+        before = _rate(f"{label} scan", n, lambda: [scan(skills, location) for _ in range(n)])
+        after = _rate(f"{label} index", n, lambda: [catalog.search(skills, location, limit=20) for _ in range(n)])
+        print(f"  speedup: {after / before:.0f}x")
+
+    cursor, pages = None, 0
+    start = time.perf_counter()
+    while True:
+        _, cursor = catalog.search(["python"], None, cursor=cursor, limit=100)
+        pages += 1
+        if cursor is None:
+            break
+    print(f"\n  paged through every python job: {pages} pages of 100 in {time.perf_counter() - start:.3f}s")
+
+    #postings are added/removed on the event loop while searches run on the threadpool
+    print(f"\nConcurrent add/remove while searching ({args.writes} writes)")
+    errors, stop = [], threading.Event()
+
+    def search_loop():
+        cursor = None
+        while not stop.is_set():
+            try:
+                _, cursor = catalog.search(["python"], None, cursor=cursor, limit=20)
+                catalog.search([], "calgary", limit=20)
+            except Exception as e:
+                errors.append(e)
+                return
+
+    searcher = threading.Thread(target=search_loop)
+    searcher.start()
+    extra = list(_synthetic_postings(args.jobs + args.writes, catalog.taxonomy))[args.jobs:]
+    for i, posting in enumerate(extra):
+        catalog.add(catalog.prepare(posting))
+        if i % 2:
+            catalog.remove(posting["id"])
+    stop.set()
+    searcher.join()
+    if errors:
+        print(f"  ⚠ search failed during writes: {errors[0]!r}")
+    else:
+        print(f"  ✓ no errors ({catalog.stats()['jobs']:,} postings)")
+
+
+# ============================================================
+# HTTP CACHING
+# ============================================================
+
+def bench_http_cache(args):
+    """Bytes sent for a repeatedly fetched JSON page: plain, compressed, revalidated"""
+    api.catalog.load(_synthetic_postings(1000, api.catalog.taxonomy))
+    url = "/jobs?limit=100"
+    n = args.requests
+
+    async def fetch(headers, revalidate):
+        transport = httpx.ASGITransport(app=api.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            first = await client.get(url, headers=headers)
+            start = time.perf_counter()
+            sent = 0
+            for _ in range(n):
+                if revalidate:
+                    headers = {**headers, "If-None-Match": first.headers["etag"]}
+                response = await client.get(url, headers=headers)
+                sent += int(response.headers.get("content-length", len(response.content)))
+            return first, sent, time.perf_counter() - start
+
+    print(f"\nGET {url} x{n}")
+    for label, headers, revalidate in (
+        ("identity", {"Accept-Encoding": "identity"}, False),
+        ("gzip", {"Accept-Encoding": "gzip"}, False),
+        ("br, gzip", {"Accept-Encoding": "br, gzip"}, False),
+        ("If-None-Match", {"Accept-Encoding": "gzip"}, True),
+    ):
+        first, sent, elapsed = asyncio.run(fetch(headers, revalidate))
+        print(f"  {label:<14} {first.headers.get('content-encoding', '-'):<6} {sent / n:>8,.0f} B/request  {n / elapsed:,.0f} req/s")
+
+
+# ============================================================
+# RECOMMENDATIONS
+# ============================================================
+
+def bench_recommendations(args):
+    """Serving precomputed recommendations vs ranking on demand, and incremental vs full updates"""
+    import numpy as np
+    rng = np.random.default_rng(0)
+
+    def encode(texts):
+        """Random unit vectors standing in for the sentence transformer (model time is not measured)"""
+        vectors = rng.standard_normal((len(texts), 384)).astype(np.float32)
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    taxonomy = api.create_taxonomy()
+    skills = sorted(taxonomy.taxonomy)
+    postings = [
+        {"id": f"{i:024x}", "title": f"Developer {i}", "description": "",
+         "skills": [skills[(i * 7 + j) % len(skills)] for j in range(4)]}
+        for i in range(args.jobs)
+    ]
+    embeddings = {posting["id"]: vector.tobytes() for posting, vector in zip(postings, encode([p["title"] for p in postings]))}
+
+    recommender = Recommender(encode, taxonomy, top_k=20)
+    recommender.start(postings, embeddings)
+    recommender.flush()
+
+    n = args.users
+    print(f"\nScoring {n:,} users against {args.jobs:,} jobs (top 20 each)")
+    for i in range(n):
+        recommender.update_user(f"user{i}", f"Resume {i}: " + ", ".join(rng.choice(skills, 5)))
+    _rate("full recompute (users scored)", n, recommender.flush)
+
+    print("\nServing one user's recommendations")
+    calls = args.calls
+    users = list(recommender._users.values())
+    job_vectors = recommender._vectors[:args.jobs]
+
+    def on_demand():
+        for i in range(calls):
+            scores = job_vectors @ users[i % n]["vector"]
+            np.argpartition(-scores, 20)[:20]
+
+    before = _rate("rank every job per request", calls, on_demand)
+    after = _rate("precomputed table lookup", calls, lambda: [recommender.recommendations(f"user{i % n}") for i in range(calls)])
+    print(f"  speedup: {after / before:.0f}x")
+
+    print("\nCatalog changes (every user's top 20 kept current)")
+    start = time.perf_counter()
+    for i in range(10):
+        recommender.job_added({"id": f"{args.jobs + i:024x}", "title": "New", "description": "", "skills": skills[i:i + 4]})
+    recommender.flush()
+    added = time.perf_counter() - start
+    print(f"  10 new jobs merged into {n:,} users' top 20: {added * 1000:.1f} ms")
+
+    start = time.perf_counter()
+    recommender.job_removed(f"{0:024x}")
+    recommender.flush()
+    print(f"  1 job removed: {(time.perf_counter() - start) * 1000:.1f} ms")
+    print(f"  {recommender.snapshot()}")
+    recommender.stop()
+
+
+def main():
+    """Benchmark entry point"""
+    parser = argparse.ArgumentParser(description="Backend load tests")
+    subparsers = parser.add_subparsers(dest="benchmark", required=True)
+
+    logins = subparsers.add_parser("logins", help="Concurrent logins/second against a mongomock stand-in")
+    logins.add_argument("--requests", type=int, default=200, help="Concurrent login requests")
+    logins.add_argument("--users", type=int, default=1000, help="Users in the collection")
+    logins.add_argument("--latency-ms", type=float, default=20, help="Simulated DB round-trip time")
+    logins.set_defaults(func=bench_logins)
+
+    signups = subparsers.add_parser("signups", help="Signups/second with pooled password hashing")
+    signups.add_argument("--requests", type=int, default=8, help="Concurrent signup requests")
+    signups.add_argument("--rounds", type=int, default=security.bcrypt_rounds, help="bcrypt cost factor")
+    signups.set_defaults(func=bench_signups)
+
+    indexes = subparsers.add_parser("indexes", help="Lookups/second on a large collection with and without indexes")
+    indexes.add_argument("--users", type=int, default=1_000_000, help="Synthetic users in the collection")
+    indexes.add_argument("--lookups", type=int, default=50, help="Login lookups to time")
+    indexes.set_defaults(func=bench_indexes)
+
+    auth = subparsers.add_parser("auth", help="Token verifications/second with and without the claims cache")
+    auth.add_argument("--calls", type=int, default=20000, help="Verifications of each kind to time")
+    auth.set_defaults(func=bench_auth)
+
+    ratelimit = subparsers.add_parser("ratelimit", help="Rate limiter checks/second and 429s for a burst")
+    ratelimit.add_argument("--calls", type=int, default=50000, help="Limiter checks to time")
+    ratelimit.add_argument("--users", type=int, default=1000, help="Distinct users (buckets)")
+    ratelimit.set_defaults(func=bench_ratelimit)
+
+    catalog = subparsers.add_parser("catalog", help="Job searches/second by skill and location at catalog scale")
+    catalog.add_argument("--jobs", type=int, default=100_000, help="Synthetic postings in the catalog")
+    catalog.add_argument("--queries", type=int, default=20, help="Searches of each kind to time")
+    catalog.add_argument("--writes", type=int, default=2000, help="Postings added/removed during the concurrent search check")
+    catalog.set_defaults(func=bench_catalog)
+
+    recommendations = subparsers.add_parser("recommendations", help="Precomputed recommendations: lookups and incremental updates")
+    recommendations.add_argument("--users", type=int, default=2000, help="Users with a resume on file")
+    recommendations.add_argument("--jobs", type=int, default=20000, help="Jobs in the catalog")
+    recommendations.add_argument("--calls", type=int, default=200, help="Recommendation requests to time")
+    recommendations.set_defaults(func=bench_recommendations)
+
+    http_cache = subparsers.add_parser("http_cache", help="Response bytes with compression and ETag revalidation")
+    http_cache.add_argument("--requests", type=int, default=200, help="Repeat fetches of the same page")
+    http_cache.set_defaults(func=bench_http_cache)
+
+    args = parser.parse_args()
+    args.func(args)
+    return 0
+
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,165 @@
+"""
+Job catalog: postings tagged with the skills they mention, searchable by
+skill and location.
+
+Each posting's skills are extracted once, when it is added
+(SkillTaxonomyManager.extract_known_skills), and stored with it. The
+catalog keeps an inverted index from each skill and location to the set
+of job IDs that have it, so a filter query intersects a few posting lists
+(starting from the smallest) instead of scanning every posting. Results
+are newest first (job IDs are Mongo ObjectId strings, which sort by
+creation time) and paged with a cursor: the last job ID of the previous
+page.
+
+Searches run on the request threadpool while postings are added and
+removed on the event loop, so every read and write of the index holds
+the catalog's lock (a search never iterates a set that is being changed).
+"""
+import heapq
+import threading
+from bisect import bisect_left, insort
+
+"""
+Fields returned in search results (the description is only in get())
+"""
+SUMMARY_FIELDS = ("id", "title", "company", "location", "url", "posted", "skills")
+
+
+"""
+Index keys for a location: the whole location and each comma separated part,
+lowercased ("Calgary, AB" -> {"calgary, ab", "calgary", "ab"})
+"""
+def location_keys(location):
+    location = (location or "").strip().lower()
+    if not location:
+        return set()
+    return {location, *(part.strip() for part in location.split(",") if part.strip())}
+
+
+class JobCatalog:
+    """
+    catalog = JobCatalog(SkillTaxonomyManager())
+    catalog.add(catalog.prepare({"id": job_id, "title": ..., "location": ..., "description": ...}))
+    jobs, next_cursor = catalog.search(skills=["python", "aws"], location="calgary", limit=20)
+    jobs, next_cursor = catalog.search(skills=["python", "aws"], location="calgary", cursor=next_cursor)
+    """
+
+    def __init__(self, taxonomy):
+        """
+        taxonomy: SkillTaxonomyManager used to tag postings with skills
+        """
+        self.taxonomy = taxonomy
+        self._postings = {}  # job ID -> posting
+        self._ids = []  # every job ID, sorted
+        self._by_skill = {}  # skill -> set of job IDs
+        self._by_location = {}  # location key -> set of job IDs
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._postings)
+
+    def prepare(self, posting):
+        """
+        Add the posting's skills (taxonomy skills in its title and description)
+        unless they were stored with it already; returns the posting
+        """
+        if "skills" not in posting:
+            text = f"{posting.get('title', '')}\n{posting.get('description', '')}"
+            posting["skills"] = self.taxonomy.extract_known_skills(text)
+        return posting
+
+    def load(self, postings):
+        """Index stored postings (e.g. at startup); returns the number indexed"""
+        count = 0
+        for posting in postings:
+            self.add(self.prepare(posting))
+            count += 1
+        return count
+
+    def add(self, posting):
+        """Index a prepared posting (replacing any posting with the same ID)"""
+        with self._lock:
+            self._add(posting)
+
+    def _add(self, posting):
+        job_id = posting["id"]
+        if job_id in self._postings:
+            self._remove(job_id)
+        self._postings[job_id] = posting
+        if not self._ids or job_id > self._ids[-1]:
+            self._ids.append(job_id)  # new ObjectIds sort last
+        else:
+            insort(self._ids, job_id)
+        for skill in posting["skills"]:
+            self._by_skill.setdefault(skill, set()).add(job_id)
+        for key in location_keys(posting.get("location")):
+            self._by_location.setdefault(key, set()).add(job_id)
+
+    def remove(self, job_id):
+        """Drop a posting from the catalog; returns it, or None if it was not there"""
+        with self._lock:
+            return self._remove(job_id)
+
+    def _remove(self, job_id):
+        posting = self._postings.pop(job_id, None)
+        if posting is None:
+            return None
+        del self._ids[bisect_left(self._ids, job_id)]
+        for index, keys in ((self._by_skill, posting["skills"]), (self._by_location, location_keys(posting.get("location")))):
+            for key in keys:
+                ids = index.get(key)
+                if ids is not None:
+                    ids.discard(job_id)
+                    if not ids:
+                        del index[key]
+        return posting
+
+    def get(self, job_id):
+        """Full posting, or None"""
+        with self._lock:
+            return self._postings.get(job_id)
+
+    def search(self, skills=(), location=None, cursor=None, limit=20):
+        """
+        Postings (summary fields) having every given skill and matching the
+        location, newest first, at most limit of them after the cursor.
+        Returns (postings, next_cursor); next_cursor is None on the last page
+        """
+        skills = [skill.strip().lower() for skill in skills if skill.strip()]
+        location = (location or "").strip().lower()
+
+        with self._lock:
+            if not skills and not location:
+                end = len(self._ids) if cursor is None else bisect_left(self._ids, cursor)
+                page = self._ids[max(0, end - limit - 1):end][::-1]
+            else:
+                lists = [self._by_skill.get(skill, set()) for skill in skills]
+                if location:
+                    lists.append(self._by_location.get(location, set()))
+                lists.sort(key=len)
+                #intersect from the smallest posting list; every later step only shrinks it
+                matches = lists[0].intersection(*lists[1:]) if len(lists) > 1 else lists[0]
+                if cursor is not None:
+                    matches = (job_id for job_id in matches if job_id < cursor)
+                page = heapq.nlargest(limit + 1, matches)
+
+            next_cursor = page[limit - 1] if len(page) > limit else None
+            return [self._summary(job_id) for job_id in page[:limit]], next_cursor
+
+    def summary(self, job_id):
+        """Summary fields of a posting, or None if it is not in the catalog"""
+        with self._lock:
+            return self._summary(job_id) if job_id in self._postings else None
+
+    def _summary(self, job_id):
+        posting = self._postings[job_id]
+        return {field: posting.get(field) for field in SUMMARY_FIELDS}
+
+    def stats(self):
+        """Catalog size and index sizes"""
+        with self._lock:
+            return {
+                "jobs": len(self._postings),
+                "skills": len(self._by_skill),
+                "locations": len(self._by_location),
+            }
@@ -0,0 +1,167 @@
+"""
+Database access for the backend.
+
+pymongo is synchronous, so every call goes through a bounded thread pool:
+the event loop keeps serving other requests during a DB round-trip instead
+of blocking on it. The pool matches the client's connection pool size, so
+threads never queue for a connection they can't get.
+"""
+import asyncio
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import pymongo
+from bson import ObjectId
+from pymongo import ASCENDING, IndexModel
+
+"""
+Connection pool and timeout settings (environment variables)
+"""
+mongo_max_pool_size = int(os.environ.get("MONGO_MAX_POOL_SIZE", "50"))
+mongo_min_pool_size = int(os.environ.get("MONGO_MIN_POOL_SIZE", "0"))
+mongo_timeout_ms = int(os.environ.get("MONGO_TIMEOUT_MS", "5000"))  # server selection / connect / pool wait
+mongo_socket_timeout_ms = int(os.environ.get("MONGO_SOCKET_TIMEOUT_MS", "10000"))  # per operation
+
+
+"""
+Create the MongoClient with the configured pool size and timeouts
+(connections are opened lazily, on first use)
+"""
+def create_client(uri):
+    return pymongo.MongoClient(
+        uri,
+        maxPoolSize=mongo_max_pool_size,
+        minPoolSize=mongo_min_pool_size,
+        serverSelectionTimeoutMS=mongo_timeout_ms,
+        connectTimeoutMS=mongo_timeout_ms,
+        waitQueueTimeoutMS=mongo_timeout_ms,
+        socketTimeoutMS=mongo_socket_timeout_ms,
+    )
+
+
+"""
+Indexes the users collection needs; created at startup by ensure_indexes()
+- email: every login/signup looks users up by email (unique: one account per email)
+Profile lookups go by _id (the token subject), which MongoDB always indexes
+"""
+USER_INDEXES = [
+    IndexModel([("email", ASCENDING)], name="email_unique", unique=True),
+]
+
+"""
+Projections: fetch only the fields a handler uses
+"""
+LOGIN_FIELDS = {"password": 1, "role": 1}
+PROFILE_FIELDS = {"password": 0}
+
+
+class Repository:
+    """Async access to one collection: pymongo calls run on a bounded thread pool"""
+
+    def __init__(self, collection, workers=mongo_max_pool_size):
+        self.col = collection
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="mongo")
+
+    async def _run(self, fn, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(fn, *args, **kwargs))
+
+    def close(self):
+        self._executor.shutdown(wait=False)
+
+
+class UsersRepository(Repository):
+    """
+    Async access to the users collection.
+
+    users = UsersRepository(db["users"])
+    await users.ensure_indexes()
+    user = await users.find_by_email(email, LOGIN_FIELDS)
+    user_id = await users.insert({...})
+    """
+
+    async def find_by_email(self, email, fields=None):
+        """User document with this email (only the given fields plus _id), or None"""
+        return await self._run(self.col.find_one, {"email": email}, fields)
+
+    async def email_exists(self, email):
+        """True if an account uses this email (covered by the email index: no document fetch)"""
+        return await self._run(self.col.find_one, {"email": email}, {"_id": 0, "email": 1}) is not None
+
+    async def find_by_user_id(self, user_id, fields=PROFILE_FIELDS):
+        """User document with this user ID (str(_id), the token subject; by default without the password hash), or None"""
+        if not ObjectId.is_valid(user_id):
+            return None
+        return await self._run(self.col.find_one, {"_id": ObjectId(user_id)}, fields)
+
+    async def insert(self, user):
+        """Insert a new user document and return its database ID"""
+        result = await self._run(self.col.insert_one, user)
+        return result.inserted_id
+
+    async def ensure_indexes(self):
+        """Create any missing USER_INDEXES (a no-op for indexes that already exist)"""
+        return await self._run(self.col.create_indexes, USER_INDEXES)
+
+    async def missing_indexes(self):
+        """Names of USER_INDEXES not present on the collection (matched by key pattern)"""
+        existing = await self._run(self.col.index_information)
+        patterns = {tuple(tuple(part) for part in info["key"]) for info in existing.values()}
+        return [
+            index.document["name"] for index in USER_INDEXES
+            if tuple(index.document["key"].items()) not in patterns
+        ]
+
+
+class JobsRepository(Repository):
+    """
+    Async access to the job postings collection (searched through catalog.JobCatalog;
+    postings are stored with their extracted skills, so a restart does not re-extract them)
+
+    jobs = JobsRepository(db["jobs"], workers=4)
+    postings = await jobs.find_all()
+    job_id = await jobs.insert({"title": ..., "skills": [...], ...})
+    """
+
+    async def find_all(self):
+        """Every posting (with its stored "embedding" bytes, if any), oldest first, with its ID as the string "id" """
+        def load():
+            return [
+                {"id": str(doc.pop("_id")), **doc}
+                for doc in self.col.find({}).sort("_id", ASCENDING)
+            ]
+        return await self._run(load)
+
+    async def insert(self, posting):
+        """Store a new posting; returns its ID as a string"""
+        result = await self._run(self.col.insert_one, dict(posting))
+        return str(result.inserted_id)
+
+    async def delete(self, job_id):
+        """Delete a posting; returns False if there was none with this ID"""
+        result = await self._run(self.col.delete_one, {"_id": ObjectId(job_id)})
+        return result.deleted_count == 1
+
+
+class RecommendationStore:
+    """
+    Persistence for recommendations.Recommender. Synchronous: only its
+    background thread calls it, never the event loop.
+    - recommendations collection: one document per user (top-K jobs with
+      scores, resume hash, skills and embedding)
+    - job embeddings are stored on the postings in the jobs collection
+    """
+
+    def __init__(self, recommendations, jobs):
+        self.recommendations = recommendations
+        self.jobs = jobs
+
+    def load_users(self):
+        return [{"user_id": doc.pop("_id"), **doc} for doc in self.recommendations.find({})]
+
+    def save_user(self, user_id, row):
+        self.recommendations.replace_one({"_id": user_id}, row, upsert=True)
+
+    def save_job_embedding(self, job_id, embedding):
+        self.jobs.update_one({"_id": ObjectId(job_id)}, {"$set": {"embedding": embedding}})
@@ -0,0 +1,181 @@
+"""
+Conditional requests and compression for GET responses.
+
+The frontend polls job status and re-fetches results and PDFs that rarely
+change, and the JSON results (semantic analysis, tailored resume) run to
+tens of KB. HTTPCacheMiddleware:
+- gives every JSON response an ETag (hash of its body) unless it has one,
+- answers a matching If-None-Match with 304 and no body (also for PDFs,
+  which get a content-hash ETag from the file endpoints),
+- compresses JSON bodies above a size threshold with brotli (if the
+  brotli package is installed and the client accepts it) or gzip.
+Streaming responses (server-sent events) and files pass through untouched.
+"""
+import gzip
+import hashlib
+import os
+from functools import lru_cache
+
+from starlette.datastructures import Headers, MutableHeaders
+
+try:
+    import brotli
+except ImportError:  # optional: gzip only
+    brotli = None
+
+
+"""
+Strong ETag for a body: quoted hash of its bytes
+"""
+def content_etag(data: bytes) -> str:
+    return '"' + hashlib.sha256(data).hexdigest()[:32] + '"'
+
+
+"""
+Content-hash ETag for a file, recomputed only when its size or mtime changes
+"""
+def file_etag(path):
+    stat = os.stat(path)
+    return _file_etag(path, stat.st_mtime_ns, stat.st_size)
+
+@lru_cache(maxsize=1024)
+def _file_etag(path, mtime_ns, size):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return '"' + digest.hexdigest()[:32] + '"'
+
+
+"""
+True if an If-None-Match header matches the ETag (weak comparison,
+ignoring the -br/-gzip suffix given to compressed variants)
+"""
+def etag_matches(if_none_match, etag):
+    if not if_none_match or not etag:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return _etag_base(etag) in {_etag_base(tag) for tag in if_none_match.split(",")}
+
+def _etag_base(tag):
+    tag = tag.strip()
+    if tag.startswith("W/"):
+        tag = tag[2:]
+    tag = tag.strip('"')
+    for suffix in ("-br", "-gzip"):
+        if tag.endswith(suffix):
+            return tag[:-len(suffix)]
+    return tag
+
+
+"""
+Best encoding the client accepts: br (if available), then gzip, else None
+"""
+def choose_encoding(accept_encoding):
+    accepted = {}
+    for part in (accept_encoding or "").lower().split(","):
+        name, _, params = part.strip().partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        if name:
+            accepted[name] = quality
+    for encoding in (("br",) if brotli else ()) + ("gzip",):
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+
+class HTTPCacheMiddleware:
+    """
+    app.add_middleware(HTTPCacheMiddleware, minimum_size=1024)
+    """
+
+    def __init__(self, app, minimum_size=1024, gzip_level=6, brotli_quality=5):
+        """
+        minimum_size: JSON bodies smaller than this (bytes) are sent uncompressed
+        gzip_level / brotli_quality: compression effort
+        """
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.stats = {"not_modified": 0, "compressed": 0, "bytes_in": 0, "bytes_out": 0}
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+
+        request_headers = Headers(scope=scope)
+        if_none_match = request_headers.get("if-none-match")
+        accept_encoding = request_headers.get("accept-encoding")
+        state = {"mode": "pass", "start": None, "body": []}
+
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                if message["status"] != 200 or "content-encoding" in headers:
+                    pass
+                elif etag_matches(if_none_match, headers.get("etag")):
+                    #known ETag (e.g. a PDF): 304 right away, the body is dropped
+                    state["mode"] = "drop"
+                    await self._not_modified(send, message, headers.get("etag"))
+                    return
+                elif scope["method"] == "GET" and headers.get("content-type", "").startswith("application/json"):
+                    state["mode"] = "buffer"
+                    state["start"] = message
+                    return
+                await send(message)
+                return
+
+            if state["mode"] == "drop":
+                return
+            if state["mode"] == "buffer":
+                state["body"].append(message.get("body", b""))
+                if not message.get("more_body", False):
+                    await self._finish(send, state["start"], b"".join(state["body"]), if_none_match, accept_encoding)
+                return
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+    async def _not_modified(self, send, start, etag):
+        headers = MutableHeaders(raw=[
+            (name, value) for name, value in start["headers"]
+            if name.lower() in (b"cache-control", b"vary", b"content-location", b"expires")
+        ])
+        headers["etag"] = etag
+        self.stats["not_modified"] += 1
+        await send({"type": "http.response.start", "status": 304, "headers": headers.raw})
+        await send({"type": "http.response.body", "body": b""})
+
+    async def _finish(self, send, start, body, if_none_match, accept_encoding):
+        headers = MutableHeaders(raw=list(start["headers"]))
+        headers.add_vary_header("Accept-Encoding")
+        etag = headers.get("etag") or content_etag(body)
+        if etag_matches(if_none_match, etag):
+            start["headers"] = headers.raw
+            await self._not_modified(send, start, etag)
+            return
+
+        self.stats["bytes_in"] += len(body)
+        encoding = choose_encoding(accept_encoding) if len(body) >= self.minimum_size else None
+        if encoding == "br":
+            body = brotli.compress(body, quality=self.brotli_quality)
+        elif encoding == "gzip":
+            body = gzip.compress(body, compresslevel=self.gzip_level, mtime=0)
+        if encoding:
+            headers["content-encoding"] = encoding
+            etag = etag[:-1] + f'-{encoding}"'  # each encoding is a different representation
+            self.stats["compressed"] += 1
+        self.stats["bytes_out"] += len(body)
+
+        headers["etag"] = etag
+        headers["content-length"] = str(len(body))
+        await send({"type": "http.response.start", "status": start["status"], "headers": headers.raw})
+        await send({"type": "http.response.body", "body": body})
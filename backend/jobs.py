@@ -0,0 +1,309 @@
+"""
+In-process job queue for long-running AI requests.
+
+Tailoring a resume takes minutes of LLM calls, so it can't run inside a
+request handler. Handlers submit a job and return its ID right away; a
+fixed pool of worker threads runs the jobs, each worker owning its own
+warm service instance, and clients poll the job for progress (or stream
+its progress events) and can cancel it.
+The queue is bounded: when it is full, submit() raises queue.Full so the
+API can answer 503 instead of piling up work it can't finish.
+"""
+import asyncio
+import math
+import queue
+import threading
+import time
+import uuid
+from collections import OrderedDict
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+FINISHED = (SUCCEEDED, FAILED, CANCELLED)
+
+
+class JobCancelled(Exception):
+    """Raised from a job's progress callback once the job has been cancelled"""
+
+
+class Job:
+    """
+    One submitted request and its progress.
+
+    Workers update the fields; handlers read them through to_dict() or
+    follow the job's event log with stream(). The log ends with an event
+    whose type is the final status.
+    """
+
+    def __init__(self, kind, params, owner=None):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.params = params
+        self.owner = owner
+        self.status = QUEUED
+        self.stage = None
+        self.progress = 0.0
+        self.result = None
+        self.error = None
+        self.created_at = time.time()
+        self.started_at = None
+        self.finished_at = None
+        self.events = []
+        self._cancel = threading.Event()
+        self._events_lock = threading.Lock()
+        self._subscribers = []
+
+    @property
+    def cancel_requested(self):
+        return self._cancel.is_set()
+
+    def report(self, stage, progress=None, event=None):
+        """
+        Progress callback passed to job handlers.
+        event is a JSON-safe dict for the event log; without one a
+        stage_started event is logged.
+        Raises JobCancelled if the job was cancelled, which aborts the handler.
+        """
+        if self._cancel.is_set():
+            raise JobCancelled(self.id)
+        self.stage = stage
+        if progress is not None:
+            self.progress = max(self.progress, min(progress, 1.0))
+        self.publish(event or {"type": "stage_started", "stage": stage, "data": {}})
+
+    def publish(self, event):
+        """Append an event to the log and wake up any stream() consumers"""
+        with self._events_lock:
+            self.events.append(event)
+            for loop, events in self._subscribers:
+                try:
+                    loop.call_soon_threadsafe(events.put_nowait, event)
+                except RuntimeError:
+                    pass  # consumer's event loop already closed
+
+    async def stream(self, keepalive=None):
+        """
+        Async generator over the job's events: the backlog first, then live
+        events until the final status event.
+        With keepalive (seconds), yields None whenever no event arrived in that time.
+        """
+        loop = asyncio.get_running_loop()
+        events = asyncio.Queue()
+        with self._events_lock:
+            backlog = list(self.events)
+            done = bool(backlog) and backlog[-1]["type"] in FINISHED
+            if not done:
+                self._subscribers.append((loop, events))
+
+        try:
+            for event in backlog:
+                yield event
+            while not done:
+                try:
+                    event = await asyncio.wait_for(events.get(), keepalive)
+                except asyncio.TimeoutError:
+                    yield None
+                    continue
+                done = event["type"] in FINISHED
+                yield event
+        finally:
+            with self._events_lock:
+                if (loop, events) in self._subscribers:
+                    self._subscribers.remove((loop, events))
+
+    def to_dict(self):
+        """JSON-safe view of the job (params are not exposed)"""
+        data = {
+            "job_id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "stage": self.stage,
+            "progress": round(self.progress, 3),
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+        }
+        if self.status == SUCCEEDED:
+            data["result"] = self.result
+        if self.status == FAILED:
+            data["error"] = self.error
+        return data
+
+
+class JobQueue:
+    """
+    Bounded FIFO queue with a pool of worker threads.
+
+    Example usage:
+        jobs = JobQueue({"resume": run_resume_job}, create_service, workers=2)
+        jobs.start()
+        job = jobs.submit("resume", {...})     # raises queue.Full when busy
+        jobs.get(job.id).to_dict()             # poll
+        jobs.cancel(job.id)
+        jobs.stop()
+
+    A handler is called as handler(service, params, report) and returns a
+    JSON-safe result; report(stage, progress, event) updates the job, logs
+    the event and raises JobCancelled once the job is cancelled.
+    """
+
+    def __init__(self, handlers, service_factory, workers=2, max_queued=20, history=200, on_evict=None):
+        """
+        handlers: Dict of job kind -> handler
+        service_factory: Creates the service instance each worker keeps warm
+        workers: Number of worker threads (jobs run concurrently)
+        max_queued: Jobs waiting beyond this are rejected (backpressure)
+        history: Finished jobs kept for polling before being evicted
+        on_evict: Optional callback(job) when a finished job is dropped (e.g. delete its files)
+        """
+        self.handlers = handlers
+        self.service_factory = service_factory
+        self.workers = workers
+        self.history = history
+        self.on_evict = on_evict
+
+        self._queue = queue.Queue(maxsize=max_queued)
+        self._jobs = OrderedDict()
+        self._lock = threading.Lock()
+        self._threads = []
+        self._runtimes = []  # recent job durations, for Retry-After estimates
+        self.stats = {"submitted": 0, "rejected": 0, "succeeded": 0, "failed": 0, "cancelled": 0}
+
+    def start(self):
+        """Start the worker threads (each creates its service up front)"""
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._worker, name=f"job-worker-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout=None):
+        """Cancel outstanding jobs and wait for the workers to exit"""
+        with self._lock:
+            for job in self._jobs.values():
+                if job.status not in FINISHED:
+                    job._cancel.set()
+                if job.status == QUEUED:
+                    self._finish(job, CANCELLED)
+        for _ in self._threads:
+            self._queue.put(None)  # blocks until a worker frees a slot
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def submit(self, kind, params, owner=None):
+        """
+        Queue a job and return it.
+        Raises ValueError for an unknown kind and queue.Full when the queue is full.
+        """
+        if kind not in self.handlers:
+            raise ValueError(f"Unknown job kind '{kind}'")
+
+        job = Job(kind, params, owner)
+        with self._lock:
+            try:
+                self._queue.put_nowait(job)
+            except queue.Full:
+                self.stats["rejected"] += 1
+                raise
+            self._jobs[job.id] = job
+            self.stats["submitted"] += 1
+            self._evict()
+        return job
+
+    def get(self, job_id):
+        """Job by ID, or None if unknown or evicted"""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def cancel(self, job_id):
+        """
+        Cancel a job. Queued jobs are cancelled immediately; running jobs stop
+        at their next progress report. Returns the job, or None if unknown.
+        """
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.status in FINISHED:
+                return job
+            job._cancel.set()
+            if job.status == QUEUED:
+                self._finish(job, CANCELLED)
+        return job
+
+    def queued(self):
+        """Number of jobs waiting for a worker"""
+        return self._queue.qsize()
+
+    def retry_after(self):
+        """Seconds a rejected client should wait, from recent job durations"""
+        with self._lock:
+            recent = self._runtimes[-20:]
+        average = sum(recent) / len(recent) if recent else 30.0
+        return max(1, math.ceil(average * max(self.queued(), 1) / max(self.workers, 1)))
+
+    # Worker side
+
+    def _worker(self):
+        service = self._create_service()
+
+        while True:
+            job = self._queue.get()
+            if job is None:
+                return
+
+            with self._lock:
+                if job.status != QUEUED:  # cancelled while waiting
+                    continue
+                job.status = RUNNING
+                job.started_at = time.time()
+
+            if service is None:
+                service = self._create_service()
+            if service is None:
+                with self._lock:
+                    job.error = "AI service unavailable"
+                    self._finish(job, FAILED)
+                continue
+
+            try:
+                result = self.handlers[job.kind](service, job.params, job.report)
+            except JobCancelled:
+                status, result, error = CANCELLED, None, None
+            except Exception as e:
+                print(f"⚠ Job {job.id} ({job.kind}) failed: {e}")
+                status, result, error = FAILED, None, str(e)
+            else:
+                status, error = SUCCEEDED, None
+
+            with self._lock:
+                job.result = result
+                job.error = error
+                if status == SUCCEEDED:
+                    job.progress = 1.0
+                self._runtimes = self._runtimes[-99:] + [time.time() - job.started_at]
+                self._finish(job, status)
+
+    def _create_service(self):
+        try:
+            return self.service_factory()
+        except Exception as e:
+            print(f"⚠ Could not start AI service: {e}")
+            return None
+
+    def _finish(self, job, status):
+        # Caller holds the lock
+        job.status = status
+        job.finished_at = time.time()
+        self.stats[status] += 1
+        job.publish({"type": status, "stage": job.stage, "data": job.to_dict()})
+
+    def _evict(self):
+        # Caller holds the lock; drops the oldest finished jobs beyond history
+        finished = [job for job in self._jobs.values() if job.status in FINISHED]
+        for job in finished[:max(0, len(finished) - self.history)]:
+            del self._jobs[job.id]
+            if self.on_evict:
+                self.on_evict(job)
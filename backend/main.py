@@ -1,18 +1,31 @@
 """
 Backend file
 """
-from fastapi import FastAPI, Request, Header, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi import FastAPI, Request, Header, HTTPException, Depends
+from fastapi.responses import JSONResponse, FileResponse, StreamingResponse
+from contextlib import asynccontextmanager
+import asyncio
 import json
-import pymongo
+import math
 import os
+import queue
 
-from jwt import PyJWTError
+from db import create_client, UsersRepository, JobsRepository, RecommendationStore, LOGIN_FIELDS
+from pymongo.errors import DuplicateKeyError
+from jobs import JobQueue
+from catalog import JobCatalog
+from recommendations import Recommender
+from tailoring import (create_service, create_taxonomy, create_encoder, extract_resume_text, save_upload, remove_upload,
+                       validate_resume_options, run_resume_job, run_cover_letter_job, llm_stats)
+
+from auth import TokenVerifier
+from ratelimit import RateLimiter, MongoBucketStore, parse_limits
+from http_cache import HTTPCacheMiddleware, file_etag
 
 """
-Import bcrypt to hash passwords.
+Import password hashing (bcrypt, on a thread pool) and profile field encryption
 """
-import bcrypt
+from security import hash_password, verify_password, encrypt_field, decrypt_field, field_encryption_enabled
 
 
 """
@@ -30,31 +43,114 @@ jwt_algo = "HS256"
 jwt_expire_minutes = 60 * 2  # 2 hour token
 jwt_secret = os.environ.get("JWT_SECRET")
 
+"""
+Verified tokens are cached for up to JWT_CACHE_TTL seconds (never past exp);
+logout revokes the token (see auth.py)
+"""
+jwt_cache_size = int(os.environ.get("JWT_CACHE_SIZE", "10000"))
+jwt_cache_ttl = int(os.environ.get("JWT_CACHE_TTL", "300"))
+tokens = TokenVerifier(jwt_secret, jwt_algo, cache_size=jwt_cache_size, cache_ttl=jwt_cache_ttl)
+
+"""
+Resume/cover letter jobs run on a pool of worker threads (see jobs.py)
+Throughput scales with JOB_WORKERS; submissions beyond JOB_QUEUE_SIZE waiting jobs get a 503
+"""
+job_workers = int(os.environ.get("JOB_WORKERS", "2"))
+job_queue_size = int(os.environ.get("JOB_QUEUE_SIZE", "20"))
+job_queue = JobQueue(
+    {"resume": run_resume_job, "cover_letter": run_cover_letter_job},
+    create_service,
+    workers=job_workers,
+    max_queued=job_queue_size,
+    on_evict=lambda job: remove_upload(job.params["resume_path"]),
+)
+
+@asynccontextmanager
+async def lifespan(app):
+    #signup encrypts the profile fields: refuse to start instead of failing every signup
+    if not field_encryption_enabled():
+        raise RuntimeError("FIELD_ENCRYPTION_KEY is not set (see README.md, Backend configuration)")
+    #create any missing indexes so auth lookups never scan the users collection
+    try:
+        await users.ensure_indexes()
+    except Exception as e:
+        print(f"⚠ Could not create user indexes: {e}")
+    if rate_limit_store == "mongo":
+        try:
+            await asyncio.to_thread(limiter.store.ensure_indexes)
+        except Exception as e:
+            print(f"⚠ Could not create the rate limit TTL index: {e}")
+    #index every stored job posting in memory; /jobs searches never touch the database
+    postings, embeddings = [], {}
+    try:
+        postings = await job_postings.find_all()
+        embeddings = {posting["id"]: posting.pop("embedding") for posting in postings if "embedding" in posting}
+        count = catalog.load(postings)
+        print(f"✓ Job catalog loaded ({count} postings)")
+    except Exception as e:
+        print(f"⚠ Could not load the job catalog: {e}")
+    if recommender is not None:
+        recommender.start(postings, embeddings)
+    job_queue.start()
+    yield
+    job_queue.stop(timeout=5)
+    if recommender is not None:
+        recommender.stop(timeout=5)
+    users.close()
+    job_postings.close()
+    clientdb.close()
+
 # Create a FastAPI instance
-app = FastAPI()
+app = FastAPI(lifespan=lifespan)
+
+"""
+JSON responses get content-hash ETags (304 on If-None-Match) and are
+compressed (brotli if installed, else gzip) above COMPRESS_MIN_BYTES
+"""
+app.add_middleware(HTTPCacheMiddleware, minimum_size=int(os.environ.get("COMPRESS_MIN_BYTES", "1024")))
 
 database = os.environ.get("DATABASE")
-clientdb = pymongo.MongoClient(f"{database}")
+clientdb = create_client(f"{database}")
 db_info = os.environ.get("DATABASE_INFO")
 db = clientdb[f'{db_info}']
-col = db["users"]
+users = UsersRepository(db["users"])
 
 """
-Helper function to hash passwords for security purposes
+Job submissions are rate limited per user, with a token bucket per role (see ratelimit.py)
+RATE_LIMITS: role=requests/seconds entries; roles without an entry get the free_user limit
+RATE_LIMIT_STORE: memory (buckets in this process) or mongo (the rate_limits collection,
+shared by every API process)
+The concurrent LLM requests of all workers are capped separately by LLM_MAX_CONCURRENCY (Saqib-AI config)
 """
-def hash_(pwd):
-    salt = bcrypt.gensalt()
-    hashed = bcrypt.hashpw(pwd.encode('utf-8'), salt)
-    return hashed.decode('utf-8')
+rate_limits = parse_limits(os.environ.get("RATE_LIMITS", "free_user=10/3600,premium_user=60/3600,admin=unlimited"))
+rate_limit_store = os.environ.get("RATE_LIMIT_STORE", "memory")
+if rate_limit_store not in ("memory", "mongo"):
+    raise ValueError(f"Invalid RATE_LIMIT_STORE '{rate_limit_store}' (expected memory or mongo)")
+limiter = RateLimiter(rate_limits, store=MongoBucketStore(db["rate_limits"]) if rate_limit_store == "mongo" else None,
+                      default_role="free_user")
 
 """
-Helper function to verify a stored password against one provided by the user
+Job postings: stored in the jobs collection, searched through an in-memory
+inverted index of skills and locations (see catalog.py)
 """
-def verify_hash(stored_pwd, provided_pwd):
-
-    stored_pwd = stored_pwd.encode("utf-8")
+job_postings = JobsRepository(db["jobs"], workers=4)
+catalog = JobCatalog(create_taxonomy())
+jobs_page_size = int(os.environ.get("JOBS_PAGE_SIZE", "20"))
+jobs_max_page_size = 100
 
-    return bcrypt.checkpw(provided_pwd.encode("utf-8"), stored_pwd)
+"""
+Each user's top RECOMMENDATIONS_TOP_K jobs are precomputed in the background
+and updated incrementally when their resume or the catalog changes (see recommendations.py)
+RECOMMENDATIONS=0 turns this off (no embedding model is loaded)
+"""
+recommendations_enabled = os.environ.get("RECOMMENDATIONS", "1") != "0"
+recommendations_top_k = int(os.environ.get("RECOMMENDATIONS_TOP_K", "20"))
+recommender = Recommender(
+    create_encoder(),
+    catalog.taxonomy,
+    store=RecommendationStore(db["recommendations"], db["jobs"]),
+    top_k=recommendations_top_k,
+) if recommendations_enabled else None
 
 """
 Helper function to create a JWT access token for the given user ID
@@ -73,6 +169,56 @@ def create_access_token(userID: int, role: str) -> str:
 
 
 
+"""
+FastAPI dependencies for protected endpoints:
+- bearer_token: the raw token from the Authorization header (401 if missing)
+- current_claims: the verified token's claims (401 if invalid, expired or revoked);
+  repeat calls with the same token are a cache lookup
+- require_role(role): current_claims that must also carry the given role (403 otherwise)
+"""
+async def bearer_token(authorization: str = Header(None)) -> str:
+    if not authorization or not authorization.startswith("Bearer "):
+        raise HTTPException(status_code=401, detail="Missing Bearer token")
+    return authorization.split(" ", 1)[1]  # everything after "Bearer "
+
+async def current_claims(token: str = Depends(bearer_token)) -> dict:
+    try:
+        return tokens.verify(token)
+    except ValueError as e:
+        raise HTTPException(status_code=401, detail=str(e))
+
+def require_role(role: str):
+    async def check_role(claims: dict = Depends(current_claims)) -> dict:
+        if claims.get("role") != role:
+            raise HTTPException(status_code=403, detail=f"Requires the {role} role")
+        return claims
+    return check_role
+
+"""
+- take_rate_limit: for an endpoint that starts LLM work, once the request is valid; takes a
+  token from the user's bucket for their role (429 with Retry-After once it is empty)
+- refund_rate_limit: gives the token back when the job is not queued after all (queue full)
+Only accepted jobs count against the limit
+"""
+async def _limiter_call(fn, *args):
+    if rate_limit_store == "mongo":
+        #a database round trip: keep it off the event loop
+        return await asyncio.to_thread(fn, *args)
+    return fn(*args)
+
+async def take_rate_limit(claims):
+    allowed, remaining, retry_after = await _limiter_call(limiter.check, claims["sub"], claims.get("role"))
+    if not allowed:
+        raise HTTPException(
+            status_code=429,
+            detail="Rate limit reached, try again later.",
+            headers={"Retry-After": str(math.ceil(retry_after))}
+        )
+
+async def refund_rate_limit(claims):
+    await _limiter_call(limiter.refund, claims["sub"], claims.get("role"))
+
+
 """
 Function that runs when user attempts to login to their account 
 The user is required to input the following information:
@@ -99,7 +245,7 @@ async def login(request: Request):
         )
 
     try:
-        user = col.find({"email": email})
+        user = await users.find_by_email(email, LOGIN_FIELDS)
         #check that user exists in database
         if user is None:
             return JSONResponse(
@@ -110,11 +256,11 @@ async def login(request: Request):
                 }
             )
 
-        user_id = user.inserted_id #the user's ID
+        user_id = str(user["_id"]) #the user's ID
         pwd_hash = user['password']
 
         #check the password against the saved hash in the database
-        if not verify_hash(pwd_hash, password):
+        if not await verify_password(pwd_hash, password):
             return JSONResponse(
                 status_code=401,
                 content={
@@ -151,13 +297,17 @@ async def login(request: Request):
 
 
 
+"""
+Logout: the token is revoked server side until it expires
+"""
 @app.get("/logout")
-def logout(authorization: str = Header(None)):
+def logout(token: str = Depends(bearer_token)):
     #TODO: client side must delete token on its end, in localStorage: localStorage.removeItem("token"); OR if in sessioNStorage: sessionStorage.removeItem("token");
-    if not authorization or not authorization.startswith("Bearer "):
-        raise HTTPException(status_code=401, detail="Missing Bearer token")
+    try:
+        tokens.revoke(token)
+    except ValueError as e:
+        raise HTTPException(status_code=401, detail=str(e))
 
-        # nothing to do server-side unless you add a blacklist
     return JSONResponse(
         status_code=200,
         content={"success": True, "message": "Logged out. Delete the token on the client."}
@@ -174,7 +324,7 @@ The user is required to input the following information:
 - github 
 - location
 - password
-All of the above information excluding the email are hashed for security reasons
+The password is hashed (bcrypt) and the other fields excluding the email are encrypted for security reasons
 The user is auto assigned an ID used by the server side 
 There are multiple checks to ensure valid parameters are provided,
 for example: email requires @ and . to be in it 
@@ -232,26 +382,12 @@ async def signup(request: Request):
             }
         )
 
-    """Hash the necessary information for security purposes"""
-    hashed_pwd = hash_(password)
-    hashed_fname = hash_(first_name)
-    hashed_lname = hash_(last_name)
-    hashed_phone = hash_(phone)
-    hashed_linkedin = hash_(linkedin)
-    hashed_github = hash_(github)
-    hashed_location = hash_(location)
-    hashed_gender = hash_(gender)
-    hashed_indigenous = hash_(indigenous)
-    hashed_disability = hash_(disability)
-    hashed_minority = hash_(minority)
-    hashed_lgbtq = hash_(lgbtq)
     reg_date = datetime.utcnow().date().isoformat()  # date of account creation (now)
     role = "free_user"
 
     """Ensure this email is not already in use"""
     try:
-        user = col.find({"email": email})
-        if user:
+        if await users.email_exists(email):
             return JSONResponse(
                 status_code=400,
                 content={
@@ -264,10 +400,13 @@ async def signup(request: Request):
 
     """Insert information into database"""
     try:
-        dic = {"email":email, "password":hashed_pwd, "first_name": hashed_fname, "last_name": hashed_lname, "phone": hashed_phone,
-           "linkedin": hashed_linkedin, "github": hashed_github, "location": hashed_location, "registration_date": reg_date, "role": role, "gender": hashed_gender, "indigenous": hashed_indigenous, "disability": hashed_disability, "minority": hashed_disability, "lgbtq": hashed_lgbtq}
-        user = col.insert_one(dic)
-        user_id = user.inserted_id #database generated object ID
+        """Only the password is hashed (bcrypt, off the event loop); the other fields are encrypted"""
+        hashed_pwd = await hash_password(password)
+        profile = {"first_name": first_name, "last_name": last_name, "phone": phone, "linkedin": linkedin, "github": github,
+                   "location": location, "gender": gender, "indigenous": indigenous, "disability": disability, "minority": minority, "lgbtq": lgbtq}
+        dic = {"email": email, "password": hashed_pwd, "registration_date": reg_date, "role": role,
+               **{field: encrypt_field(value) for field, value in profile.items()}}
+        user_id = str(await users.insert(dic)) #database generated object ID
         access_token = create_access_token(user_id, role) #create an access token for the user, valid for two hours
         """Return the information to client side"""
         return JSONResponse(
@@ -283,6 +422,15 @@ async def signup(request: Request):
                 }
             }
         )
+    #email registered by a concurrent signup (unique email index)
+    except DuplicateKeyError:
+        return JSONResponse(
+            status_code=400,
+            content={
+                "success": False,
+                "message": "Email already in use!"
+            }
+        )
     #failed
     except:
         return JSONResponse(
@@ -294,63 +442,402 @@ async def signup(request: Request):
         )
 
 
+@app.get("/profile")
+async def read_user(claims: dict = Depends(current_claims)):
+    user_id = claims["sub"]
+
+    try:
+        user = await users.find_by_user_id(user_id)
+        #deleted account (the token outlives it)
+        if user is None:
+            return JSONResponse(
+                status_code=404,
+                content={
+                    "success": False,
+                    "message": "User does not exist"
+                }
+            )
+        """The profile fields were encrypted at signup; the email, role and registration date are stored as is"""
+        plain = ("email", "role", "registration_date")
+        profile = {field: value if field in plain or value is None else decrypt_field(value)
+                   for field, value in user.items() if field != "_id"}
+        return JSONResponse(
+            status_code=200,
+            content={
+                "success": True,
+                "message": "Profile retrieved successfully.",
+                "data": {"user_id": user_id, **profile}
+            }
+        )
+    except:
+        return JSONResponse(
+            status_code=400,
+            content={
+                "success": False,
+                "message": "Server side error!"
+            }
+        )
+
 """
-Deconde/verify a JWT access token and return the user ID 
-Raises ValueError if token is invalid/expired/missing required claims
+Upload the user's resume (form field: resume, a PDF) for job recommendations
+Scoring happens in the background; GET /profile/recommendations shows the result
 """
-def get_current_user(token: str) -> int:
+@app.put("/profile/resume")
+async def update_resume(request: Request, claims: dict = Depends(current_claims)):
+    if recommender is None:
+        raise HTTPException(status_code=503, detail="Recommendations are turned off")
+    form = await request.form()
+    resume = form.get("resume")
+    if resume is None or not hasattr(resume, "read"):
+        return _bad_request("Missing resume")
+
+    loop = asyncio.get_running_loop()
     try:
-        payload = jwt.decode(
-            token,
-            key=jwt_secret,
-            algorithms=[jwt_algo],
-            options={"require": ["sub", "exp", "iat"]},
-        )
-    except PyJWTError as e:
-        raise ValueError(f"Invalid or expired token: {e}")
+        text = await loop.run_in_executor(None, extract_resume_text, await resume.read())
+    except ValueError as e:
+        return _bad_request(str(e))
+    if not text.strip():
+        return _bad_request("No text found in the resume PDF")
+
+    recommender.update_user(claims["sub"], text)
+    return JSONResponse(
+        status_code=202,
+        content={"success": True, "message": "Resume received. Recommendations will update shortly."}
+    )
 
-    sub = payload.get("sub")
-    if sub is None:
-        raise ValueError("Token missing 'sub' claim")
+"""
+The user's precomputed job recommendations, best first (a table lookup: nothing is scored here)
+pending is true while changes are still being applied
+"""
+@app.get("/profile/recommendations")
+def read_recommendations(claims: dict = Depends(current_claims)):
+    if recommender is None:
+        raise HTTPException(status_code=503, detail="Recommendations are turned off")
+    row = recommender.recommendations(claims["sub"]) or {"jobs": [], "updated": None}
+    #one catalog lookup per job: a job removed meanwhile is skipped, not a KeyError
+    summaries = [(catalog.summary(entry["id"]), entry["score"]) for entry in row["jobs"]]
+    jobs = [{**summary, "score": score} for summary, score in summaries if summary is not None]
+    return JSONResponse(
+        status_code=200,
+        content={
+            "success": True,
+            "data": {"jobs": jobs, "updated": row["updated"], "pending": recommender.pending() > 0}
+        }
+    )
 
+"""
+Admin check: report any required users-collection indexes that are missing
+Requires a token with the admin role
+"""
+@app.get("/admin/indexes")
+async def check_indexes(claims: dict = Depends(require_role("admin"))):
+    missing = await users.missing_indexes()
+    return JSONResponse(
+        status_code=200,
+        content={
+            "success": not missing,
+            "message": "All indexes present." if not missing else "Missing indexes: " + ", ".join(missing),
+            "data": {"missing": missing}
+        }
+    )
+
+"""
+Admin view of the rate limiter (limits, allowed/rejected per role, buckets),
+the shared LLM concurrency limit and the job queue
+Requires a token with the admin role
+"""
+@app.get("/admin/rate_limits")
+def read_rate_limits(claims: dict = Depends(require_role("admin"))):
+    return JSONResponse(
+        status_code=200,
+        content={
+            "success": True,
+            "data": {
+                "rate_limits": limiter.snapshot(),
+                "llm": llm_stats(),
+                "jobs": {**job_queue.stats, "queued": job_queue.queued()},
+            }
+        }
+    )
+
+"""
+Admin view of the recommender: readiness, queued changes, users/jobs tracked and scoring counters
+"""
+@app.get("/admin/recommendations")
+def read_recommender(claims: dict = Depends(require_role("admin"))):
+    if recommender is None:
+        raise HTTPException(status_code=503, detail="Recommendations are turned off")
+    return JSONResponse(status_code=200, content={"success": True, "data": recommender.snapshot()})
+
+"""
+Search job postings. Query parameters (all optional):
+- skill: required skill, repeatable (postings must have every one), e.g. ?skill=python&skill=aws
+- location: city, province or full location, e.g. ?location=calgary
+- cursor: next_cursor from the previous page
+- limit: page size (default JOBS_PAGE_SIZE, at most 100)
+Returns postings newest first (without descriptions) and the cursor of the next page (null on the last)
+"""
+@app.get("/jobs")
+def read_jobs(request: Request):
+    params = request.query_params
     try:
-        return int(sub)
-    except (TypeError, ValueError):
-        raise ValueError("Token 'sub' claim is not a valid integer")
+        limit = int(params.get("limit") or jobs_page_size)
+    except ValueError:
+        return _bad_request("Invalid page size")
+    if not 1 <= limit <= jobs_max_page_size:
+        return _bad_request(f"Page size must be between 1 and {jobs_max_page_size}")
+
+    jobs, next_cursor = catalog.search(
+        skills=params.getlist("skill"),
+        location=params.get("location"),
+        cursor=params.get("cursor") or None,
+        limit=limit,
+    )
+    return JSONResponse(
+        status_code=200,
+        content={
+            "success": True,
+            "data": {"jobs": jobs, "next_cursor": next_cursor}
+        }
+    )
 
+@app.get("/jobs/{job_id}")
+def read_job(job_id: str):
+    posting = catalog.get(job_id)
+    if posting is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return JSONResponse(status_code=200, content={"success": True, "data": posting})
 
-@app.get("/profile")
-def read_user(authorization: str = Header(None)):
-    if not authorization or not authorization.startswith("Bearer "):
-        raise HTTPException(status_code=401, detail="Missing Bearer token")
+"""
+Add a job posting (admin). Form fields: title, company, location, description, optional url
+Its skills are extracted once here and stored with it
+"""
+@app.post("/jobs")
+async def create_job(request: Request, claims: dict = Depends(require_role("admin"))):
+    form = await request.form()
+    posting = {field: form.get(field) for field in ("title", "company", "location", "description", "url")}
+    if not all(posting[field] for field in ("title", "company", "location", "description")):
+        return _bad_request("Missing title, company, location or description")
+
+    posting["posted"] = datetime.utcnow().date().isoformat()
+    catalog.prepare(posting)
+    posting["id"] = await job_postings.insert(posting)
+    catalog.add(posting)
+    if recommender is not None:
+        recommender.job_added(posting)
+    return JSONResponse(
+        status_code=201,
+        content={
+            "success": True,
+            "message": "Job posted.",
+            "data": catalog.summary(posting["id"])
+        }
+    )
+
+@app.delete("/jobs/{job_id}")
+async def delete_job(job_id: str, claims: dict = Depends(require_role("admin"))):
+    if catalog.get(job_id) is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    await job_postings.delete(job_id)
+    catalog.remove(job_id)
+    if recommender is not None:
+        recommender.job_removed(job_id)
+    return JSONResponse(status_code=200, content={"success": True, "message": "Job removed."})
+
+"""
+Submit a tailoring job (requires a token; accepted jobs are rate limited per user, see take_rate_limit). Form fields:
+- resume (PDF file)
+- job_description
+- optional: company_name, position, generate_cover_letter, template (a registered
+  resume template), fit_to_pages (1 to FIT_MAX_PAGES), enable_refinement,
+  user_answers (JSON object of question number -> answer)
+Returns the job ID right away (202); poll GET /resume_builder/{job_id} for progress
+"""
+@app.post("/resume_builder")
+async def submit_resume_builder(request: Request, claims: dict = Depends(current_claims)):
+    form = await request.form()
+    resume = form.get("resume")
+    job_description = form.get("job_description")
+    generate_cover_letter = form.get("generate_cover_letter") in ("true", "1", "yes")
 
-    token = authorization.split(" ", 1)[1]  # everything after "Bearer "
-    user_id = get_current_user(token)
+    if resume is None or not hasattr(resume, "read") or not job_description:
+        return _bad_request("Missing resume or job description")
+    if generate_cover_letter and (not form.get("company_name") or not form.get("position")):
+        return _bad_request("Cover letter requires company name and position")
 
     try:
-        col.find_one({"user_id": user_id})
-        # TODO: finish code
-    except:
+        user_answers = {int(k): v for k, v in json.loads(form.get("user_answers") or "{}").items()}
+        fit_to_pages = int(form["fit_to_pages"]) if form.get("fit_to_pages") else None
+    except (ValueError, AttributeError):
+        return _bad_request("Invalid user answers or page count")
+    try:
+        validate_resume_options(form.get("template"), fit_to_pages)
+    except ValueError as e:
+        return _bad_request(str(e))
+
+    await take_rate_limit(claims)
+    params = {
+        "resume_path": save_upload(await resume.read()),
+        "job_description": job_description,
+        "user_answers": user_answers,
+        "generate_cover_letter": generate_cover_letter,
+        "company_name": form.get("company_name"),
+        "position": form.get("position"),
+        "template": form.get("template"),
+        "fit_to_pages": fit_to_pages,
+        "enable_refinement": form.get("enable_refinement") not in ("false", "0", "no"),
+    }
+    return await _submit_job("resume", params, claims)
+
+@app.get("/resume_builder/{job_id}")
+def read_resume_builder(job_id: str, claims: dict = Depends(current_claims)):
+    return _job_status("resume", job_id, claims)
+
+@app.delete("/resume_builder/{job_id}")
+def cancel_resume_builder(job_id: str, claims: dict = Depends(current_claims)):
+    return _cancel_job("resume", job_id, claims)
+
+"""
+Server-sent events for a job: stage started/finished events with partial
+results (semantic score, questions, tailored resume) as soon as each stage
+completes, ending with the final status event
+"""
+@app.get("/resume_builder/{job_id}/events")
+def stream_resume_builder(job_id: str, claims: dict = Depends(current_claims)):
+    return _job_events("resume", job_id, claims)
+
+@app.get("/resume_builder/{job_id}/files/{name}")
+def download_resume_builder(job_id: str, name: str, claims: dict = Depends(current_claims)):
+    return _job_file("resume", job_id, name, claims)
+
+@app.get("/about")
+def read_about():
+    return {"message": "Hello, World"}
+
+"""
+Submit a cover letter job (requires a token; accepted jobs are rate limited per user). Form fields: resume (PDF file), job_description, company_name, position
+Returns the job ID right away (202); poll GET /cl_builder/{job_id} for progress,
+or follow GET /cl_builder/{job_id}/events to receive each paragraph as it is written
+"""
+@app.post("/cl_builder")
+async def submit_cl_builder(request: Request, claims: dict = Depends(current_claims)):
+    form = await request.form()
+    resume = form.get("resume")
+    job_description = form.get("job_description")
+    company_name = form.get("company_name")
+    position = form.get("position")
+
+    if resume is None or not hasattr(resume, "read") or not job_description or not company_name or not position:
+        return _bad_request("Missing resume, job description, company name or position")
+
+    await take_rate_limit(claims)
+    params = {
+        "resume_path": save_upload(await resume.read()),
+        "job_description": job_description,
+        "company_name": company_name,
+        "position": position,
+    }
+    return await _submit_job("cover_letter", params, claims)
+
+@app.get("/cl_builder/{job_id}")
+def read_cl_builder(job_id: str, claims: dict = Depends(current_claims)):
+    return _job_status("cover_letter", job_id, claims)
+
+@app.delete("/cl_builder/{job_id}")
+def cancel_cl_builder(job_id: str, claims: dict = Depends(current_claims)):
+    return _cancel_job("cover_letter", job_id, claims)
+
+@app.get("/cl_builder/{job_id}/events")
+def stream_cl_builder(job_id: str, claims: dict = Depends(current_claims)):
+    return _job_events("cover_letter", job_id, claims)
+
+@app.get("/cl_builder/{job_id}/files/{name}")
+def download_cl_builder(job_id: str, name: str, claims: dict = Depends(current_claims)):
+    return _job_file("cover_letter", job_id, name, claims)
+
+
+"""
+Helpers shared by the job endpoints
+"""
+def _bad_request(message):
+    return JSONResponse(status_code=400, content={"success": False, "message": message})
+
+async def _submit_job(kind, params, claims):
+    try:
+        job = job_queue.submit(kind, params, claims["sub"])
+    except queue.Full:
+        remove_upload(params["resume_path"])
+        await refund_rate_limit(claims)
+        #backpressure: tell the client when to retry instead of queueing unbounded work
         return JSONResponse(
-            status_code=400,
+            status_code=503,
+            headers={"Retry-After": str(job_queue.retry_after())},
             content={
                 "success": False,
-                "message": "Server side error!"
+                "message": "Too many jobs in progress, try again later."
             }
         )
+    return JSONResponse(
+        status_code=202,
+        content={
+            "success": True,
+            "message": "Job queued.",
+            "data": job.to_dict()
+        }
+    )
 
-@app.get("/jobs")
-def read_jobs():
-    return {"message": "Hello, World"}
+"""
+A job of the given kind submitted by the caller; 404 otherwise (also for other
+users' jobs, so job IDs can't be probed)
+"""
+def _find_job(kind, job_id, claims):
+    job = job_queue.get(job_id)
+    if job is None or job.kind != kind or job.owner != claims["sub"]:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+def _job_status(kind, job_id, claims):
+    job = _find_job(kind, job_id, claims)
+    return JSONResponse(status_code=200, content={"success": True, "data": job.to_dict()})
+
+def _cancel_job(kind, job_id, claims):
+    _find_job(kind, job_id, claims)
+    job = job_queue.cancel(job_id)
+    return JSONResponse(
+        status_code=200,
+        content={
+            "success": True,
+            "message": "Cancellation requested.",
+            "data": job.to_dict()
+        }
+    )
 
-@app.get("/resume_builder")
-def read_resume_builder():
-    return {"message": "Hello, World"}
+def _job_events(kind, job_id, claims):
+    job = _find_job(kind, job_id, claims)
 
-@app.get("/about")
-def read_about():
-    return {"message": "Hello, World"}
+    async def sse():
+        async for event in job.stream(keepalive=15):
+            if event is None:
+                yield ": keepalive\n\n"  #comment line keeps proxies from closing an idle stream
+            else:
+                yield f"event: {event['type']}\ndata: {json.dumps(event)}\n\n"
 
-@app.get("/cl_builder")
-def read_contact():
-    return {"message": "Hello, World"}
+    return StreamingResponse(
+        sse(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+def _job_file(kind, job_id, name, claims):
+    job = _find_job(kind, job_id, claims)
+    filename = (job.result or {}).get("files", {}).get(name)
+    path = filename and os.path.join(os.path.dirname(job.params["resume_path"]), filename)
+    if not path or not os.path.exists(path):
+        raise HTTPException(status_code=404, detail="File not found")
+    #content-hash ETag: a re-rendered but identical PDF still revalidates with a 304
+    return FileResponse(
+        path,
+        media_type="application/pdf",
+        filename=os.path.basename(path),
+        headers={"ETag": file_etag(path), "Cache-Control": "private, no-cache"},
+    )
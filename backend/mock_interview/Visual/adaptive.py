@@ -0,0 +1,225 @@
+"""
+Adaptive inference cost for Holistic: input downscaling and frame skipping.
+
+MovementAnalyzer smooths every metric with an EMA and its timers use real
+timestamps, so it does not need landmarks from every full resolution frame.
+AdaptiveController picks a quality level each frame, from full quality
+down to the cheapest:
+
+  scale 1.0, every frame -> 0.75 -> 0.5 -> 0.5 every 2nd frame -> ... every Nth
+
+Scale is applied to the image given to holistic.process (landmarks are
+normalized, so metrics are unaffected apart from precision). On a skipped
+frame the analyzer is not updated: the previous landmarks and metrics are
+carried forward, and the next update sees the real time gap.
+
+The controller measures the inference cost at each level and moves down a
+level when the cost per frame exceeds the budget (budget / target_fps seconds
+of inference per frame, e.g. budget=0.5 keeps inference to half a core at
+the camera's frame rate), and back up when the better level's cost fits
+again. A level's measured cost expires after `expire` inferred frames (a
+load spike would otherwise pin the controller down for good); without a
+recent measurement, the better level's cost is estimated from the current
+level's (cost grows with the number of input pixels, scale squared).
+
+Quality vs cost on a recorded clip (baseline: every frame at full scale):
+
+  python adaptive.py clip.mp4 --target-fps 30 --budget 0.5
+"""
+import argparse
+import time
+
+import cv2
+
+from feedback import feedback_from_metrics
+
+"""
+Metrics compared between a baseline and a cheaper run (mean absolute error)
+"""
+QUALITY_METRICS = ("movement_score", "center_offset", "slouch_proxy", "upper_body_proxy", "torso_angle", "posture_bad_sec")
+
+
+def prepare_input(frame_bgr, scale=1.0):
+    """RGB image for holistic.process, downscaled by `scale` (resized before the color conversion)"""
+    if scale < 1.0:
+        frame_bgr = cv2.resize(frame_bgr, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+    return cv2.cvtColor(frame_bgr, cv2.COLOR_BGR2RGB)
+
+
+class AdaptiveController:
+    """
+    controller = AdaptiveController(target_fps=30, budget=0.5)
+    for each frame:
+        if controller.should_infer():
+            start = time.perf_counter()
+            results = holistic.process(prepare_input(frame, controller.scale))
+            ...
+            controller.record(time.perf_counter() - start)
+        else:
+            ... reuse the previous results/metrics
+    """
+
+    def __init__(self, target_fps=30.0, budget=1.0, scales=(1.0, 0.75, 0.5), max_skip=4, settle=10, expire=150):
+        """
+        target_fps: frames per second arriving (the camera or video frame rate)
+        budget: share of each frame interval inference may use (1.0 = one core)
+        scales: input scales to step through before skipping frames
+        max_skip: infer at least every max_skip-th frame
+        settle: inferred frames to measure at a level before changing again
+        expire: inferred frames after which a level's measured cost is stale
+        """
+        self.frame_budget = budget / target_fps
+        self.levels = [(1, scale) for scale in scales] + [(skip, scales[-1]) for skip in range(2, max_skip + 1)]
+        self.settle = settle
+        self.level = 0
+        self.expire = expire
+        self._cost = [None] * len(self.levels)  # EMA of seconds per inferred frame, per level
+        self._cost_at = [None] * len(self.levels)  # stats["inferred"] when each level was last measured
+        self._measured = 0  # inferred frames at the current level
+        self._since = None  # frames since the last inference
+        self.stats = {"frames": 0, "inferred": 0, "changes": 0}
+
+    @property
+    def skip(self):
+        return self.levels[self.level][0]
+
+    @property
+    def scale(self):
+        return self.levels[self.level][1]
+
+    def should_infer(self):
+        """Call once per frame: True to run inference on it, False to carry the last results"""
+        self.stats["frames"] += 1
+        if self._since is not None and self._since + 1 < self.skip:
+            self._since += 1
+            return False
+        self._since = 0
+        self.stats["inferred"] += 1
+        return True
+
+    def record(self, seconds):
+        """Inference time for the frame just inferred; may change the level"""
+        cost = self._cost[self.level]
+        #restart the EMA from a stale measurement instead of averaging it in
+        if cost is None or self._measured == 0 and self._stale(self.level):
+            self._cost[self.level] = seconds
+        else:
+            self._cost[self.level] = 0.8 * cost + 0.2 * seconds
+        self._cost_at[self.level] = self.stats["inferred"]
+        self._measured += 1
+        if self._measured < self.settle:
+            return
+
+        per_frame = self._cost[self.level] / self.skip
+        if per_frame > self.frame_budget:
+            if self.level < len(self.levels) - 1:
+                self._change(self.level + 1)
+        elif self.level > 0:
+            #step back up if the better level is measured (recently) or estimated to fit with some margin
+            skip, scale = self.levels[self.level - 1]
+            if self._stale(self.level - 1):
+                better = self._cost[self.level] * (scale / self.scale) ** 2
+            else:
+                better = self._cost[self.level - 1]
+            if better / skip < 0.9 * self.frame_budget:
+                self._change(self.level - 1)
+
+    def _stale(self, level):
+        at = self._cost_at[level]
+        return at is None or self.stats["inferred"] - at > self.expire
+
+    def _change(self, level):
+        self.level = level
+        self._measured = 0
+        self.stats["changes"] += 1
+
+    def snapshot(self):
+        """Current level, measured cost per level (ms) and frame counts (JSON-safe dict)"""
+        return {
+            "skip": self.skip,
+            "scale": self.scale,
+            "frame_budget_ms": round(1000 * self.frame_budget, 2),
+            "cost_ms": {
+                f"{skip}x{scale}": round(1000 * cost, 2)
+                for (skip, scale), cost in zip(self.levels, self._cost) if cost is not None
+            },
+            **self.stats,
+        }
+
+
+def compare_timelines(reference, candidate, metrics=QUALITY_METRICS):
+    """
+    Quality of a cheaper run against a reference run of the same video.
+    Each reference frame is compared with the candidate's latest entry at or
+    before it (what a live session would display).
+
+    Returns {"mae": {metric: mean absolute error}, "agreement": {indicator:
+    share of frames with the same feedback state}}
+    """
+    errors = {key: [] for key in metrics}
+    agree = {}
+    j = -1
+    for ref in reference:
+        while j + 1 < len(candidate) and candidate[j + 1]["frame"] <= ref["frame"]:
+            j += 1
+        if j < 0:
+            continue
+        cand = candidate[j]
+        for key in metrics:
+            a, b = ref.get(key), cand.get(key)
+            if isinstance(a, (int, float)) and isinstance(b, (int, float)):
+                errors[key].append(abs(a - b))
+
+        ref_states = feedback_from_metrics(ref)["indicators"]
+        cand_states = feedback_from_metrics(cand)["indicators"]
+        for name, ind in ref_states.items():
+            same, total = agree.get(name, (0, 0))
+            agree[name] = (same + (ind["state"] == cand_states[name]["state"]), total + 1)
+
+    return {
+        "mae": {key: round(sum(e) / len(e), 4) if e else None for key, e in errors.items()},
+        "agreement": {name: round(same / total, 3) for name, (same, total) in agree.items()},
+    }
+
+
+def main():
+    from offline import analyze_video
+
+    parser = argparse.ArgumentParser(description="Metrics quality vs inference cost on a recorded clip")
+    parser.add_argument("video")
+    parser.add_argument("--target-fps", type=float, help="Frame rate to hold (default: the video's)")
+    parser.add_argument("--budget", type=float, default=1.0, help="Share of each frame interval inference may use")
+    parser.add_argument("--max-frames", type=int)
+    args = parser.parse_args()
+
+    cap = cv2.VideoCapture(args.video)
+    target_fps = args.target_fps or cap.get(cv2.CAP_PROP_FPS) or 30.0
+    cap.release()
+
+    runs = [
+        ("baseline", {}),
+        ("no refine", {"refine_face": False}),
+        ("scale 0.5", {"scale": 0.5}),
+        ("every 2nd", {"every": 2}),
+        ("every 3rd", {"every": 3}),
+        ("adaptive", {"controller": AdaptiveController(target_fps=target_fps, budget=args.budget)}),
+    ]
+    reference = None
+    print(f"{'run':<12}{'inferred':>9}{'seconds':>9}{'ms/frame':>10}  quality vs baseline")
+    for label, kwargs in runs:
+        start = time.perf_counter()
+        result = analyze_video(args.video, max_frames=args.max_frames, **kwargs)
+        seconds = time.perf_counter() - start
+        if reference is None:
+            reference = result["timeline"]
+        quality = compare_timelines(reference, result["timeline"])
+        agreement = sum(quality["agreement"].values()) / max(1, len(quality["agreement"]))
+        movement = quality["mae"]["movement_score"]
+        print(f"{label:<12}{result['analyzed']:>9}{seconds:>9.2f}{1000 * seconds / max(1, result['frames']):>10.1f}"
+              f"  states agree {agreement:.1%}, movement MAE {movement}")
+        if "controller" in kwargs:
+            print(f"  controller: {kwargs['controller'].snapshot()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -47,7 +47,8 @@ class MovementAnalyzer:
     )
     """
 
-    def __init__(self):
+    def __init__(self, verbose=True):
+        self.verbose = verbose  # print debug metrics every 30 frames
         self.t_prev = None
 
         self.prev = {
@@ -449,7 +450,7 @@ class MovementAnalyzer:
         self.prev["right_wrist"] = right_wrist
         self.t_prev = t
 
-        if self.frames % 30 == 0:
+        if self.verbose and self.frames % 30 == 0:
             print({
                 "energy": energy,
                 "fidget": fidget,
@@ -458,7 +459,7 @@ class MovementAnalyzer:
                 "stare_sec": self.stare_streak_sec,
             })
 
-        if self.frames % 30 == 0:
+        if self.verbose and self.frames % 30 == 0:
             print("torso_angle", torso_ang, "torso_sep", torso_sep)
 
         return {
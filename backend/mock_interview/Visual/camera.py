@@ -1,3 +1,21 @@
+"""
+Live mock interview feedback from the webcam (or a video file).
+
+Capture, inference (Mediapipe Holistic + MovementAnalyzer + feedback) and
+rendering run as separate pipeline stages (see pipeline.py), so the frame
+rate is bounded by the slowest stage rather than by all of them in a row.
+
+  python camera.py                                   # webcam, press q to quit
+  python camera.py --video clip.mp4                  # play a recording at its frame rate
+  python camera.py --video clip.mp4 --headless --max-speed
+                                                     # benchmark: every frame, no window
+  python camera.py --video clip.mp4 --headless --max-speed --serial
+                                                     # same, stages run back to back
+  python camera.py --adaptive --budget 0.5           # hold the frame rate on half a core
+"""
+import argparse
+import json
+
 import cv2
 import numpy as np
 import mediapipe as mp
@@ -5,33 +23,20 @@ import time
 
 from analysis import MovementAnalyzer
 from feedback import feedback_from_metrics
+from pipeline import CameraPipeline
+from adaptive import AdaptiveController, prepare_input
+from metrics_buffer import MetricsBuffer
 analyzer = MovementAnalyzer()
-metrics_log = []
 
 
 
-# Mediapipe Holistic 
+# Mediapipe Holistic
 mp_holistic = mp.solutions.holistic
-holistic = mp_holistic.Holistic(
-    refine_face_landmarks=True,      # full lips, stable
-    min_detection_confidence=0.5,
-    min_tracking_confidence=0.5
-)
 
 # Used for drawing hands cleanly
 mp_drawing = mp.solutions.drawing_utils
 mp_hands = mp.solutions.hands
 
-
-# Webcam 
-cap = cv2.VideoCapture(0)
-cap.set(3, 1280)
-cap.set(4, 720)
-time.sleep(0.5)
-
-StartDist = None
-scale = 0
-
 # Full lips indices (upper + lower + outline)
 MOUTH_IDXS = [
     # Outer
@@ -43,35 +48,71 @@ MOUTH_IDXS = [
 ]
 
 
+def create_holistic(refine_face=True):
+    return mp_holistic.Holistic(
+        refine_face_landmarks=refine_face,      # full lips, stable
+        min_detection_confidence=0.5,
+        min_tracking_confidence=0.5
+    )
+
+
+def open_webcam(index=0):
+    cap = cv2.VideoCapture(index)
+    cap.set(3, 1280)
+    cap.set(4, 720)
+    time.sleep(0.5)
+    return cap
+
+
 def draw_hud(img, lines, x=30, y=40, dy=38):
     for i, s in enumerate(lines):
         cv2.putText(img, s, (x, y + i*dy),
                     cv2.FONT_HERSHEY_SIMPLEX, 1.0, (255,255,255), 2)
 
 
-while True:
-    ok, frame = cap.read()
-    if not ok:
-        continue
+# -------------------- INFERENCE STAGE --------------------
+
+def make_infer(holistic, controller=None, scale=1.0, log=None):
+    """
+    Inference stage: landmarks, metrics and feedback for one frame.
+    Runs on the pipeline's inference thread, one frame at a time in order
+    (Holistic tracks landmarks across frames).
+    With an AdaptiveController, frames it skips reuse the last results and
+    its scale replaces `scale`. Metrics and feedback states go to `log`
+    (a MetricsBuffer sized by the caller; None keeps no history).
+    """
+    last = None
+
+    def infer(frame_item):
+        nonlocal last
+        if controller is not None and not controller.should_infer() and last is not None:
+            return last
+
+        frame = frame_item["image"]
+        h, w = frame.shape[:2]
+
+        # Run holistic
+        start = time.perf_counter()
+        rgb = prepare_input(frame, controller.scale if controller is not None else scale)
+        results = holistic.process(rgb)
+
+        is_speaking = None
+        metrics = analyzer.update(results, frame, w, h, is_speaking=is_speaking, now=frame_item["t"])
+        if controller is not None:
+            controller.record(time.perf_counter() - start)
+        fb = feedback_from_metrics(metrics)
+        if log is not None:
+            log.append(metrics, t=frame_item["t"], indicators=fb["indicators"])
+        last = results, fb
+        return last
+    return infer
 
-    h, w, _ = frame.shape
 
-    # Run holistic
-    rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-    results = holistic.process(rgb)
+# -------------------- RENDER STAGE --------------------
 
+def draw_landmarks(frame, results):
     h, w = frame.shape[:2]
-    is_speaking = None  
-    metrics = analyzer.update(results, frame, w, h, is_speaking=is_speaking)
-   
 
-#MIRROR FOR DISPLAY
-    disp = cv2.flip(frame, 1)
-    fb = feedback_from_metrics(metrics)
-    ind = fb.get("indicators", {})
-    metrics_log.append(metrics)
-   
-        
     # -------------------- POSE --------------------
     if results.pose_landmarks:
         mp_drawing.draw_landmarks(
@@ -90,7 +131,7 @@ while True:
         l_sh = (int(l.x * w), int(l.y * h) + offset)
         cv2.line(frame, r_sh, l_sh, (0,255,255), 3)
 
-    #FULL MOUTH 
+    #FULL MOUTH
     if results.face_landmarks:
         fl = results.face_landmarks.landmark
 
@@ -109,34 +150,24 @@ while True:
         cv2.line(frame, mouth[-1], mouth[0], (0, 0, 255), 2)
 
     # HANDS WITH MEDIAPIPE, NOT CVZONE
-    # right hand
-    if results.right_hand_landmarks:
-        for i, lm in enumerate(results.right_hand_landmarks.landmark):
+    for hand, color in ((results.right_hand_landmarks, (255,0,0)), (results.left_hand_landmarks, (0,255,0))):
+        if not hand:
+            continue
+        for lm in hand.landmark:
             x, y = int(lm.x * w), int(lm.y * h)
-            cv2.circle(frame, (x, y), 4, (255,0,0), cv2.FILLED)
+            cv2.circle(frame, (x, y), 4, color, cv2.FILLED)
 
         # skeleton
         for c in mp_hands.HAND_CONNECTIONS:
-            start = results.right_hand_landmarks.landmark[c[0]]
-            end   = results.right_hand_landmarks.landmark[c[1]]
+            start = hand.landmark[c[0]]
+            end   = hand.landmark[c[1]]
             x1, y1 = int(start.x*w), int(start.y*h)
             x2, y2 = int(end.x*w), int(end.y*h)
-            cv2.line(frame, (x1,y1), (x2,y2), (255,0,0), 2)
-
-    # left hand
-    if results.left_hand_landmarks:
-        for i, lm in enumerate(results.left_hand_landmarks.landmark):
-            x, y = int(lm.x * w), int(lm.y * h)
-            cv2.circle(frame, (x, y), 4, (0,255,0), cv2.FILLED)
+            cv2.line(frame, (x1,y1), (x2,y2), color, 2)
 
-        # skeleton
-        for c in mp_hands.HAND_CONNECTIONS:
-            start = results.left_hand_landmarks.landmark[c[0]]
-            end   = results.left_hand_landmarks.landmark[c[1]]
-            x1, y1 = int(start.x*w), int(start.y*h)
-            x2, y2 = int(end.x*w), int(end.y*h)
-            cv2.line(frame, (x1,y1), (x2,y2), (0,255,0), 2)
 
+def draw_feedback(disp, results, fb):
+    ind = fb.get("indicators", {})
     lines = [
         f"Movement: {ind.get('movement', {}).get('state', 'unknown')}",
         f"Posture:  {ind.get('posture', {}).get('state', 'unknown')}",
@@ -172,13 +203,94 @@ while True:
                     cv2.FONT_HERSHEY_SIMPLEX,
                     1.2, (255,0,255), 3)
 
-    
-    
-    cv2.imshow("Holistic Tracking", disp)
-
-    if cv2.waitKey(1) & 0xFF == ord("q"):
-        break
-
 
-cap.release()
-cv2.destroyAllWindows()
+def make_render(headless=False):
+    """
+    Render stage: landmarks on the frame, mirror it, then the feedback text.
+    Runs on the main thread (cv2.imshow needs it); headless still draws,
+    so benchmarks include the drawing cost. Returns False when q is pressed.
+    """
+    def render(frame_item, inference):
+        results, fb = inference
+        frame = frame_item["image"]
+        draw_landmarks(frame, results)
+
+        #MIRROR FOR DISPLAY (after the landmarks, so they line up with the image)
+        disp = cv2.flip(frame, 1)
+        draw_feedback(disp, results, fb)
+
+        if headless:
+            return True
+        cv2.imshow("Holistic Tracking", disp)
+        return not (cv2.waitKey(1) & 0xFF == ord("q"))
+    return render
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Live interview body-language feedback")
+    parser.add_argument("--video", help="Video file to run on instead of the webcam")
+    parser.add_argument("--headless", action="store_true", help="No window (e.g. benchmarks on a server)")
+    parser.add_argument("--max-speed", action="store_true",
+                        help="With --video: process every frame as fast as possible instead of at the video's frame rate")
+    parser.add_argument("--serial", action="store_true", help="Run the stages one after another on one thread (for comparison)")
+    parser.add_argument("--adaptive", action="store_true",
+                        help="Downscale and skip inference frames as needed to hold --target-fps within --budget")
+    parser.add_argument("--target-fps", type=float, help="Frame rate to hold with --adaptive (default: the source's)")
+    parser.add_argument("--budget", type=float, default=1.0, help="Share of each frame interval inference may use (--adaptive)")
+    parser.add_argument("--scale", type=float, default=1.0, help="Fixed inference input scale (without --adaptive)")
+    parser.add_argument("--no-refine-face", action="store_true", help="Skip refined face/iris landmarks (cheaper, no pupil metrics)")
+    parser.add_argument("--history-sec", type=float, default=1800, help="Seconds of per-frame metrics kept in memory")
+    parser.add_argument("--spill", help="Also save every 10th frame's metrics to this binary file (see metrics_buffer.load_spill)")
+    parser.add_argument("--frames", type=int, help="Stop after this many frames")
+    parser.add_argument("--report-every", type=float, default=5.0, help="Seconds between stage stats (0 = only at the end)")
+    parser.add_argument("--json", action="store_true", help="Print the final stats as JSON")
+    args = parser.parse_args()
+
+    if args.video:
+        cap = cv2.VideoCapture(args.video)
+        if not cap.isOpened():
+            raise SystemExit(f"Could not open {args.video}")
+        fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+    else:
+        cap = open_webcam()
+        fps = None
+
+    controller = None
+    if args.adaptive:
+        controller = AdaptiveController(target_fps=args.target_fps or fps or 30.0, budget=args.budget)
+
+    log = MetricsBuffer(capacity=int(args.history_sec * (fps or 30.0)), spill_path=args.spill)
+    holistic = create_holistic(refine_face=not args.no_refine_face)
+    infer = make_infer(holistic, controller=controller, scale=args.scale, log=log)
+    pipeline = CameraPipeline(cap, infer, make_render(args.headless), fps=fps, realtime=not args.max_speed)
+    start = time.perf_counter()
+    try:
+        run = pipeline.run_serial if args.serial else pipeline.run
+        stats = run(max_frames=args.frames, report_every=args.report_every or None)
+    finally:
+        cap.release()
+        holistic.close()
+        log.close()
+        if not args.headless:
+            cv2.destroyAllWindows()
+
+    elapsed = time.perf_counter() - start
+    rendered = stats["stages"]["render"]["frames"]
+    print(f"\n{rendered} frames rendered in {elapsed:.1f}s ({rendered / elapsed:.1f} fps)")
+    print(pipeline.format_stats())
+    if controller is not None:
+        print(f"  adaptive: {controller.snapshot()}")
+
+    summary = log.summary()
+    print(f"\nSession: {summary['frames']} frames over {summary['seconds']}s")
+    for name, seconds in summary["time_bad_sec"].items():
+        print(f"  {name:<12} {seconds:6.1f}s needing attention")
+    movement = summary["metrics"]["movement_score"]
+    if movement.get("count"):
+        print(f"  movement score: mean {movement['mean']}, p90 {movement.get('p90')}")
+    if args.json:
+        print(json.dumps({"pipeline": stats, "session": summary}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+"""
+Bounded, columnar history of MovementAnalyzer metrics.
+
+The camera loop used to append every frame's metrics dict to a list
+(30 fps x 30 min = 54k dicts of ~25 keys). MetricsBuffer keeps a fixed
+schema of float32 columns (one NumPy array per metric, plus timestamps
+and the feedback indicator states) in a ring of `capacity` frames, so
+memory is fixed (~6 MB for the default 30 minutes at 30 fps) and older
+frames are overwritten once it is full.
+
+Session aggregates are kept on the fly and do not need the raw history:
+count/mean/min/max of every metric since the start, and the time spent
+in each indicator state (e.g. seconds with posture "high"). Percentiles
+are computed over the frames still in the buffer.
+
+With spill_path, every `spill_every`-th frame is also appended to a
+binary file (a JSON header, then fixed-size records) for post-session
+review; load_spill() reads it back as a NumPy structured array.
+"""
+import json
+import struct
+
+import numpy as np
+
+"""
+Columns stored per frame. Booleans are stored as 0/1, missing values as NaN,
+and the pupil positions as separate x/y columns.
+"""
+METRIC_COLUMNS = (
+    "has_pose", "has_face", "mouth_open", "eye_contact",
+    "eye_contact_speaking_ratio", "eye_contact_listening_ratio", "stare_streak_sec",
+    "gesture_energy", "fidget", "movement_score", "shoulder_span", "base_shoulder_span",
+    "pupil_l_x", "pupil_l_y", "pupil_r_x", "pupil_r_y",
+    "shoulder_slope", "slouch_proxy", "center_offset", "torso_angle", "torso_sep",
+    "framing_proxy", "upper_body_proxy", "slouch", "posture_bad_sec", "movement_bad_sec",
+)
+
+"""
+Feedback indicators whose states are recorded (see feedback_from_metrics)
+"""
+INDICATORS = ("movement", "posture", "centered", "distance", "eye_contact", "stare")
+STATES = ("unknown", "ok", "low", "high", "too_close")
+
+"""
+States counted as time in a bad state, per indicator (the ones feedback_from_metrics gives tips for)
+"""
+BAD_STATES = {
+    "movement": ("high",),
+    "posture": ("low", "high"),
+    "centered": ("low", "high"),
+    "distance": ("low", "too_close"),
+    "eye_contact": ("low",),
+    "stare": ("high",),
+}
+
+SPILL_MAGIC = b"CAMETRIC"
+
+#a gap longer than this (e.g. the camera stalled) counts as this long in time-in-state
+MAX_FRAME_GAP_SEC = 1.0
+
+
+def _value(x):
+    if x is None:
+        return np.nan
+    return float(x)
+
+
+def metrics_row(metrics):
+    """The METRIC_COLUMNS values of one metrics dict, as floats (NaN if missing)"""
+    row = []
+    for name in METRIC_COLUMNS:
+        if name.startswith("pupil_"):
+            point = metrics.get(name[:-2])
+            row.append(np.nan if point is None else float(point[0 if name.endswith("_x") else 1]))
+        else:
+            row.append(_value(metrics.get(name)))
+    return row
+
+
+class MetricsBuffer:
+    """
+    log = MetricsBuffer(capacity=54000, spill_path="session.bin")
+    log.append(metrics, t=frame_time, indicators=fb["indicators"])
+    log.column("movement_score")   # oldest to newest, over the buffered frames
+    log.summary()                  # session aggregates
+    log.close()
+    """
+
+    def __init__(self, capacity=54000, spill_path=None, spill_every=10):
+        """
+        capacity: frames kept in memory (default: 30 minutes at 30 fps)
+        spill_path: binary file to append downsampled history to (None = off)
+        spill_every: spill one frame in this many
+        """
+        self.capacity = capacity
+        self._index = {name: i for i, name in enumerate(METRIC_COLUMNS)}
+        self._data = np.full((len(METRIC_COLUMNS), capacity), np.nan, dtype=np.float32)
+        self._t = np.zeros(capacity, dtype=np.float64)
+        self._states = np.zeros((len(INDICATORS), capacity), dtype=np.int8)
+        self._state_codes = {state: code for code, state in enumerate(STATES)}
+        self._pos = 0
+        self.frames = 0
+
+        #session aggregates (every frame since the start, not just the buffered ones)
+        n = len(METRIC_COLUMNS)
+        self._count = np.zeros(n, dtype=np.int64)
+        self._sum = np.zeros(n, dtype=np.float64)
+        self._min = np.full(n, np.nan)
+        self._max = np.full(n, np.nan)
+        self._time_in_state = np.zeros((len(INDICATORS), len(STATES)))
+        self._first_t = None
+        self._last_t = None
+        self._last_states = None
+
+        self.spill_every = spill_every
+        self._spill = None
+        self._spill_dtype = np.dtype(
+            [("t", "<f8")] + [(name, "<f4") for name in METRIC_COLUMNS] + [(f"{ind}_state", "i1") for ind in INDICATORS]
+        )
+        if spill_path:
+            self._spill = open(spill_path, "wb")
+            header = json.dumps({
+                "columns": METRIC_COLUMNS,
+                "indicators": INDICATORS,
+                "states": STATES,
+                "every": spill_every,
+                "dtype": self._spill_dtype.descr,
+            }).encode("utf-8")
+            self._spill.write(SPILL_MAGIC + struct.pack("<I", len(header)) + header)
+
+    def __len__(self):
+        """Frames currently buffered"""
+        return min(self.frames, self.capacity)
+
+    def append(self, metrics, t, indicators=None):
+        """
+        Record one frame.
+        metrics: MovementAnalyzer.update() result
+        t: frame timestamp (seconds)
+        indicators: feedback_from_metrics(metrics)["indicators"], to track states
+        """
+        row = np.array(metrics_row(metrics), dtype=np.float64)
+        states = np.zeros(len(INDICATORS), dtype=np.int8)
+        if indicators:
+            for i, name in enumerate(INDICATORS):
+                states[i] = self._state_codes.get(indicators.get(name, {}).get("state"), 0)
+
+        pos = self._pos
+        self._data[:, pos] = row
+        self._t[pos] = t
+        self._states[:, pos] = states
+        self._pos = (pos + 1) % self.capacity
+        self.frames += 1
+
+        valid = ~np.isnan(row)
+        self._count += valid
+        self._sum += np.where(valid, row, 0.0)
+        self._min = np.fmin(self._min, row)
+        self._max = np.fmax(self._max, row)
+
+        #the previous frame's states lasted until this frame
+        if self._last_t is not None:
+            dt = min(max(0.0, t - self._last_t), MAX_FRAME_GAP_SEC)
+            self._time_in_state[np.arange(len(INDICATORS)), self._last_states] += dt
+        if self._first_t is None:
+            self._first_t = t
+        self._last_t = t
+        self._last_states = states
+
+        if self._spill is not None and (self.frames - 1) % self.spill_every == 0:
+            record = np.zeros(1, dtype=self._spill_dtype)
+            record["t"] = t
+            for name, value in zip(METRIC_COLUMNS, row):
+                record[name] = value
+            for name, code in zip(INDICATORS, states):
+                record[f"{name}_state"] = code
+            self._spill.write(record.tobytes())
+
+    def _order(self, array):
+        """Buffered part of a ring array, oldest first"""
+        if self.frames < self.capacity:
+            return array[..., :self.frames]
+        return np.concatenate((array[..., self._pos:], array[..., :self._pos]), axis=-1)
+
+    def column(self, name):
+        """A metric's buffered values, oldest first (NaN where it was not measured)"""
+        return self._order(self._data[self._index[name]])
+
+    def timestamps(self):
+        return self._order(self._t)
+
+    def states(self, indicator):
+        """An indicator's buffered states (codes into STATES), oldest first"""
+        return self._order(self._states[INDICATORS.index(indicator)])
+
+    def summary(self, percentiles=(50, 90, 95)):
+        """
+        Session aggregates: frames, seconds, per metric count/mean/min/max
+        (whole session) and percentiles (buffered frames), time in each
+        indicator state and time in a bad state (BAD_STATES), in seconds.
+        JSON-safe dict
+        """
+        buffered = self._order(self._data)
+        metrics = {}
+        for i, name in enumerate(METRIC_COLUMNS):
+            count = int(self._count[i])
+            if not count:
+                metrics[name] = {"count": 0}
+                continue
+            stats = {
+                "count": count,
+                "mean": round(float(self._sum[i] / count), 4),
+                "min": round(float(self._min[i]), 4),
+                "max": round(float(self._max[i]), 4),
+            }
+            values = buffered[i][~np.isnan(buffered[i])]
+            if values.size:
+                for p, value in zip(percentiles, np.percentile(values, percentiles)):
+                    stats[f"p{p}"] = round(float(value), 4)
+            metrics[name] = stats
+
+        time_in_state = {
+            name: {state: round(float(self._time_in_state[i, j]), 2) for j, state in enumerate(STATES) if self._time_in_state[i, j]}
+            for i, name in enumerate(INDICATORS)
+        }
+        return {
+            "frames": self.frames,
+            "buffered": len(self),
+            "seconds": round(self._last_t - self._first_t, 2) if self.frames else 0.0,
+            "metrics": metrics,
+            "time_in_state": time_in_state,
+            "time_bad_sec": {
+                name: round(float(sum(self._time_in_state[i, self._state_codes[state]] for state in BAD_STATES[name])), 2)
+                for i, name in enumerate(INDICATORS)
+            },
+        }
+
+    def close(self):
+        """Flush and close the spill file (if any)"""
+        if self._spill is not None:
+            self._spill.close()
+            self._spill = None
+
+
+def load_spill(path):
+    """
+    Read a spill file written by MetricsBuffer.
+    Returns (header dict, structured array with t, the metric columns and <indicator>_state)
+    Raises ValueError if the file is not a metrics spill file.
+    """
+    with open(path, "rb") as f:
+        if f.read(len(SPILL_MAGIC)) != SPILL_MAGIC:
+            raise ValueError(f"{path} is not a metrics spill file")
+        (length,) = struct.unpack("<I", f.read(4))
+        header = json.loads(f.read(length))
+        dtype = np.dtype([tuple(field) for field in header["dtype"]])
+        return header, np.fromfile(f, dtype=dtype)
@@ -0,0 +1,224 @@
+"""
+Offline analysis of recorded interview videos (e.g. mock interview uploads).
+
+analyze_video() runs Mediapipe Holistic and MovementAnalyzer over a video
+file, optionally on every Nth frame (skipped frames are grabbed but not
+decoded), with timestamps taken from the video rather than the wall clock
+so the motion metrics match a live session. It returns a timeline of the
+per-frame metrics and a report aggregated from feedback_from_metrics over
+the whole video.
+
+analyze_videos() scores several videos in parallel worker processes
+(Holistic is CPU bound and keeps per-video tracking state, so each video
+gets its own process and model).
+
+  python offline.py interview1.mp4 interview2.mp4 --every 2 --workers 2 --out report.json
+"""
+import argparse
+import json
+import os
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+
+import cv2
+import mediapipe as mp
+
+from adaptive import prepare_input
+from analysis import MovementAnalyzer
+from feedback import feedback_from_metrics
+
+INDICATORS = ("movement", "posture", "centered", "distance", "eye_contact", "stare")
+
+#numeric metrics averaged over the video in the report
+MEAN_METRICS = (
+    "movement_score", "gesture_energy", "fidget", "center_offset", "slouch_proxy",
+    "torso_angle", "upper_body_proxy", "mouth_open",
+)
+
+
+def analyze_video(path, every=1, max_frames=None, refine_face=True, scale=1.0, controller=None):
+    """
+    Analyze one recorded video.
+
+    path: video file
+    every: analyze every Nth frame (1 = all)
+    max_frames: stop after this many frames of the video
+    refine_face: Holistic refine_face_landmarks (needed for pupil metrics)
+    scale: downscale frames by this factor before inference
+    controller: adaptive.AdaptiveController choosing the frames and scale
+                instead of every/scale
+
+    Returns a JSON-safe dict: video, frames (read), analyzed, duration_sec,
+    seconds (processing time), fps (analyzed frames per second of processing),
+    timeline (metrics per analyzed frame, with frame index and t in seconds)
+    report (see summarize()) and controller (its snapshot, if one was given).
+    Raises ValueError if the video cannot be opened.
+    """
+    cap = cv2.VideoCapture(path)
+    if not cap.isOpened():
+        raise ValueError(f"Could not open video {path}")
+    video_fps = cap.get(cv2.CAP_PROP_FPS) or 30.0
+
+    holistic = mp.solutions.holistic.Holistic(
+        refine_face_landmarks=refine_face,
+        min_detection_confidence=0.5,
+        min_tracking_confidence=0.5
+    )
+    analyzer = MovementAnalyzer(verbose=False)
+    timeline = []
+    feedback = []
+    index = 0
+    start = time.perf_counter()
+    try:
+        while max_frames is None or index < max_frames:
+            infer = controller.should_infer() if controller is not None else index % every == 0
+            if not infer:
+                #skipped frame: advance without decoding
+                if not cap.grab():
+                    break
+                index += 1
+                continue
+
+            ok, frame = cap.read()
+            if not ok:
+                break
+            h, w = frame.shape[:2]
+            t = index / video_fps
+
+            inferred = time.perf_counter()
+            results = holistic.process(prepare_input(frame, controller.scale if controller is not None else scale))
+            metrics = analyzer.update(results, frame, w, h, is_speaking=None, now=t)
+            if controller is not None:
+                controller.record(time.perf_counter() - inferred)
+
+            timeline.append({"frame": index, "t": round(t, 3), **metrics})
+            feedback.append(feedback_from_metrics(metrics))
+            index += 1
+    finally:
+        cap.release()
+        holistic.close()
+
+    seconds = time.perf_counter() - start
+    return {
+        "video": os.path.basename(path),
+        "frames": index,
+        "analyzed": len(timeline),
+        "duration_sec": round(index / video_fps, 2),
+        "seconds": round(seconds, 2),
+        "fps": round(len(timeline) / seconds, 1) if seconds > 0 else None,
+        "timeline": timeline,
+        "report": summarize(timeline, feedback),
+        "controller": controller.snapshot() if controller is not None else None,
+    }
+
+
+def summarize(timeline, feedback):
+    """
+    Whole-video report from the per-frame metrics and feedback:
+    - indicators: share of analyzed frames in each state, per indicator
+    - messages: the most frequent message for each indicator
+    - tips: tips with the share of frames they were shown in, most frequent first
+    - means: average of the numeric metrics over the frames where they were measured
+    - final: feedback_from_metrics for the last frame (cumulative timers included)
+    """
+    n = len(feedback)
+    if n == 0:
+        return {"indicators": {}, "messages": [], "tips": [], "means": {}, "final": None}
+
+    indicators = {}
+    for name in INDICATORS:
+        states = Counter(fb["indicators"][name]["state"] for fb in feedback if name in fb["indicators"])
+        indicators[name] = {state: round(count / n, 3) for state, count in states.most_common()}
+
+    #messages are one per indicator, in the same order every frame
+    messages = [
+        Counter(fb["messages"][i] for fb in feedback).most_common(1)[0][0]
+        for i in range(len(feedback[-1]["messages"]))
+    ]
+
+    tips = Counter(tip for fb in feedback for tip in set(fb["tips"]))
+
+    means = {}
+    for key in MEAN_METRICS:
+        values = [m[key] for m in timeline if isinstance(m.get(key), (int, float))]
+        means[key] = round(sum(values) / len(values), 4) if values else None
+
+    return {
+        "indicators": indicators,
+        "messages": messages,
+        "tips": [{"tip": tip, "share": round(count / n, 3)} for tip, count in tips.most_common()],
+        "means": means,
+        "final": feedback[-1],
+    }
+
+
+def _analyze(job):
+    path, kwargs = job
+    try:
+        return analyze_video(path, **kwargs)
+    except ValueError as e:
+        return {"video": os.path.basename(path), "error": str(e)}
+
+
+def analyze_videos(paths, workers=None, **kwargs):
+    """
+    Analyze several videos in parallel worker processes.
+
+    paths: video files
+    workers: worker processes (default: one per CPU, at most one per video)
+    kwargs: passed to analyze_video (every, max_frames, refine_face, scale)
+
+    Returns {"videos": [result per path, in order; {"video", "error"} if it
+    could not be opened], "frames": analyzed frames in total, "seconds": wall
+    time, "fps": analyzed frames per second across all workers}
+    """
+    paths = list(paths)
+    workers = max(1, min(workers or os.cpu_count() or 1, len(paths)))
+    start = time.perf_counter()
+    if workers == 1:
+        videos = [_analyze((path, kwargs)) for path in paths]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            videos = list(pool.map(_analyze, [(path, kwargs) for path in paths]))
+    seconds = time.perf_counter() - start
+
+    frames = sum(video.get("analyzed", 0) for video in videos)
+    return {
+        "videos": videos,
+        "workers": workers,
+        "frames": frames,
+        "seconds": round(seconds, 2),
+        "fps": round(frames / seconds, 1) if seconds > 0 else None,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Score recorded interview videos")
+    parser.add_argument("videos", nargs="+", help="Video files")
+    parser.add_argument("--every", type=int, default=1, help="Analyze every Nth frame")
+    parser.add_argument("--max-frames", type=int, help="Frames to read per video")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: one per CPU)")
+    parser.add_argument("--out", help="Write the full results (timelines included) to this JSON file")
+    args = parser.parse_args()
+
+    batch = analyze_videos(args.videos, workers=args.workers, every=args.every, max_frames=args.max_frames)
+    for video in batch["videos"]:
+        if "error" in video:
+            print(f"{video['video']}: {video['error']}")
+            continue
+        print(f"{video['video']}: {video['analyzed']}/{video['frames']} frames, "
+              f"{video['duration_sec']}s of video in {video['seconds']}s ({video['fps']} fps)")
+        for message in video["report"]["messages"]:
+            print(f"  {message}")
+        for tip in video["report"]["tips"][:3]:
+            print(f"  tip ({tip['share']:.0%} of the time): {tip['tip']}")
+    print(f"\n{batch['frames']} frames in {batch['seconds']}s with {batch['workers']} workers ({batch['fps']} fps)")
+
+    if args.out:
+        with open(args.out, "w") as f:
+            json.dump(batch, f)
+
+
+if __name__ == "__main__":
+    main()
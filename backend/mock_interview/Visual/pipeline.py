@@ -0,0 +1,288 @@
+"""
+Threaded capture -> inference -> render pipeline for the camera loop.
+
+Each stage runs on its own thread, so the frame rate is set by the slowest
+stage instead of the sum of all of them (cap.read, holistic.process and the
+OpenCV drawing calls release the GIL):
+
+  capture thread   reads frames into a LatestQueue
+  inference thread takes the newest frame, runs infer(), passes the result on
+  render (caller)  draws/displays each result (cv2.imshow must stay on the
+                   main thread)
+
+With a live camera the queues hold one item and drop stale frames, so
+inference always works on the newest frame and latency stays bounded. With
+a video file the frames can either be paced at the file's frame rate (same
+behaviour as a camera) or all processed as fast as possible, for benchmarks.
+
+Every stage records FPS and latency (StageStats); snapshot() returns them
+with the dropped frame counts and the capture-to-render latency.
+"""
+import threading
+import time
+from collections import deque
+
+
+class LatestQueue:
+    """
+    Hand-off between two stages holding at most `size` items.
+    drop=True: putting into a full queue discards the oldest item (a stale
+    frame), so the consumer always gets the newest one.
+    drop=False: put() waits for room (every item is processed).
+    """
+
+    def __init__(self, size=1, drop=True):
+        self.size = size
+        self.drop = drop
+        self.dropped = 0
+        self._items = deque()
+        self._cond = threading.Condition()
+        self._closed = False
+
+    def put(self, item):
+        """Add an item; returns False if the queue was closed"""
+        with self._cond:
+            while not self.drop and len(self._items) >= self.size and not self._closed:
+                self._cond.wait()
+            if self._closed:
+                return False
+            if len(self._items) >= self.size:
+                self._items.popleft()
+                self.dropped += 1
+            self._items.append(item)
+            self._cond.notify_all()
+            return True
+
+    def get(self):
+        """Next item, or None once the queue is closed and empty"""
+        with self._cond:
+            while not self._items and not self._closed:
+                self._cond.wait()
+            if not self._items:
+                return None
+            item = self._items.popleft()
+            self._cond.notify_all()
+            return item
+
+    def close(self):
+        """Wake every waiting put()/get(); items already queued can still be taken"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+
+class StageStats:
+    """
+    Frames handled by one stage, its recent FPS and per-frame latency
+    (over the last `window` frames) and its average FPS since the start.
+    """
+
+    def __init__(self, window=120):
+        self.frames = 0
+        self.started = None
+        self._done = deque(maxlen=window)  # finish times
+        self._latency = deque(maxlen=window)  # seconds per frame
+        self._lock = threading.Lock()
+
+    def record(self, started, finished=None):
+        """Record one frame that took from `started` to `finished` (time.perf_counter())"""
+        finished = time.perf_counter() if finished is None else finished
+        with self._lock:
+            if self.started is None:
+                self.started = started
+            self.frames += 1
+            self._done.append(finished)
+            self._latency.append(finished - started)
+
+    def snapshot(self):
+        with self._lock:
+            done = list(self._done)
+            latency = sorted(self._latency)
+            frames, started = self.frames, self.started
+        if not latency:
+            return {"frames": 0, "fps": None, "avg_fps": None, "latency_ms": None, "p95_ms": None}
+        return {
+            "frames": frames,
+            "fps": (len(done) - 1) / (done[-1] - done[0]) if len(done) > 1 and done[-1] > done[0] else None,
+            "avg_fps": frames / (done[-1] - started) if done[-1] > started else None,
+            "latency_ms": 1000 * sum(latency) / len(latency),
+            "p95_ms": 1000 * latency[min(len(latency) - 1, int(0.95 * len(latency)))],
+        }
+
+
+class CameraPipeline:
+    """
+    pipeline = CameraPipeline(cv2.VideoCapture(0), infer, render)
+    pipeline.run()   # until render() returns False or the source ends
+
+    infer(frame) -> result     runs on the inference thread, one frame at a time
+    render(frame, result) -> bool (False stops the pipeline), runs on the caller's thread
+
+    frame is a dict: index, image (BGR array from capture.read()), t (timestamp
+    for analysis, seconds) and captured (time.perf_counter() when read)
+    """
+
+    def __init__(self, capture, infer, render, fps=None, realtime=True):
+        """
+        capture: cv2.VideoCapture (or anything with read() -> (ok, image))
+        fps: None for a live camera (wall clock timestamps, failed reads are
+             retried); the frame rate of a video file otherwise (timestamps
+             come from the frame index and the pipeline ends with the file)
+        realtime: for a video file, read frames at `fps` and drop stale ones like
+                  a camera; False processes every frame as fast as possible
+        """
+        self.capture = capture
+        self.infer = infer
+        self.render = render
+        self.fps = fps
+        self.realtime = realtime or fps is None
+        self.frames = LatestQueue(1, drop=self.realtime)
+        self.results = LatestQueue(1, drop=self.realtime)
+        self.stats = {name: StageStats() for name in ("capture", "inference", "render", "end_to_end")}
+        self._stop = threading.Event()
+        self._error = None
+
+    def run(self, max_frames=None, report_every=None):
+        """
+        Run until render() returns False, the video ends or max_frames frames were read.
+        report_every: print the stage stats every this many seconds
+        Returns snapshot()
+        """
+        threads = [
+            threading.Thread(target=self._guard, args=(self._capture_loop, max_frames), name="capture", daemon=True),
+            threading.Thread(target=self._guard, args=(self._inference_loop,), name="inference", daemon=True),
+        ]
+        for thread in threads:
+            thread.start()
+
+        last_report = time.perf_counter()
+        try:
+            while True:
+                item = self.results.get()
+                if item is None:
+                    break
+                frame, result = item
+                start = time.perf_counter()
+                keep_going = self.render(frame, result)
+                now = time.perf_counter()
+                self.stats["render"].record(start, now)
+                self.stats["end_to_end"].record(frame["captured"], now)
+                if keep_going is False:
+                    break
+                if report_every and now - last_report >= report_every:
+                    print(self.format_stats())
+                    last_report = now
+        finally:
+            self.stop()
+            for thread in threads:
+                thread.join()
+
+        if self._error is not None:
+            raise self._error
+        return self.snapshot()
+
+    def run_serial(self, max_frames=None, report_every=None):
+        """
+        Read, infer and render each frame in turn on the caller's thread (the
+        loop before this pipeline), recording the same stats, for comparison.
+        Stale frames are not dropped: a live camera buffers them instead.
+        """
+        index = 0
+        t0 = time.time()
+        last_report = time.perf_counter()
+        while max_frames is None or index < max_frames:
+            captured = time.perf_counter()
+            ok, image = self.capture.read()
+            if not ok:
+                if self.fps is None:
+                    time.sleep(0.005)  # camera not ready, try again
+                    continue
+                break
+            start = time.perf_counter()
+            self.stats["capture"].record(captured, start)
+            frame = {"index": index, "image": image, "t": time.time() if self.fps is None else t0 + index / self.fps, "captured": start}
+
+            result = self.infer(frame)
+            rendered = time.perf_counter()
+            self.stats["inference"].record(start, rendered)
+            keep_going = self.render(frame, result)
+            now = time.perf_counter()
+            self.stats["render"].record(rendered, now)
+            self.stats["end_to_end"].record(start, now)
+            if keep_going is False:
+                break
+            if report_every and now - last_report >= report_every:
+                print(self.format_stats())
+                last_report = now
+            index += 1
+        return self.snapshot()
+
+    def stop(self):
+        self._stop.set()
+        self.frames.close()
+        self.results.close()
+
+    def _guard(self, loop, *args):
+        try:
+            loop(*args)
+        except Exception as e:
+            self._error = e
+            self.stop()
+
+    def _capture_loop(self, max_frames):
+        index = 0
+        t0 = time.time()
+        start = time.perf_counter()
+        while not self._stop.is_set() and (max_frames is None or index < max_frames):
+            if self.fps and self.realtime:
+                #pace a video file like a camera: frame i is available at i / fps
+                delay = start + index / self.fps - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+
+            captured = time.perf_counter()
+            ok, image = self.capture.read()
+            if not ok:
+                if self.fps is None:
+                    time.sleep(0.005)  # camera not ready, try again
+                    continue
+                break
+            read = time.perf_counter()
+            self.stats["capture"].record(captured, read)
+
+            t = time.time() if self.fps is None else t0 + index / self.fps
+            if not self.frames.put({"index": index, "image": image, "t": t, "captured": read}):
+                break
+            index += 1
+        self.frames.close()
+
+    def _inference_loop(self):
+        while True:
+            frame = self.frames.get()
+            if frame is None:
+                break
+            start = time.perf_counter()
+            result = self.infer(frame)
+            self.stats["inference"].record(start)
+            if not self.results.put((frame, result)):
+                break
+        self.results.close()
+
+    def snapshot(self):
+        """Per-stage stats and the frames dropped between stages (JSON-safe dict)"""
+        return {
+            "stages": {name: stats.snapshot() for name, stats in self.stats.items()},
+            "dropped": {"before_inference": self.frames.dropped, "before_render": self.results.dropped},
+        }
+
+    def format_stats(self):
+        """One line per stage: recent FPS, mean and p95 latency"""
+        snapshot = self.snapshot()
+        lines = []
+        for name, s in snapshot["stages"].items():
+            if s["frames"]:
+                fps = f"{s['fps']:6.1f} fps" if s["fps"] else "     - fps"
+                lines.append(f"  {name:<11}{fps}  {s['latency_ms']:7.1f} ms avg  {s['p95_ms']:7.1f} ms p95  ({s['frames']} frames)")
+        dropped = snapshot["dropped"]
+        lines.append(f"  dropped: {dropped['before_inference']} before inference, {dropped['before_render']} before render")
+        return "\n".join(lines)
@@ -0,0 +1,248 @@
+"""
+Per-user token-bucket rate limiting, with limits set per role.
+
+Every resume/cover letter job ends in several LLM calls, so submissions are
+limited per user: each user has a bucket of `capacity` tokens refilling at
+`capacity / period` tokens per second, a submission takes one, and an empty
+bucket means a 429 with the seconds until the next token.
+
+Bucket state lives in a BucketStore. MemoryBucketStore keeps it in this
+process; with several API processes, MongoBucketStore keeps it in a shared
+collection (one atomic update per check), so the limit holds across all of
+them. Other shared stores (e.g. Redis running the same refill-and-take logic
+in a script) implement take(), refund() and snapshot().
+"""
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import datetime, timezone
+
+from pymongo import ReturnDocument
+
+
+"""
+Parse a RATE_LIMITS spec: comma separated role=requests/seconds entries,
+or role=unlimited, e.g. "free_user=10/3600,premium_user=100/3600,admin=unlimited"
+Returns {role: (requests, seconds) or None}; raises ValueError on a malformed entry
+"""
+def parse_limits(spec):
+    limits = {}
+    for entry in filter(None, (part.strip() for part in spec.split(","))):
+        role, _, limit = entry.partition("=")
+        if limit.strip() == "unlimited":
+            limits[role.strip()] = None
+            continue
+        try:
+            requests, seconds = (float(n) for n in limit.split("/"))
+        except ValueError:
+            raise ValueError(f"Invalid rate limit '{entry}' (expected role=requests/seconds)")
+        if requests < 1 or seconds <= 0:
+            raise ValueError(f"Invalid rate limit '{entry}' (need at least 1 request over a positive period)")
+        limits[role.strip()] = (requests, seconds)
+    return limits
+
+
+class BucketStore(ABC):
+    """
+    Where bucket state lives. Implement both methods to share buckets
+    between processes; take() must be atomic per key.
+    """
+
+    @abstractmethod
+    def take(self, key, capacity, rate, cost=1):
+        """
+        Refill the key's bucket (starts full) at `rate` tokens/second up to
+        `capacity`, then take `cost` tokens if there are enough.
+        Returns (allowed, tokens left, seconds until `cost` tokens are available)
+        """
+
+    @abstractmethod
+    def refund(self, key, capacity, cost=1):
+        """
+        Give back `cost` tokens taken by take() (up to `capacity`), for a
+        request that was not served after all
+        """
+
+    @abstractmethod
+    def snapshot(self):
+        """Buckets tracked, how many are below capacity and how many are empty (JSON-safe dict)"""
+
+
+class MemoryBucketStore(BucketStore):
+    """
+    Buckets in a dict, for a single API process.
+    The least recently used buckets are dropped past max_keys; a dropped
+    bucket comes back full, which only matters for users idle long enough
+    to have refilled anyway.
+    """
+
+    def __init__(self, max_keys=100000):
+        self.max_keys = max_keys
+        self._buckets = OrderedDict()  # key -> [tokens, last refill, capacity, rate]
+        self._lock = threading.Lock()
+
+    def take(self, key, capacity, rate, cost=1):
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = [capacity, now, capacity, rate]
+            else:
+                bucket[0] = min(capacity, bucket[0] + (now - bucket[1]) * rate)
+                bucket[1:] = now, capacity, rate
+            self._buckets.move_to_end(key)
+            if len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+
+            if bucket[0] >= cost:
+                bucket[0] -= cost
+                return True, bucket[0], 0.0
+            return False, bucket[0], (cost - bucket[0]) / rate
+
+    def refund(self, key, capacity, cost=1):
+        with self._lock:
+            #a dropped bucket comes back full anyway
+            bucket = self._buckets.get(key)
+            if bucket is not None:
+                bucket[0] = min(capacity, bucket[0] + cost)
+
+    def snapshot(self):
+        now = time.monotonic()
+        with self._lock:
+            draining = sum(
+                1 for tokens, updated, capacity, rate in self._buckets.values()
+                if tokens + (now - updated) * rate < capacity
+            )
+            empty = sum(
+                1 for tokens, updated, capacity, rate in self._buckets.values()
+                if tokens + (now - updated) * rate < 1
+            )
+            return {"buckets": len(self._buckets), "below_capacity": draining, "empty": empty}
+
+
+class MongoBucketStore(BucketStore):
+    """
+    Buckets in a MongoDB collection, shared by every API process.
+
+    store = MongoBucketStore(db["rate_limits"])
+    store.ensure_indexes()   # once at startup
+
+    take() is one find_one_and_update with a pipeline update, so the refill
+    and the take happen atomically on the server. Timestamps come from the
+    API hosts' clocks (time.time()), so they should be NTP synced. A bucket
+    document expires (TTL index) once it would have refilled, so idle users
+    cost nothing; a missing bucket starts full, as in MemoryBucketStore.
+    Calls block on the database: run them off the event loop.
+    """
+
+    def __init__(self, collection):
+        self.col = collection
+
+    def ensure_indexes(self):
+        """Create the TTL index that deletes full buckets"""
+        return self.col.create_index("expires", name="expires_ttl", expireAfterSeconds=0)
+
+    def take(self, key, capacity, rate, cost=1):
+        now = time.time()
+        #refill first; the second stage sees the refilled tokens
+        refilled = {"$min": [capacity, {"$add": [
+            {"$ifNull": ["$tokens", capacity]},
+            {"$multiply": [{"$max": [0, {"$subtract": [now, {"$ifNull": ["$updated", now]}]}]}, rate]},
+        ]}]}
+        bucket = self.col.find_one_and_update(
+            {"_id": key},
+            [
+                {"$set": {"tokens": refilled, "updated": now, "capacity": capacity, "rate": rate}},
+                {"$set": {
+                    "allowed": {"$gte": ["$tokens", cost]},
+                    "tokens": {"$cond": [{"$gte": ["$tokens", cost]}, {"$subtract": ["$tokens", cost]}, "$tokens"]},
+                    "expires": datetime.fromtimestamp(now + capacity / rate, timezone.utc),
+                }},
+            ],
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        tokens = bucket["tokens"]
+        if bucket["allowed"]:
+            return True, tokens, 0.0
+        return False, tokens, (cost - tokens) / rate
+
+    def refund(self, key, capacity, cost=1):
+        #no upsert: a missing (expired) bucket starts full anyway
+        self.col.update_one({"_id": key}, [{"$set": {"tokens": {"$min": [capacity, {"$add": ["$tokens", cost]}]}}}])
+
+    def snapshot(self):
+        now = time.time()
+        current = {"$add": ["$tokens", {"$multiply": [{"$subtract": [now, "$updated"]}, "$rate"]}]}
+        return {
+            "buckets": self.col.count_documents({}),
+            "below_capacity": self.col.count_documents({"$expr": {"$lt": [current, "$capacity"]}}),
+            "empty": self.col.count_documents({"$expr": {"$lt": [current, 1]}}),
+        }
+
+
+class RateLimiter:
+    """
+    limiter = RateLimiter(parse_limits("free_user=10/3600,admin=unlimited"))
+    allowed, remaining, retry_after = limiter.check(claims["sub"], claims.get("role"))
+    limiter.refund(claims["sub"], claims.get("role"))   # the request was not served after all
+    limiter.snapshot()   # limits, per-role allowed/rejected/refunded counts, bucket counts
+    """
+
+    def __init__(self, limits, store=None, default_role="free_user"):
+        """
+        limits: {role: (requests, seconds) or None for unlimited}
+        store: BucketStore (in-process MemoryBucketStore by default)
+        default_role: limit applied to tokens whose role has no entry
+        """
+        if default_role not in limits:
+            raise ValueError(f"No rate limit configured for the default role '{default_role}'")
+        self.limits = limits
+        self.store = store or MemoryBucketStore()
+        self.default_role = default_role
+        self._lock = threading.Lock()
+        self.stats = {}  # role -> {"allowed": n, "rejected": n, "refunded": n}
+
+    def check(self, user, role, cost=1):
+        """
+        Take `cost` tokens from the user's bucket.
+        Returns (allowed, tokens left or None if unlimited, seconds until allowed)
+        """
+        role = role if role in self.limits else self.default_role
+        limit = self.limits[role]
+        if limit is None:
+            allowed, remaining, retry_after = True, None, 0.0
+        else:
+            requests, seconds = limit
+            #key includes the role so a changed role starts on its own bucket
+            allowed, remaining, retry_after = self.store.take(f"{role}:{user}", requests, requests / seconds, cost)
+
+        with self._lock:
+            counts = self.stats.setdefault(role, {"allowed": 0, "rejected": 0, "refunded": 0})
+            counts["allowed" if allowed else "rejected"] += 1
+        return allowed, remaining, retry_after
+
+    def refund(self, user, role, cost=1):
+        """Give back `cost` tokens taken by check() for a request that was not served"""
+        role = role if role in self.limits else self.default_role
+        limit = self.limits[role]
+        if limit is not None:
+            self.store.refund(f"{role}:{user}", limit[0], cost)
+        with self._lock:
+            counts = self.stats.setdefault(role, {"allowed": 0, "rejected": 0, "refunded": 0})
+            counts["refunded"] += 1
+
+    def snapshot(self):
+        """JSON-safe view of the configured limits, counters and bucket store"""
+        with self._lock:
+            stats = {role: dict(counts) for role, counts in self.stats.items()}
+        return {
+            "limits": {
+                role: None if limit is None else {"requests": limit[0], "seconds": limit[1]}
+                for role, limit in self.limits.items()
+            },
+            "default_role": self.default_role,
+            "stats": stats,
+            "store": self.store.snapshot(),
+        }
@@ -0,0 +1,366 @@
+"""
+Precomputed job recommendations.
+
+Ranking the catalog for a user on demand means a semantic comparison with
+every posting. Instead, a background thread keeps each user's top-K jobs
+in a table that the API reads with a dict lookup, and updates it
+incrementally as things change:
+- a user's resume changes: that user is scored against every job
+- jobs are added: the new jobs are scored against every user and merged
+  into each top-K
+- jobs are removed: only users who had them in their top-K are rescored
+
+Scoring works on cached embeddings. Every posting is embedded once (the
+vector is stored with it) and every resume once per version, so an update
+is a matrix product over vectors already in memory. Changes that queue up
+while a batch runs are applied together as the next batch.
+
+score = semantic_weight * cosine(resume, posting)
+        + (1 - semantic_weight) * share of the posting's skills the resume covers
+(resume skills are expanded through the skill taxonomy, so "react" covers
+a posting asking for "javascript" or "frontend development")
+"""
+import hashlib
+import queue
+import threading
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+
+_STOP = object()
+
+
+class Recommender:
+    """
+    recommender = Recommender(encode, SkillTaxonomyManager(), store=RecommendationStore(...))
+    recommender.start(postings, embeddings)      # background thread; loads stored users first
+    recommender.update_user(user_id, resume_text)
+    recommender.job_added(posting) / recommender.job_removed(job_id)
+    recommender.recommendations(user_id)         # {"jobs": [{"id", "score"}, ...], "updated": ...} or None
+    """
+
+    def __init__(self, encode, taxonomy, store=None, top_k=20, semantic_weight=0.7):
+        """
+        encode: texts -> array of L2-normalized embeddings, shape (len(texts), dim)
+        taxonomy: SkillTaxonomyManager (skill columns and skill expansion)
+        store: optional RecommendationStore persisting user rows and job embeddings
+        top_k: recommendations kept per user
+        semantic_weight: weight of embedding similarity vs skill coverage
+        """
+        self.encode = encode
+        self.taxonomy = taxonomy
+        self.store = store
+        self.top_k = top_k
+        self.semantic_weight = semantic_weight
+        self.ready = False
+
+        self._columns = {skill: i for i, skill in enumerate(taxonomy.taxonomy)}
+        self._changes = queue.Queue()
+        self._thread = None
+        self._table = {}  # user ID -> {"jobs": [{"id", "score"}], "updated": iso date}
+
+        # worker thread state: one row per job (removed jobs keep a dead row)
+        self._job_ids = []
+        self._rows = {}  # job ID -> row
+        self._vectors = None  # (capacity, dim) float32
+        self._skills = np.zeros((0, len(self._columns)), dtype=np.float32)
+        self._skill_counts = np.zeros(0, dtype=np.float32)
+        self._alive = np.zeros(0, dtype=bool)
+        self._users = {}  # user ID -> {"vector", "skills", "resume_hash", "top": [(score, job ID)]}
+
+        self.stats = {
+            "batches": 0, "users_scored": 0, "jobs_embedded": 0, "resumes_embedded": 0,
+            "resumes_unchanged": 0, "pairs_scored": 0, "last_batch_seconds": 0.0,
+        }
+
+    # ------------------------------------------------------------
+    # API side (called from request handlers: never blocks on scoring)
+    # ------------------------------------------------------------
+
+    def start(self, postings, embeddings=None):
+        """
+        Start the worker: it loads the catalog postings (with stored embeddings,
+        {job ID: bytes}; the rest are embedded now) and stored users, then applies changes
+        """
+        self._changes.put(("load", list(postings), embeddings or {}))
+        self._thread = threading.Thread(target=self._worker, name="recommender", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        self._changes.put(_STOP)
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def update_user(self, user_id, resume_text):
+        """Queue a rescoring of this user against every job (a no-op if the resume is unchanged)"""
+        self._changes.put(("user", user_id, resume_text))
+
+    def job_added(self, posting):
+        """Queue a new catalog posting (needs id, title, description and skills)"""
+        self._changes.put(("added", posting))
+
+    def job_removed(self, job_id):
+        self._changes.put(("removed", job_id))
+
+    def recommendations(self, user_id):
+        """The user's precomputed top-K, or None if they have none yet"""
+        return self._table.get(user_id)
+
+    def pending(self):
+        """Changes waiting for the worker"""
+        return self._changes.qsize()
+
+    def flush(self):
+        """Block until every change queued so far has been applied"""
+        self._changes.join()
+
+    def snapshot(self):
+        """JSON-safe status and counters"""
+        return {
+            "ready": self.ready,
+            "pending": self.pending(),
+            "users": len(self._table),
+            "jobs": int(self._alive.sum()),
+            **self.stats,
+        }
+
+    # ------------------------------------------------------------
+    # Worker thread
+    # ------------------------------------------------------------
+
+    def _worker(self):
+        while True:
+            batch = [self._changes.get()]
+            try:
+                while True:
+                    batch.append(self._changes.get_nowait())
+            except queue.Empty:
+                pass
+
+            stop = _STOP in batch
+            changes = [change for change in batch if change is not _STOP]
+            if changes:
+                start = time.perf_counter()
+                try:
+                    self._apply(changes)
+                except Exception as e:
+                    print(f"⚠ Recommendation update failed: {e}")
+                self.stats["batches"] += 1
+                self.stats["last_batch_seconds"] = round(time.perf_counter() - start, 4)
+            for _ in batch:
+                self._changes.task_done()
+            if stop:
+                return
+
+    def _apply(self, batch):
+        added, removed, resumes = {}, set(), {}
+        for change in batch:
+            kind = change[0]
+            if kind == "load":
+                self._load(change[1], change[2])
+            elif kind == "added":
+                added[change[1]["id"]] = change[1]
+                removed.discard(change[1]["id"])
+            elif kind == "removed":
+                added.pop(change[1], None)
+                removed.add(change[1])
+            elif kind == "user":
+                resumes[change[1]] = change[2]
+
+        rescore = self._set_resumes(resumes)
+
+        #a re-added (edited) posting replaces its old row, so its old score goes too
+        gone = {job_id for job_id in removed | added.keys() if job_id in self._rows}
+        for job_id in gone:
+            self._alive[self._rows.pop(job_id)] = False
+        if gone:
+            rescore.update(
+                user_id for user_id, user in self._users.items()
+                if any(job_id in gone for _, job_id in user["top"])
+            )
+
+        changed = set(rescore)
+        new_rows = self._add_jobs(list(added.values()))
+        if len(new_rows):
+            #users rescored in full below already see the new rows
+            changed |= self._merge_new_jobs([u for u in self._users if u not in rescore], new_rows)
+
+        self._rescore(list(rescore))
+        self._publish(changed)
+
+    def _load(self, postings, embeddings):
+        """Initial state: catalog jobs and stored users, brought up to date with the catalog"""
+        self._add_jobs(postings, embeddings)
+        stored = self.store.load_users() if self.store else []
+        for doc in stored:
+            self._users[doc["user_id"]] = {
+                "vector": np.frombuffer(doc["embedding"], dtype=np.float32),
+                "skills": self._skill_vector(doc["skills"], expand=True),
+                "resume_skills": doc["skills"],
+                "resume_hash": doc["resume_hash"],
+                "scored_through": doc.get("scored_through"),
+                "top": [(entry["score"], entry["id"]) for entry in doc["jobs"]],
+            }
+            self._table[doc["user_id"]] = {"jobs": doc["jobs"], "updated": doc.get("updated")}
+
+        #jobs posted or removed while the API was down: users who lost a job are rescored,
+        #the others only score jobs newer than the last ones they saw (job IDs sort by time)
+        stale = [u for u, user in self._users.items() if any(job_id not in self._rows for _, job_id in user["top"])]
+        self._rescore(stale)
+        changed = set(stale)
+        by_watermark = {}
+        for user_id in self._users.keys() - changed:
+            by_watermark.setdefault(self._users[user_id]["scored_through"], []).append(user_id)
+        for watermark, user_ids in by_watermark.items():
+            rows = np.array([
+                row for job_id, row in self._rows.items() if watermark is None or job_id > watermark
+            ], dtype=np.int64)
+            if len(rows):
+                changed |= self._merge_new_jobs(user_ids, rows)
+        self._publish(changed)
+        self.ready = True
+        print(f"✓ Recommendations ready ({len(self._users)} users, {len(self._rows)} jobs)")
+
+    def _add_jobs(self, postings, embeddings=None):
+        """Append rows for postings, embedding those without a stored vector; returns the new row numbers"""
+        if not postings:
+            return np.zeros(0, dtype=np.int64)
+        stored = [(embeddings or {}).get(p["id"]) for p in postings]
+        missing = [i for i, embedding in enumerate(stored) if embedding is None]
+        if missing:
+            vectors = self._encode([
+                f"{postings[i].get('title', '')}\n{postings[i].get('description', '')}" for i in missing
+            ])
+            for i, vector in zip(missing, vectors):
+                stored[i] = vector.tobytes()
+                if self.store:
+                    self.store.save_job_embedding(postings[i]["id"], stored[i])
+            self.stats["jobs_embedded"] += len(missing)
+
+        first = len(self._job_ids)
+        vectors = np.stack([np.frombuffer(embedding, dtype=np.float32) for embedding in stored])
+        self._ensure_capacity(first + len(postings), vectors.shape[1])
+        self._vectors[first:first + len(postings)] = vectors
+        self._skills = np.vstack([self._skills, np.stack([self._skill_vector(p["skills"]) for p in postings])])
+        self._skill_counts = np.concatenate([self._skill_counts, self._skills[first:].sum(axis=1)])
+        self._alive = np.concatenate([self._alive, np.ones(len(postings), dtype=bool)])
+        for i, posting in enumerate(postings):
+            self._job_ids.append(posting["id"])
+            self._rows[posting["id"]] = first + i
+        return np.arange(first, first + len(postings))
+
+    def _ensure_capacity(self, rows, dim):
+        if self._vectors is None:
+            self._vectors = np.zeros((max(rows, 1024), dim), dtype=np.float32)
+        elif rows > len(self._vectors):
+            grown = np.zeros((max(rows, 2 * len(self._vectors)), dim), dtype=np.float32)
+            grown[:len(self._vectors)] = self._vectors
+            self._vectors = grown
+
+    def _set_resumes(self, resumes):
+        """Embed new/changed resumes (unchanged ones are skipped); returns the users to rescore"""
+        changed = {}
+        for user_id, text in resumes.items():
+            resume_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+            user = self._users.get(user_id)
+            if user is not None and user["resume_hash"] == resume_hash:
+                self.stats["resumes_unchanged"] += 1
+                continue
+            changed[user_id] = (text, resume_hash)
+        if not changed:
+            return set()
+
+        vectors = self._encode([text for text, _ in changed.values()])
+        for (user_id, (text, resume_hash)), vector in zip(changed.items(), vectors):
+            skills = self.taxonomy.extract_known_skills(text)
+            self._users[user_id] = {
+                "vector": vector, "skills": self._skill_vector(skills, expand=True), "resume_skills": skills,
+                "resume_hash": resume_hash, "scored_through": None, "top": [],
+            }
+        self.stats["resumes_embedded"] += len(changed)
+        return set(changed)
+
+    def _skill_vector(self, skills, expand=False):
+        vector = np.zeros(len(self._columns), dtype=np.float32)
+        for skill in skills:
+            for name in (self.taxonomy.expand_skill(skill) if expand else (skill,)):
+                column = self._columns.get(name)
+                if column is not None:
+                    vector[column] = 1.0
+        return vector
+
+    def _user_matrices(self, user_ids):
+        users = [self._users[u] for u in user_ids]
+        return np.stack([user["vector"] for user in users]), np.stack([user["skills"] for user in users])
+
+    def _scores(self, user_ids, rows, chunk=256):
+        """Score matrix (users x rows), computed in chunks of users to bound memory"""
+        n = len(self._job_ids)
+        rows = slice(0, n) if rows is None else rows
+        job_vectors = self._vectors[:n][rows]
+        job_skills = self._skills[rows]
+        counts = np.maximum(self._skill_counts[rows], 1.0)
+        alive = self._alive[rows]
+        for start in range(0, len(user_ids), chunk):
+            vectors, skills = self._user_matrices(user_ids[start:start + chunk])
+            scores = self.semantic_weight * (vectors @ job_vectors.T)
+            scores += (1.0 - self.semantic_weight) * (skills @ job_skills.T) / counts
+            scores[:, ~alive] = -np.inf
+            self.stats["pairs_scored"] += scores.size
+            yield start, scores
+
+    def _rescore(self, user_ids):
+        """Full top-K for these users against every live job"""
+        if not user_ids or not self._job_ids:
+            return
+        k = min(self.top_k, len(self._job_ids))
+        for start, scores in self._scores(user_ids, None):
+            best = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+            for i, user_id in enumerate(user_ids[start:start + len(scores)]):
+                self._users[user_id]["top"] = self._top(
+                    (float(scores[i, row]), self._job_ids[row]) for row in best[i]
+                )
+        self.stats["users_scored"] += len(user_ids)
+
+    def _merge_new_jobs(self, user_ids, rows):
+        """Merge the scores of new job rows into each user's top-K; returns the users whose top-K changed"""
+        changed = set()
+        if not user_ids:
+            return changed
+        k = min(self.top_k, len(rows))
+        for start, scores in self._scores(user_ids, rows):
+            best = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+            for i, user_id in enumerate(user_ids[start:start + len(scores)]):
+                user = self._users[user_id]
+                top = self._top(user["top"] + [(float(scores[i, j]), self._job_ids[rows[j]]) for j in best[i]])
+                if top != user["top"]:
+                    user["top"] = top
+                    changed.add(user_id)
+        return changed
+
+    def _top(self, candidates):
+        best = {}
+        for score, job_id in candidates:
+            if score > -np.inf and job_id in self._rows:
+                best[job_id] = max(score, best.get(job_id, score))
+        return sorted(((score, job_id) for job_id, score in best.items()), reverse=True)[:self.top_k]
+
+    def _encode(self, texts):
+        return np.asarray(self.encode(texts), dtype=np.float32)
+
+    def _publish(self, user_ids):
+        """Make updated rows visible to the API and persist them"""
+        updated = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        watermark = max(self._rows) if self._rows else None
+        for user_id in user_ids:
+            user = self._users[user_id]
+            user["scored_through"] = watermark
+            jobs = [{"id": job_id, "score": round(score, 4)} for score, job_id in user["top"]]
+            self._table[user_id] = {"jobs": jobs, "updated": updated}  # one dict assignment: readers never see a partial row
+            if self.store:
+                self.store.save_user(user_id, {
+                    "jobs": jobs, "updated": updated, "scored_through": watermark,
+                    "resume_hash": user["resume_hash"], "skills": user["resume_skills"],
+                    "embedding": np.asarray(user["vector"], dtype=np.float32).tobytes(),
+                })
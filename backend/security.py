@@ -0,0 +1,87 @@
+"""
+Password hashing and profile field encryption.
+
+bcrypt is deliberately slow (hundreds of ms at the default cost), so it
+runs on a bounded thread pool instead of the event loop; bcrypt releases
+the GIL, so the pool hashes in parallel on multiple cores. Only passwords
+need a one-way hash. Other profile fields are encrypted with Fernet
+(AES-128-CBC + HMAC-SHA256), which takes microseconds and can be
+decrypted to show the profile back to its owner.
+"""
+import asyncio
+import functools
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import bcrypt
+from cryptography.fernet import Fernet, InvalidToken
+
+"""
+bcrypt cost factor and number of hashing threads (environment variables)
+FIELD_ENCRYPTION_KEY is a Fernet key: generate one with
+python -c "from cryptography.fernet import Fernet; print(Fernet.generate_key().decode())"
+"""
+bcrypt_rounds = int(os.environ.get("BCRYPT_ROUNDS", "12"))
+bcrypt_workers = int(os.environ.get("BCRYPT_WORKERS", str(os.cpu_count() or 1)))
+field_key = os.environ.get("FIELD_ENCRYPTION_KEY")
+
+_hash_pool = ThreadPoolExecutor(max_workers=bcrypt_workers, thread_name_prefix="bcrypt")
+_cipher = Fernet(field_key) if field_key else None
+
+
+"""
+Helper function to hash passwords for security purposes
+"""
+def hash_(pwd):
+    salt = bcrypt.gensalt(rounds=bcrypt_rounds)
+    hashed = bcrypt.hashpw(pwd.encode('utf-8'), salt)
+    return hashed.decode('utf-8')
+
+"""
+Helper function to verify a stored password against one provided by the user
+"""
+def verify_hash(stored_pwd, provided_pwd):
+
+    stored_pwd = stored_pwd.encode("utf-8")
+
+    return bcrypt.checkpw(provided_pwd.encode("utf-8"), stored_pwd)
+
+
+"""
+hash_ / verify_hash on the hashing pool, so the event loop keeps serving requests
+"""
+async def hash_password(pwd):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_hash_pool, hash_, pwd)
+
+async def verify_password(stored_pwd, provided_pwd):
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_hash_pool, functools.partial(verify_hash, stored_pwd, provided_pwd))
+
+
+"""
+True if FIELD_ENCRYPTION_KEY is set, i.e. profile fields can be encrypted
+"""
+def field_encryption_enabled():
+    return _cipher is not None
+
+"""
+Encrypt a non-secret profile field (name, phone, location, ...)
+Raises ValueError if FIELD_ENCRYPTION_KEY is not configured
+"""
+def encrypt_field(value):
+    if _cipher is None:
+        raise ValueError("FIELD_ENCRYPTION_KEY is not set")
+    return _cipher.encrypt(value.encode("utf-8")).decode("ascii")
+
+"""
+Decrypt a field stored by encrypt_field
+Raises ValueError if the key is missing or the value was not encrypted with it
+"""
+def decrypt_field(token):
+    if _cipher is None:
+        raise ValueError("FIELD_ENCRYPTION_KEY is not set")
+    try:
+        return _cipher.decrypt(token.encode("ascii")).decode("utf-8")
+    except InvalidToken:
+        raise ValueError("Field was not encrypted with the configured key")
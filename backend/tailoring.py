@@ -0,0 +1,197 @@
+"""
+Resume and cover letter jobs run by the backend worker pool (see jobs.py).
+
+The AI modules live in ../Saqib-AI (override with CAREER_AI_PATH) and are
+only imported when a worker starts, so the API itself starts without them
+(apart from the skill taxonomy, which has no model dependencies).
+"""
+import io
+import os
+import shutil
+import sys
+import tempfile
+
+ai_path = os.environ.get("CAREER_AI_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "Saqib-AI"))
+semantic_matching = os.environ.get("SEMANTIC_MATCHING", "1") != "0"
+artifact_dir = os.environ.get("ARTIFACT_DIR", os.path.join(tempfile.gettempdir(), "career-ai-artifacts"))
+fit_max_pages = int(os.environ.get("FIT_MAX_PAGES", "3"))
+
+
+def _add_ai_path():
+    if ai_path not in sys.path:
+        sys.path.insert(0, ai_path)
+
+
+def _import_ai():
+    _add_ai_path()
+    import service
+    return service
+
+
+"""
+Create the service a worker keeps warm for all of its jobs
+(LLM client, embedding model and compiled PDF templates load once per worker)
+Rendered PDFs are kept in ARTIFACT_DIR, shared by all workers, so an
+unchanged resume is not rendered again
+"""
+def create_service():
+    ai = _import_ai()
+    from artifact_store import ArtifactStore
+    return ai.ResumeTailoringService(enable_semantic_matching=semantic_matching, artifact_store=ArtifactStore(artifact_dir))
+
+
+"""
+Skill taxonomy used to tag job postings (a light import: no models are loaded)
+"""
+def create_taxonomy():
+    _add_ai_path()
+    from skill_taxonomy import SkillTaxonomyManager
+    return SkillTaxonomyManager()
+
+
+"""
+Embedding function for job recommendations (the semantic matcher's sentence
+transformer, loaded on first use: i.e. on the recommender's thread, not at startup)
+"""
+def create_encoder():
+    model = None
+
+    def encode(texts):
+        nonlocal model
+        if model is None:
+            _add_ai_path()
+            from config import SEMANTIC_MODEL
+            from sentence_transformers import SentenceTransformer
+            model = SentenceTransformer(SEMANTIC_MODEL)
+        return model.encode(texts, batch_size=64, normalize_embeddings=True, show_progress_bar=False)
+    return encode
+
+
+"""
+Text of an uploaded resume PDF (raises ValueError if it can't be read)
+"""
+def extract_resume_text(data: bytes) -> str:
+    from pypdf import PdfReader
+    try:
+        reader = PdfReader(io.BytesIO(data))
+        return "\n".join(page.extract_text() or "" for page in reader.pages)
+    except Exception as e:
+        raise ValueError(f"Could not read the resume PDF: {e}")
+
+
+"""
+Check a resume job's template and page target before it is queued, so a bad
+value is a 400 at submit instead of a failure after minutes of LLM calls
+Raises ValueError with a message for the client
+"""
+def validate_resume_options(template, fit_to_pages):
+    if template:
+        _add_ai_path()
+        from pdf_generators import get_template
+        get_template(template)
+    if fit_to_pages is not None and not 1 <= fit_to_pages <= fit_max_pages:
+        raise ValueError(f"fit_to_pages must be between 1 and {fit_max_pages}")
+
+
+"""
+Counters of the LLM concurrency limit every worker's service shares
+(None until a worker has loaded the AI modules)
+"""
+def llm_stats():
+    structured_output = sys.modules.get("structured_output")
+    return structured_output.LLM_SLOTS.snapshot() if structured_output else None
+
+
+"""
+Save an uploaded resume PDF into a fresh per-job working directory
+Returns the path of the saved PDF
+"""
+def save_upload(data: bytes) -> str:
+    workdir = tempfile.mkdtemp(prefix="career-ai-job-")
+    path = os.path.join(workdir, "resume.pdf")
+    with open(path, "wb") as f:
+        f.write(data)
+    return path
+
+
+"""
+Delete the working directory of an upload (the resume and any generated PDFs)
+"""
+def remove_upload(resume_path: str):
+    shutil.rmtree(os.path.dirname(resume_path), ignore_errors=True)
+
+
+"""
+Job handler: full tailoring workflow (parse, analyze, tailor, refine, render)
+Every workflow event (with partial results such as the semantic score or
+questions) goes to the job's event log; progress advances per stage
+"""
+def run_resume_job(service, params, report):
+    ai = _import_ai()
+    stages = ai.WORKFLOW_STAGES
+    workdir = os.path.dirname(params["resume_path"])
+    output_path = os.path.join(workdir, "tailored_resume.pdf")
+    cover_letter_path = os.path.join(workdir, "cover_letter.pdf")
+
+    def on_event(event):
+        done = stages.index(event.stage) + (event.type == "stage_finished")
+        report(event.stage, done / len(stages), event.model_dump(mode="json"))
+
+    options = {"template": params["template"]} if params.get("template") else {}
+    results = service.complete_tailoring_workflow(
+        resume_pdf_path=params["resume_path"],
+        job_description=params["job_description"],
+        output_resume_path=output_path,
+        user_answers=params.get("user_answers"),
+        generate_cover_letter=params.get("generate_cover_letter", False),
+        company_name=params.get("company_name"),
+        position=params.get("position"),
+        cover_letter_path=cover_letter_path,
+        enable_refinement=params.get("enable_refinement", True),
+        fit_to_pages=params.get("fit_to_pages"),
+        on_event=on_event,
+        **options,
+    )
+
+    summary = ai.workflow_summary(results)
+    #file names only: clients download them from /files/{name}, server paths stay private
+    summary["files"] = {
+        "resume": os.path.basename(output_path) if results["resume_pdf_generated"] else None,
+        "cover_letter": os.path.basename(cover_letter_path) if results.get("cover_letter_pdf_generated") else None,
+    }
+    return summary
+
+
+"""
+Job handler: cover letter only (parse, research + write, render)
+Paragraphs are streamed: each one is logged as a "paragraph" event as soon
+as the model finishes writing it
+"""
+def run_cover_letter_job(service, params, report):
+    workdir = os.path.dirname(params["resume_path"])
+    output_path = os.path.join(workdir, "cover_letter.pdf")
+
+    report("parse", 0.0)
+    resume = service.parse_resume(params["resume_path"])
+
+    report("cover_letter", 0.2)
+    cover_letter = None
+    paragraphs = service.stream_cover_letter(
+        resume,
+        params["job_description"],
+        params["company_name"],
+        params["position"],
+    )
+    for index, item in enumerate(paragraphs):
+        if isinstance(item, str):
+            event = {"type": "paragraph", "stage": "cover_letter", "data": {"index": index, "text": item}}
+            report("cover_letter", min(0.3 + 0.15 * index, 0.8), event)
+        else:
+            cover_letter = item
+
+    report("render", 0.9)
+    generated = service.generate_cover_letter_pdf(cover_letter, resume, output_path)
+    return {
+        "cover_letter": cover_letter.model_dump(),
+        "files": {"cover_letter": os.path.basename(output_path) if generated else None},
+    }